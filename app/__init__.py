@@ -1,28 +1,58 @@
+import time
+
+# Taken before the heavy imports below so startup time includes them
+_import_started = time.perf_counter()
+_imported_at = time.time()
+
 import os
 from flask import Flask, jsonify
 from flask_cors import CORS
 from flask_migrate import Migrate
 from app.config import config
+from app.metrics import init_metrics, record_startup
 from app.models import db
-from app.security import jwt, limiter, rate_limit_exceeded_handler
+from app.models.routing import init_replica_routing, pool_status
+from app.security import (
+    jwt,
+    limiter,
+    rate_limit_exceeded_handler,
+    get_password_hasher,
+    init_identity_cache,
+    init_password_hasher,
+)
 from app.routes import auth_bp, bills_bp
+from app.serialization import OrjsonProvider, orjson_available
+from app.services import get_claude_breaker, init_parse_jobs
 
 migrate = Migrate()
 
+_import_seconds = time.perf_counter() - _import_started
+
 
 def create_app(config_name=None):
     """Application factory pattern."""
+    started = time.perf_counter()
     if config_name is None:
         config_name = os.environ.get("FLASK_ENV", "development")
 
     app = Flask(__name__)
     app.config.from_object(config[config_name])
+    if app.config["JSON_PROVIDER"] == "orjson" or (
+        app.config["JSON_PROVIDER"] == "auto" and orjson_available()
+    ):
+        app.json = OrjsonProvider(app)
+
+    # Request timing runs first so it covers the other hooks
+    init_metrics(app)
 
     # Initialize extensions
     db.init_app(app)
     jwt.init_app(app)
+    init_identity_cache(app)
+    init_password_hasher(app)
     limiter.init_app(app)
     migrate.init_app(app, db)
+    init_replica_routing(app)
     CORS(app)
 
     # Register error handlers
@@ -32,10 +62,20 @@ def create_app(config_name=None):
     app.register_blueprint(auth_bp)
     app.register_blueprint(bills_bp)
 
+    # Background parse job runner
+    init_parse_jobs(app)
+
     # Health check endpoint
     @app.route("/health")
     def health():
-        return jsonify({"status": "healthy", "service": "ai-bill-reminder"}), 200
+        return jsonify({
+            "status": "healthy",
+            "service": "ai-bill-reminder",
+            "password_hashing": get_password_hasher().stats(),
+            "startup": app.extensions["startup"],
+            "database_pools": pool_status(db.engines),
+            "claude_circuit_breaker": get_claude_breaker(app.config).stats(),
+        }), 200
 
     # Security headers middleware
     @app.after_request
@@ -47,8 +87,12 @@ def create_app(config_name=None):
         response.headers["Content-Security-Policy"] = "default-src 'self'"
         return response
 
-    # Create tables
-    with app.app_context():
-        db.create_all()
+    # Production schemas come from migrations ("flask db upgrade"); creating
+    # tables at boot is a development convenience only
+    if app.config.get("AUTO_CREATE_TABLES"):
+        with app.app_context():
+            db.create_all()
+
+    record_startup(app, _import_seconds, time.perf_counter() - started, _imported_at)
 
     return app
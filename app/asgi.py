@@ -0,0 +1,5 @@
+from app import create_app
+from app.routes import ParseASGIApp
+
+# Serves only the parse routes: uvicorn app.asgi:app --port 5002
+app = ParseASGIApp(create_app())
@@ -2,6 +2,23 @@ import os
 from datetime import timedelta
 
 
+def pool_options(prefix):
+    """Engine pool options read from <prefix>_POOL_SIZE and friends."""
+    options = {
+        "pool_pre_ping": os.environ.get(f"{prefix}_POOL_PRE_PING", "true").lower() == "true",
+    }
+    for option, name in (
+        ("pool_size", "POOL_SIZE"),
+        ("max_overflow", "MAX_OVERFLOW"),
+        ("pool_recycle", "POOL_RECYCLE"),
+        ("pool_timeout", "POOL_TIMEOUT"),
+    ):
+        value = os.environ.get(f"{prefix}_{name}")
+        if value:
+            options[option] = int(value)
+    return options
+
+
 class Config:
     """Base configuration with security defaults."""
 
@@ -15,8 +32,18 @@ class Config:
     if not SQLALCHEMY_DATABASE_URI:
         raise ValueError("DATABASE_URL environment variable is required")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = pool_options("DB")
+
+    # Optional read replica; GET requests read from it unless the user
+    # wrote within the last REPLICA_STICKY_SECONDS
+    DATABASE_REPLICA_URL = os.environ.get("DATABASE_REPLICA_URL")
+    SQLALCHEMY_BINDS = {
+        "replica": {"url": DATABASE_REPLICA_URL, **pool_options("REPLICA")},
+    } if DATABASE_REPLICA_URL else {}
+    REPLICA_STICKY_SECONDS = float(os.environ.get("REPLICA_STICKY_SECONDS", 5))
+    # Run db.create_all() in create_app; migrations own the schema otherwise
+    AUTO_CREATE_TABLES = os.environ.get("AUTO_CREATE_TABLES", "false").lower() == "true"
 
-    # JWT Authentication
     # JWT Authentication
     JWT_SECRET_KEY = os.environ.get("JWT_SECRET_KEY", SECRET_KEY)
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
@@ -25,12 +52,97 @@ class Config:
     JWT_HEADER_NAME = "Authorization"
     JWT_HEADER_TYPE = "Bearer"
 
+    # Password hashing (bcrypt cost and worker processes; 0 hashes inline)
+    BCRYPT_LOG_ROUNDS = int(os.environ.get("BCRYPT_LOG_ROUNDS", 12))
+    BCRYPT_POOL_SIZE = int(os.environ.get("BCRYPT_POOL_SIZE", 2))
+
+    # Cached user lookups for authenticated requests
+    IDENTITY_CACHE_TTL = int(os.environ.get("IDENTITY_CACHE_TTL", 300))
+    IDENTITY_CACHE_MAX_ENTRIES = int(os.environ.get("IDENTITY_CACHE_MAX_ENTRIES", 10000))
+    IDENTITY_SYNC_INTERVAL = float(os.environ.get("IDENTITY_SYNC_INTERVAL", 5))
+
     # Rate Limiting
+    # "sqlite:///<path>" shares counters between workers on one host,
+    # "redis://host:port" across hosts; prefix with "batched+" to count
+    # locally and sync every RATELIMIT_SYNC_BATCH hits
     RATELIMIT_DEFAULT = "100 per hour"
-    RATELIMIT_STORAGE_URL = "memory://"
+    RATELIMIT_STORAGE_URI = os.environ.get("RATELIMIT_STORAGE_URI", "memory://")
+    RATELIMIT_STORAGE_OPTIONS = {}
+
+    # Request, SQL and Claude metrics served at /metrics
+    METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "true").lower() == "true"
+
+    # JSON encoding ("auto" uses orjson when installed, "default" never does)
+    JSON_PROVIDER = os.environ.get("JSON_PROVIDER", "auto")
+
+    # Bulk import
+    IMPORT_BATCH_SIZE = int(os.environ.get("IMPORT_BATCH_SIZE", 500))
+    IMPORT_MAX_ERRORS = int(os.environ.get("IMPORT_MAX_ERRORS", 100))
+
+    # Bulk export rows fetched and flushed per chunk
+    EXPORT_CHUNK_SIZE = int(os.environ.get("EXPORT_CHUNK_SIZE", 1000))
+
+    # Calendar feed URLs stop working after this many seconds
+    CALENDAR_FEED_MAX_AGE = int(os.environ.get("CALENDAR_FEED_MAX_AGE", 90 * 24 * 3600))
 
-    # Claude AI
+    # Claude AI (parse prompts are not prompt-cached; the static
+    # instructions are under the model's 1024-token caching minimum)
     ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
+    ANTHROPIC_MAX_CONNECTIONS = int(os.environ.get("ANTHROPIC_MAX_CONNECTIONS", 20))
+    ANTHROPIC_MAX_KEEPALIVE = int(os.environ.get("ANTHROPIC_MAX_KEEPALIVE", 10))
+    ANTHROPIC_KEEPALIVE_EXPIRY = float(os.environ.get("ANTHROPIC_KEEPALIVE_EXPIRY", 30))
+
+    # Latency budget per parse, covering retries of transient errors
+    ANTHROPIC_TIMEOUT = float(os.environ.get("ANTHROPIC_TIMEOUT", 15))
+    ANTHROPIC_MAX_RETRIES = int(os.environ.get("ANTHROPIC_MAX_RETRIES", 2))
+    ANTHROPIC_RETRY_BASE_DELAY = float(os.environ.get("ANTHROPIC_RETRY_BASE_DELAY", 0.25))
+    ANTHROPIC_RETRY_MAX_DELAY = float(os.environ.get("ANTHROPIC_RETRY_MAX_DELAY", 2))
+
+    # Claude circuit breaker: open at this failure share over the window,
+    # then refuse calls (falling back to the rule-based parser) for the cooldown
+    CLAUDE_BREAKER_FAILURE_RATE = float(os.environ.get("CLAUDE_BREAKER_FAILURE_RATE", 0.5))
+    CLAUDE_BREAKER_MIN_CALLS = int(os.environ.get("CLAUDE_BREAKER_MIN_CALLS", 10))
+    CLAUDE_BREAKER_WINDOW = float(os.environ.get("CLAUDE_BREAKER_WINDOW", 60))
+    CLAUDE_BREAKER_COOLDOWN = float(os.environ.get("CLAUDE_BREAKER_COOLDOWN", 30))
+
+    # Concurrent Claude calls per batch parse request
+    PARSE_BATCH_CONCURRENCY = int(os.environ.get("PARSE_BATCH_CONCURRENCY", 8))
+
+    # Threads the ASGI parse app (app.asgi) uses for auth and database work
+    PARSE_ASGI_DB_THREADS = int(os.environ.get("PARSE_ASGI_DB_THREADS", 8))
+    # Largest request body it reads; larger ones get 413
+    PARSE_MAX_BODY_BYTES = int(os.environ.get("PARSE_MAX_BODY_BYTES", 256 * 1024))
+
+    # Background parse jobs (threads per worker process; 0 disables the runner)
+    PARSE_JOB_WORKERS = int(os.environ.get("PARSE_JOB_WORKERS", 2))
+    PARSE_JOB_POLL_INTERVAL = float(os.environ.get("PARSE_JOB_POLL_INTERVAL", 5))
+    PARSE_JOB_TIMEOUT = int(os.environ.get("PARSE_JOB_TIMEOUT", 300))
+    # Claims after which a job that keeps stalling is failed rather than requeued
+    PARSE_JOB_MAX_ATTEMPTS = int(os.environ.get("PARSE_JOB_MAX_ATTEMPTS", 3))
+
+    # Rule-based parses at or above this confidence skip the Claude call
+    PARSE_FAST_PATH_THRESHOLD = float(os.environ.get("PARSE_FAST_PATH_THRESHOLD", 0.8))
+
+    # Parse result cache ("memory", "sqlite" to share across workers, or "none")
+    PARSE_CACHE_BACKEND = os.environ.get("PARSE_CACHE_BACKEND", "memory")
+    PARSE_CACHE_PATH = os.environ.get("PARSE_CACHE_PATH", "/tmp/bill-parse-cache.db")
+    PARSE_CACHE_MAX_ENTRIES = int(os.environ.get("PARSE_CACHE_MAX_ENTRIES", 1024))
+    PARSE_CACHE_TTL = int(os.environ.get("PARSE_CACHE_TTL", 3600))
+
+    # Reminder scheduler (run with "python -m app.scheduler")
+    # Notifier is "log", "smtp" or "webhook"; SMTP defaults to a local relay
+    REMINDER_NOTIFIER = os.environ.get("REMINDER_NOTIFIER", "log")
+    REMINDER_LEAD_DAYS = int(os.environ.get("REMINDER_LEAD_DAYS", 3))
+    REMINDER_OVERDUE_DAYS = int(os.environ.get("REMINDER_OVERDUE_DAYS", 1))
+    REMINDER_SEND_HOUR = int(os.environ.get("REMINDER_SEND_HOUR", 9))
+    REMINDER_LOOKAHEAD_DAYS = int(os.environ.get("REMINDER_LOOKAHEAD_DAYS", 7))
+    REMINDER_BATCH_SIZE = int(os.environ.get("REMINDER_BATCH_SIZE", 1000))
+    REMINDER_REFRESH_INTERVAL = float(os.environ.get("REMINDER_REFRESH_INTERVAL", 60))
+    REMINDER_MAX_ERROR_BACKOFF = float(os.environ.get("REMINDER_MAX_ERROR_BACKOFF", 900))
+    REMINDER_SMTP_HOST = os.environ.get("REMINDER_SMTP_HOST", "localhost")
+    REMINDER_SMTP_PORT = int(os.environ.get("REMINDER_SMTP_PORT", 1025))
+    REMINDER_SMTP_SENDER = os.environ.get("REMINDER_SMTP_SENDER", "reminders@localhost")
+    REMINDER_WEBHOOK_URL = os.environ.get("REMINDER_WEBHOOK_URL")
 
     # Security Headers
     SESSION_COOKIE_SECURE = True
@@ -43,6 +155,7 @@ class DevelopmentConfig(Config):
 
     DEBUG = True
     SESSION_COOKIE_SECURE = False
+    AUTO_CREATE_TABLES = os.environ.get("AUTO_CREATE_TABLES", "true").lower() == "true"
 
 
 class ProductionConfig(Config):
@@ -50,6 +163,13 @@ class ProductionConfig(Config):
 
     DEBUG = False
     SESSION_COOKIE_SECURE = True
+    RATELIMIT_STORAGE_URI = os.environ.get(
+        "RATELIMIT_STORAGE_URI", "batched+sqlite:////tmp/bill-ratelimit.db"
+    )
+    RATELIMIT_STORAGE_OPTIONS = {
+        "sync_batch": int(os.environ.get("RATELIMIT_SYNC_BATCH", 10)),
+        "sync_interval": float(os.environ.get("RATELIMIT_SYNC_INTERVAL", 1)),
+    } if RATELIMIT_STORAGE_URI.startswith("batched+") else {}
 
 
 class TestingConfig(Config):
@@ -57,8 +177,13 @@ class TestingConfig(Config):
 
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_BINDS = {}
     SECRET_KEY = "test-secret-key"
     SESSION_COOKIE_SECURE = False
+    PARSE_JOB_WORKERS = 0
+    RATELIMIT_STORAGE_URI = "memory://"
+    BCRYPT_LOG_ROUNDS = 4
+    BCRYPT_POOL_SIZE = 0
 
 
 config = {
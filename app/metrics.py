@@ -0,0 +1,276 @@
+import bisect
+import threading
+import time
+from flask import Response, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+TOKEN_BUCKETS = (16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        return self._values.get(key, 0)
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield self.name, dict(zip(self.labelnames, key)), value
+
+
+class Gauge:
+    """Value that can go up and down, with optional labels."""
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def set(self, value, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = value
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield self.name, dict(zip(self.labelnames, key)), value
+
+
+class Histogram:
+    """Cumulative histogram with fixed buckets and optional labels."""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        series = self._values.get(key)
+        return series[2] if series else 0
+
+    def samples(self):
+        with self._lock:
+            items = [(key, (list(s[0]), s[1], s[2])) for key, s in self._values.items()]
+        for key, (counts, total, count) in items:
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                yield f"{self.name}_bucket", {**labels, "le": le}, cumulative
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, count
+
+
+class Registry:
+    """Collection of metrics rendered in the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                if labels:
+                    pairs = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+                    name = f"{name}{{{pairs}}}"
+                lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    "http_requests_total", "HTTP requests served.", ["method", "endpoint", "status"]
+))
+HTTP_LATENCY = REGISTRY.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency.", ["method", "endpoint"]
+))
+DB_QUERIES = REGISTRY.register(Counter(
+    "db_queries_total", "SQL statements executed."
+))
+DB_QUERIES_PER_REQUEST = REGISTRY.register(Histogram(
+    "db_queries_per_request", "SQL statements executed per request.", ["endpoint"],
+    buckets=COUNT_BUCKETS,
+))
+DB_TIME_PER_REQUEST = REGISTRY.register(Histogram(
+    "db_time_per_request_seconds", "Time spent in SQL statements per request.", ["endpoint"]
+))
+POOL_CHECKOUT_WAIT = REGISTRY.register(Histogram(
+    "db_pool_checkout_seconds", "Time spent waiting for a pooled connection.", ["engine"]
+))
+PARSE_REQUESTS = REGISTRY.register(Counter(
+    "bill_parse_total", "Bill parses by the path that answered them.", ["source"]
+))
+CLAUDE_REQUESTS = REGISTRY.register(Counter(
+    "claude_requests_total", "Claude calls by outcome.", ["outcome"]
+))
+CLAUDE_LATENCY = REGISTRY.register(Histogram(
+    "claude_request_duration_seconds", "Claude call latency."
+))
+CLAUDE_RETRIES = REGISTRY.register(Counter(
+    "claude_retries_total", "Claude calls retried after a transient error."
+))
+CLAUDE_BREAKER_STATE = REGISTRY.register(Gauge(
+    "claude_circuit_breaker_state", "Claude circuit breaker state (0 closed, 1 half-open, 2 open)."
+))
+CLAUDE_FIRST_TOKEN = REGISTRY.register(Histogram(
+    "claude_time_to_first_token_seconds", "Time from sending a Claude call to its first streamed text."
+))
+CLAUDE_TOKENS = REGISTRY.register(Counter(
+    "claude_tokens_total", "Claude tokens used.", ["direction"]
+))
+CLAUDE_TOKENS_PER_REQUEST = REGISTRY.register(Histogram(
+    "claude_tokens_per_request", "Claude tokens used per call.", ["direction"],
+    buckets=TOKEN_BUCKETS,
+))
+
+STARTUP_SECONDS = REGISTRY.register(Gauge(
+    "app_startup_seconds", "Time spent starting the app, by phase.", ["phase"]
+))
+PROCESS_START = REGISTRY.register(Gauge(
+    "process_start_time_seconds", "Unix time the app package was imported."
+))
+
+
+def record_startup(app, import_seconds, create_seconds, imported_at):
+    """Record how long importing the app and building it took."""
+    app.extensions["startup"] = {
+        "import_seconds": round(import_seconds, 4),
+        "create_app_seconds": round(create_seconds, 4),
+    }
+    STARTUP_SECONDS.set(import_seconds, phase="import")
+    STARTUP_SECONDS.set(create_seconds, phase="create_app")
+    PROCESS_START.set(imported_at)
+
+
+def record_claude_call(seconds, outcome, usage=None, first_token_seconds=None):
+    """
+    Record one Claude call's latency, outcome and token usage.
+
+    Cached prompt tokens are counted apart from input tokens as
+    direction "cache_read" and "cache_write".
+    """
+    CLAUDE_LATENCY.observe(seconds)
+    CLAUDE_REQUESTS.inc(outcome=outcome)
+    if first_token_seconds is not None:
+        CLAUDE_FIRST_TOKEN.observe(first_token_seconds)
+    for direction, field in (
+        ("input", "input_tokens"),
+        ("output", "output_tokens"),
+        ("cache_read", "cache_read_input_tokens"),
+        ("cache_write", "cache_creation_input_tokens"),
+    ):
+        tokens = getattr(usage, field, None)
+        if tokens:
+            CLAUDE_TOKENS.inc(tokens, direction=direction)
+            CLAUDE_TOKENS_PER_REQUEST.observe(tokens, direction=direction)
+
+
+def init_metrics(app):
+    """Time every request, count its SQL and serve /metrics."""
+    if not app.config.get("METRICS_ENABLED", True):
+        return
+
+    @app.before_request
+    def start_request_timer():
+        g.metrics_started = time.perf_counter()
+        g.db_queries = 0
+        g.db_time = 0.0
+
+    @app.after_request
+    def record_request_metrics(response):
+        started = g.get("metrics_started")
+        if started is None:
+            return response
+        endpoint = request.endpoint or "unmatched"
+        HTTP_LATENCY.observe(
+            time.perf_counter() - started, method=request.method, endpoint=endpoint
+        )
+        HTTP_REQUESTS.inc(
+            method=request.method, endpoint=endpoint, status=response.status_code
+        )
+        DB_QUERIES_PER_REQUEST.observe(g.db_queries, endpoint=endpoint)
+        DB_TIME_PER_REQUEST.observe(g.db_time, endpoint=endpoint)
+        return response
+
+    @app.route("/metrics")
+    def metrics():
+        return Response(REGISTRY.render(), mimetype="text/plain; version=0.0.4")
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    DB_QUERIES.inc()
+    if has_request_context() and "db_queries" in g:
+        g.db_queries += 1
+        g.db_time += time.perf_counter() - started
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_query_timer(context):
+    # Failed statements never reach after_cursor_execute
+    if context.connection is not None:
+        timers = context.connection.info.get("query_started")
+        if timers:
+            timers.pop()
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -1,4 +1,7 @@
 from app.models.bill import db, Bill
 from app.models.user import User
+from app.models.summary import BillSummary
+from app.models.parse_job import ParseJob
+from app.models.reminder import ReminderSent
 
-__all__ = ["db", "Bill", "User"]
+__all__ = ["db", "Bill", "User", "BillSummary", "ParseJob", "ReminderSent"]
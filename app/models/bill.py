@@ -1,13 +1,24 @@
 from datetime import datetime, date
-from flask_sqlalchemy import SQLAlchemy
+from app.models.routing import RoutingSession, RoutingSQLAlchemy
 
-db = SQLAlchemy()
+db = RoutingSQLAlchemy(session_options={"class_": RoutingSession})
 
 
 class Bill(db.Model):
     """Model for storing bill information."""
 
     __tablename__ = "bills"
+    __table_args__ = (
+        db.Index("ix_bills_user_paid_due", "user_id", "is_paid", "due_date"),
+        db.Index(
+            "ix_bills_user_unpaid_due", "user_id", "due_date",
+            postgresql_where=db.text("NOT is_paid"),
+        ),
+        db.Index(
+            "ix_bills_unpaid_due", "due_date", "id",
+            postgresql_where=db.text("NOT is_paid"),
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
@@ -26,26 +37,48 @@ class Bill(db.Model):
 
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True
+    )
 
     def __repr__(self):
         return f"<Bill {self.name} ${self.amount}>"
 
-    def to_dict(self):
-        """Convert bill to dictionary for JSON response."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "amount": float(self.amount),
-            "due_date": self.due_date.isoformat(),
-            "frequency": self.frequency,
-            "category": self.category,
-            "notes": self.notes,
-            "is_paid": self.is_paid,
-            "paid_date": self.paid_date.isoformat() if self.paid_date else None,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
+    FIELDS = (
+        "id", "name", "amount", "due_date", "frequency", "category", "notes",
+        "is_paid", "paid_date", "created_at", "updated_at",
+    )
+
+    def to_dict(self, fields=FIELDS):
+        """
+        Convert bill to dictionary for JSON response.
+
+        Only the named fields are read, so a bill loaded with load_only
+        for those fields serializes without further queries.
+        """
+        data = {}
+        for name in fields:
+            value = getattr(self, name)
+            if value is not None and name in _ENCODERS:
+                value = _ENCODERS[name](value)
+            data[name] = value
+        return data
+
+    @classmethod
+    def from_parsed(cls, user_id, bill_data):
+        """Build a bill from a BillParser result."""
+        return cls(
+            user_id=user_id,
+            name=bill_data["name"],
+            amount=bill_data["amount"],
+            due_date=datetime.strptime(bill_data["due_date"], "%Y-%m-%d").date(),
+            frequency=bill_data.get("frequency", "one-time"),
+            category=bill_data.get("category"),
+        )
+
+    def summary_state(self):
+        """Return the fields that feed the per-user summary rollup."""
+        return (self.amount, bool(self.is_paid), self.due_date)
 
     @property
     def is_overdue(self):
@@ -53,3 +86,12 @@ class Bill(db.Model):
         if self.is_paid:
             return False
         return date.today() > self.due_date
+
+
+_ENCODERS = {
+    "amount": float,
+    "due_date": date.isoformat,
+    "paid_date": date.isoformat,
+    "created_at": datetime.isoformat,
+    "updated_at": datetime.isoformat,
+}
@@ -0,0 +1,49 @@
+import uuid
+from datetime import datetime
+from app.models.bill import db
+
+
+class ParseJob(db.Model):
+    """Natural language parse request processed in the background."""
+
+    __tablename__ = "parse_jobs"
+    __table_args__ = (
+        db.Index("ix_parse_jobs_status_created", "status", "created_at"),
+    )
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    id = db.Column(db.String(32), primary_key=True, default=lambda: uuid.uuid4().hex)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
+    text = db.Column(db.Text, nullable=False)
+
+    # Processing state
+    status = db.Column(db.String(20), nullable=False, default=PENDING)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    locked_at = db.Column(db.DateTime)
+    bill_id = db.Column(db.Integer, db.ForeignKey("bills.id", ondelete="SET NULL"))
+    error = db.Column(db.Text)
+
+    # Timestamps
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    bill = db.relationship("Bill")
+
+    def __repr__(self):
+        return f"<ParseJob {self.id} {self.status}>"
+
+    def to_dict(self):
+        """Convert job to dictionary for JSON response."""
+        return {
+            "id": self.id,
+            "status": self.status,
+            "text": self.text,
+            "bill": self.bill.to_dict() if self.bill else None,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
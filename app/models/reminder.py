@@ -0,0 +1,28 @@
+from datetime import datetime
+from app.models.bill import db
+
+
+class ReminderSent(db.Model):
+    """Record of a reminder dispatched for one bill due date."""
+
+    __tablename__ = "reminders_sent"
+    __table_args__ = (
+        db.UniqueConstraint("bill_id", "kind", "due_date", name="uq_reminders_sent_bill_kind_due"),
+    )
+
+    UPCOMING = "upcoming"
+    DUE = "due"
+    OVERDUE = "overdue"
+
+    id = db.Column(db.Integer, primary_key=True)
+    bill_id = db.Column(db.Integer, db.ForeignKey("bills.id", ondelete="CASCADE"), nullable=False)
+    kind = db.Column(db.String(20), nullable=False)
+    due_date = db.Column(db.Date, nullable=False)
+
+    # Delivery
+    channel = db.Column(db.String(20), nullable=False)
+    error = db.Column(db.Text)
+    sent_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<ReminderSent bill={self.bill_id} {self.kind} {self.due_date}>"
@@ -0,0 +1,172 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from flask import g, has_request_context, request
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql import Select
+from app.metrics import POOL_CHECKOUT_WAIT
+
+REPLICA = "replica"
+STICKY_COOKIE = "db_primary_until"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            POOL_CHECKOUT_WAIT.observe(
+                time.perf_counter() - started, engine=self.logging_name or "primary"
+            )
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads on replica-eligible requests to the replica.
+
+    Only plain SELECTs go to the replica. Flushes and INSERT, UPDATE and
+    DELETE statements always use the primary, as does anything run
+    inside use_primary().
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self._reads_from_replica(clause):
+            return self._db.engines[REPLICA]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _reads_from_replica(self, clause):
+        return (
+            isinstance(clause, Select)
+            and not self._flushing
+            and not self.info.get("use_primary")
+            and has_request_context()
+            and g.get("db_read_replica", False)
+        )
+
+
+class RoutingSQLAlchemy(SQLAlchemy):
+    """SQLAlchemy extension whose queue pools report checkout wait time."""
+
+    def _make_engine(self, bind_key, options, app):
+        # In-memory SQLite already has StaticPool set by the driver defaults
+        if "poolclass" not in options:
+            options = {
+                **options,
+                "poolclass": TimedQueuePool,
+                "pool_logging_name": bind_key or "primary",
+            }
+        return super()._make_engine(bind_key, options, app)
+
+
+@contextmanager
+def use_primary(session):
+    """Run every statement in the block against the primary."""
+    previous = session.info.get("use_primary")
+    session.info["use_primary"] = True
+    try:
+        yield
+    finally:
+        session.info["use_primary"] = previous
+
+
+class ReplicaRouter:
+    """
+    Decides per request whether reads may use the replica.
+
+    Safe-method requests read from the replica unless the caller wrote
+    within the last sticky_seconds, so users always see their own
+    writes. The window is tracked per user in this process and in a
+    cookie, so it also holds when the next request lands on another
+    worker.
+    """
+
+    def __init__(self, sticky_seconds=5.0, max_entries=10000):
+        self.sticky_seconds = sticky_seconds
+        self.max_entries = max_entries
+        self._sticky = OrderedDict()
+        self._lock = threading.Lock()
+
+    def reads_from_replica(self):
+        if request.method not in SAFE_METHODS:
+            return False
+        now = time.time()
+        try:
+            if float(request.cookies.get(STICKY_COOKIE, 0)) > now:
+                return False
+        except ValueError:
+            pass
+        identity = _identity()
+        return identity is None or self._sticky.get(identity, 0) <= now
+
+    def record_write(self, response):
+        until = time.time() + self.sticky_seconds
+        identity = _identity()
+        if identity is not None:
+            with self._lock:
+                # Kept in write order, so the oldest windows are at the front
+                self._sticky.pop(identity, None)
+                self._sticky[identity] = until
+                now = time.time()
+                while self._sticky and (
+                    len(self._sticky) > self.max_entries or next(iter(self._sticky.values())) <= now
+                ):
+                    self._sticky.popitem(last=False)
+        response.set_cookie(
+            STICKY_COOKIE, f"{until:.3f}",
+            max_age=max(int(self.sticky_seconds), 1),
+            httponly=True,
+            samesite="Lax",
+            secure=request.is_secure,
+        )
+
+
+def init_replica_routing(app):
+    """Route safe-method reads to the replica bind when one is configured."""
+    if REPLICA not in app.config.get("SQLALCHEMY_BINDS", {}):
+        return
+
+    router = ReplicaRouter(sticky_seconds=app.config.get("REPLICA_STICKY_SECONDS", 5.0))
+    app.extensions["replica_router"] = router
+
+    @app.before_request
+    def choose_database():
+        g.db_read_replica = router.reads_from_replica()
+
+    @app.after_request
+    def stick_to_primary_after_write(response):
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            router.record_write(response)
+        return response
+
+
+def pool_status(engines):
+    """Return checkout counts for each engine's queue pool."""
+    status = {}
+    for bind_key, engine in engines.items():
+        pool = engine.pool
+        if isinstance(pool, QueuePool):
+            status[bind_key or "primary"] = {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            }
+    return status
+
+
+def _identity():
+    # Bad or expired tokens just mean no stickiness; other errors propagate
+    try:
+        verify_jwt_in_request(optional=True)
+        return get_jwt_identity()
+    except (JWTExtendedException, PyJWTError):
+        return None
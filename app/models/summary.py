@@ -0,0 +1,142 @@
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import case, func
+from sqlalchemy.exc import IntegrityError
+from app.models.bill import db, Bill
+from app.models.routing import use_primary
+from app.models.user import User
+
+
+class BillSummary(db.Model):
+    """Per-user rollup of bill totals, kept current by the bill write routes."""
+
+    __tablename__ = "bill_summaries"
+
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), primary_key=True)
+    as_of = db.Column(db.Date, nullable=False)
+    # User.data_version the totals are current with; a mismatch means a
+    # write landed while they were being computed
+    data_version = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+    total_bills = db.Column(db.Integer, nullable=False, default=0)
+    unpaid_count = db.Column(db.Integer, nullable=False, default=0)
+    overdue_count = db.Column(db.Integer, nullable=False, default=0)
+    total_due = db.Column(db.Numeric(14, 2), nullable=False, default=0)
+    total_overdue = db.Column(db.Numeric(14, 2), nullable=False, default=0)
+
+    def to_dict(self):
+        """Convert summary to dictionary for JSON response."""
+        return {
+            "total_bills": self.total_bills,
+            "unpaid_count": self.unpaid_count,
+            "overdue_count": self.overdue_count,
+            "total_due": round(float(self.total_due), 2),
+            "total_overdue": round(float(self.total_overdue), 2),
+        }
+
+    @classmethod
+    def compute(cls, user_id, today):
+        """Aggregate a user's bills in a single query."""
+        unpaid = Bill.is_paid.is_not(True)
+        overdue = unpaid & (Bill.due_date < today)
+        row = db.session.query(
+            func.count(Bill.id),
+            func.sum(case((unpaid, 1), else_=0)),
+            func.sum(case((unpaid, Bill.amount), else_=0)),
+            func.sum(case((overdue, 1), else_=0)),
+            func.sum(case((overdue, Bill.amount), else_=0)),
+        ).filter(Bill.user_id == user_id).one()
+
+        return cls(
+            user_id=user_id,
+            as_of=today,
+            total_bills=row[0],
+            unpaid_count=row[1] or 0,
+            total_due=row[2] or 0,
+            overdue_count=row[3] or 0,
+            total_overdue=row[4] or 0,
+        )
+
+    @classmethod
+    def for_user(cls, user_id):
+        """Return today's rollup for a user, recomputing it if missing or stale."""
+        today = date.today()
+        summary = db.session.query(cls).join(User, User.id == cls.user_id).filter(
+            cls.user_id == user_id, cls.as_of == today, cls.data_version == User.data_version
+        ).first()
+        if summary is not None:
+            return summary
+
+        # Recompute from the primary so the stored rollup is never stale.
+        # The version is read first, so a write that commits during the
+        # aggregate leaves the stored rollup behind and the next read
+        # recomputes it.
+        with use_primary(db.session):
+            version = User.get_data_version(user_id)
+            summary = cls.compute(user_id, today)
+            summary.data_version = version
+            summary = db.session.merge(summary)
+            try:
+                db.session.commit()
+            except IntegrityError:
+                # Another request stored the user's first rollup first
+                db.session.rollback()
+                summary = db.session.get(cls, user_id)
+        return summary
+
+    @classmethod
+    def apply(cls, user_id, before=None, after=None):
+        """
+        Adjust a user's rollup for a bill changing from one state to another.
+
+        States come from Bill.summary_state(); None means the bill did not
+        exist. Only rollups that are current, computed today and at the
+        user's data version, are adjusted and moved on to the version the
+        write's User.bump_data_version() sets; any other rollup is
+        recomputed on the next read anyway. Call before bumping the version
+        and committing so the adjustment shares the bill write's transaction.
+        """
+        today = date.today()
+        old = _contribution(before, today)
+        new = _contribution(after, today)
+        deltas = [n - o for n, o in zip(new, old)]
+        version = (
+            db.select(User.data_version).where(User.id == user_id).scalar_subquery()
+        )
+
+        # A rollup already moved on by an earlier apply() in this
+        # transaction is one version ahead of the user
+        db.session.query(cls).filter(
+            cls.user_id == user_id, cls.as_of == today, cls.data_version >= version
+        ).update({
+            cls.total_bills: cls.total_bills + deltas[0],
+            cls.unpaid_count: cls.unpaid_count + deltas[1],
+            cls.total_due: cls.total_due + deltas[2],
+            cls.overdue_count: cls.overdue_count + deltas[3],
+            cls.total_overdue: cls.total_overdue + deltas[4],
+            cls.data_version: version + 1,
+        }, synchronize_session=False)
+
+    @classmethod
+    def invalidate(cls, user_id):
+        """Drop a user's rollup so the next read recomputes it."""
+        db.session.query(cls).filter(cls.user_id == user_id).delete(
+            synchronize_session=False
+        )
+
+
+def _contribution(state, today):
+    """Return what a single bill state adds to each rollup column."""
+    if state is None:
+        return (0, 0, Decimal(0), 0, Decimal(0))
+    amount, is_paid, due_date = state
+    amount = Decimal(str(amount))
+    unpaid = not is_paid
+    overdue = unpaid and due_date < today
+    return (
+        1,
+        int(unpaid),
+        amount if unpaid else Decimal(0),
+        int(overdue),
+        amount if overdue else Decimal(0),
+    )
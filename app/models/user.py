@@ -1,5 +1,4 @@
 from datetime import datetime
-import bcrypt
 from app.models.bill import db
 
 
@@ -15,8 +14,17 @@ class User(db.Model):
 
     # Account status
     is_active = db.Column(db.Boolean, default=True)
+
+    # Bumped by password changes and explicit revokes; calendar feed
+    # tokens carry it, so either one invalidates every feed URL
+    feed_version = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+    # Bumped on every write to the user's bills; drives ETags on reads
+    data_version = db.Column(db.Integer, nullable=False, default=0, server_default="0")
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True
+    )
 
     # Relationship to bills
     bills = db.relationship("Bill", backref="user", lazy="dynamic")
@@ -25,16 +33,50 @@ class User(db.Model):
         return f"<User {self.email}>"
 
     def set_password(self, password):
-        """Hash password using bcrypt."""
-        salt = bcrypt.gensalt()
-        self.password_hash = bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+        """Hash password using bcrypt and revoke existing calendar feed URLs."""
+        from app.security.hashing import get_password_hasher
+        self.password_hash = get_password_hasher().hash(password)
+        self.revoke_calendar_feeds()
+
+    def rehash_password(self, password):
+        """Re-hash an unchanged password at the configured bcrypt cost."""
+        from app.security.hashing import get_password_hasher
+        self.password_hash = get_password_hasher().hash(password)
+
+    def revoke_calendar_feeds(self):
+        """Invalidate every calendar feed URL issued so far."""
+        self.feed_version = (self.feed_version or 0) + 1
 
     def check_password(self, password):
         """Verify password against hash."""
-        return bcrypt.checkpw(
-            password.encode("utf-8"), self.password_hash.encode("utf-8")
+        from app.security.hashing import get_password_hasher
+        return get_password_hasher().verify(password, self.password_hash)
+
+    def password_needs_rehash(self):
+        """Check whether the stored hash predates the configured bcrypt cost."""
+        from app.security.hashing import get_password_hasher
+        return get_password_hasher().needs_rehash(self.password_hash)
+
+    @classmethod
+    def bump_data_version(cls, user_id):
+        """
+        Mark the user's bill data as changed in the current transaction.
+
+        Runs as a plain UPDATE that leaves updated_at alone, so bill
+        writes do not look like account changes to the identity cache.
+        """
+        db.session.execute(
+            db.update(cls)
+            .where(cls.id == user_id)
+            .values(data_version=cls.data_version + 1, updated_at=cls.updated_at)
+            .execution_options(synchronize_session=False)
         )
 
+    @classmethod
+    def get_data_version(cls, user_id):
+        """Return the user's current bill data version."""
+        return db.session.query(cls.data_version).filter(cls.id == user_id).scalar()
+
     def to_dict(self):
         """Convert user to dictionary for JSON response."""
         return {
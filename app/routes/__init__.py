@@ -1,4 +1,5 @@
 from app.routes.auth import auth_bp
 from app.routes.bills import bills_bp
+from app.routes.parse_asgi import ParseASGIApp
 
-__all__ = ["auth_bp", "bills_bp"]
+__all__ = ["auth_bp", "bills_bp", "ParseASGIApp"]
@@ -19,7 +19,7 @@ def register():
     try:
         data = UserRegistration(**request.get_json())
     except ValidationError as e:
-        return jsonify({"error": "Validation failed", "details": e.errors()}), 400
+        return jsonify({"error": "Validation failed", "details": e.errors(include_context=False)}), 400
 
     if User.query.filter_by(email=data.email).first():
         return jsonify({"error": "Email already registered"}), 409
@@ -45,7 +45,7 @@ def login():
     try:
         data = UserLogin(**request.get_json())
     except ValidationError as e:
-        return jsonify({"error": "Validation failed", "details": e.errors()}), 400
+        return jsonify({"error": "Validation failed", "details": e.errors(include_context=False)}), 400
 
     user = User.query.filter_by(email=data.email).first()
 
@@ -55,6 +55,10 @@ def login():
     if not user.is_active:
         return jsonify({"error": "Account is disabled"}), 403
 
+    if user.password_needs_rehash():
+        user.rehash_password(data.password)
+        db.session.commit()
+
     tokens = generate_tokens(user)
     return jsonify({
         "message": "Login successful",
@@ -67,7 +71,11 @@ def login():
 @jwt_required()
 def get_current_user():
     """Get current authenticated user."""
-    return jsonify({"user": current_user.to_dict()}), 200
+    user = db.session.get(User, current_user.id)
+    # The cached identity can outlive the row, and a lagging replica may not have it yet
+    if user is None:
+        return jsonify({"error": "User not found"}), 404
+    return jsonify({"user": user.to_dict()}), 200
 
 
 @auth_bp.route("/refresh", methods=["POST"])
@@ -1,33 +1,273 @@
-from datetime import datetime
-from flask import Blueprint, request, jsonify
+import hashlib
+from datetime import datetime, date, timedelta
+from functools import wraps
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    jsonify,
+    make_response,
+    request,
+    stream_with_context,
+    url_for,
+)
 from flask_jwt_extended import jwt_required, current_user
+from itsdangerous import BadSignature, URLSafeTimedSerializer
 from pydantic import ValidationError
-from app.models import db, Bill
-from app.security import limiter, BillCreate, BillNaturalLanguage
-from app.services import BillParser
+from sqlalchemy.orm import load_only
+from app.models import db, Bill, BillSummary, ParseJob, User
+from app.security import (
+    limiter,
+    BillCreate,
+    BillBulkOperation,
+    BillFieldsQuery,
+    BillListQuery,
+    BillPageQuery,
+    BillUpcomingQuery,
+    BillCalendarQuery,
+    BillNaturalLanguage,
+    BillBatchParse,
+)
+from app.services import (
+    EXPORT_FORMATS,
+    EXPORT_MIMETYPES,
+    EXPORTERS,
+    IMPORT_FORMATS,
+    arrow_available,
+    expand_bills,
+    iter_bill_rows,
+    get_bill_parser,
+    get_parse_executor,
+    import_bills,
+    iter_rows,
+    paginate_bills,
+    render_ics,
+    submit_parse_job,
+)
 
 bills_bp = Blueprint("bills", __name__, url_prefix="/api/bills")
 
 
+def versioned(view):
+    """
+    Serve a read endpoint conditionally on the user's data version.
+
+    The ETag covers the data version, the full request path and today's
+    date (overdue state changes at midnight), so a matching If-None-Match
+    is answered with 304 after one version lookup and no bill queries.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        version = User.get_data_version(current_user.id)
+        key = f"{current_user.id}:{version}:{request.full_path}:{date.today().isoformat()}"
+        etag = hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+        if etag in request.if_none_match:
+            response = current_app.response_class(status=304)
+        else:
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "private, no-cache"
+        return response
+
+    return wrapper
+
+
 @bills_bp.route("", methods=["GET"])
 @jwt_required()
+@versioned
 def get_bills():
-    """Get all bills for current user."""
-    bills = Bill.query.filter_by(user_id=current_user.id).order_by(Bill.due_date).all()
+    """Get a page of bills for current user, ordered by due date."""
+    try:
+        params = BillListQuery(**request.args.to_dict())
+    except ValidationError as e:
+        return jsonify({"error": "Validation failed", "details": e.errors(include_context=False)}), 400
+
+    query = Bill.query.filter_by(user_id=current_user.id)
+    if params.is_paid is not None:
+        query = query.filter(Bill.is_paid == params.is_paid)
+    if params.category:
+        query = query.filter(Bill.category == params.category)
+    if params.frequency:
+        query = query.filter(Bill.frequency == params.frequency)
+    if params.due_from:
+        query = query.filter(Bill.due_date >= params.due_from)
+    if params.due_to:
+        query = query.filter(Bill.due_date <= params.due_to)
+
+    return _bill_page(query, params)
+
+
+@bills_bp.route("/upcoming", methods=["GET"])
+@jwt_required()
+@versioned
+def get_upcoming_bills():
+    """Get unpaid bills due within the next N days."""
+    try:
+        params = BillUpcomingQuery(**request.args.to_dict())
+    except ValidationError as e:
+        return jsonify({"error": "Validation failed", "details": e.errors(include_context=False)}), 400
+
+    today = date.today()
+    query = Bill.query.filter(
+        Bill.user_id == current_user.id,
+        Bill.is_paid == db.false(),
+        Bill.due_date >= today,
+        Bill.due_date <= today + timedelta(days=params.days),
+    )
+    return _bill_page(query, params)
+
+
+@bills_bp.route("/overdue", methods=["GET"])
+@jwt_required()
+@versioned
+def get_overdue_bills():
+    """Get unpaid bills whose due date has passed."""
+    try:
+        params = BillPageQuery(**request.args.to_dict())
+    except ValidationError as e:
+        return jsonify({"error": "Validation failed", "details": e.errors(include_context=False)}), 400
+
+    query = Bill.query.filter(
+        Bill.user_id == current_user.id,
+        Bill.is_paid == db.false(),
+        Bill.due_date < date.today(),
+    )
+    return _bill_page(query, params)
+
+
+@bills_bp.route("/calendar", methods=["GET"])
+@jwt_required()
+@versioned
+def get_calendar():
+    """Get every bill occurrence, including recurrences, in a date window."""
+    try:
+        params = BillCalendarQuery(**request.args.to_dict())
+    except ValidationError as e:
+        return jsonify({"error": "Validation failed", "details": e.errors(include_context=False)}), 400
+
+    occurrences = _occurrences(current_user.id, params.start, params.end)
+    for occurrence in occurrences:
+        occurrence["date"] = occurrence["date"].isoformat()
+    return jsonify({
+        "from": params.start.isoformat(),
+        "to": params.end.isoformat(),
+        "occurrences": occurrences,
+        "count": len(occurrences),
+    }), 200
+
+
+@bills_bp.route("/calendar/feed", methods=["GET"])
+@jwt_required()
+def get_calendar_feed_url():
+    """Get the private iCalendar subscription URL for the current user."""
+    user = db.session.get(User, current_user.id)
+    if user is None:
+        return jsonify({"error": "User not found"}), 404
+    token = _feed_serializer().dumps({"uid": user.id, "v": user.feed_version})
     return jsonify({
-        "bills": [bill.to_dict() for bill in bills],
+        "url": url_for("bills.get_calendar_feed", token=token, _external=True),
+    }), 200
+
+
+@bills_bp.route("/calendar/feed", methods=["DELETE"])
+@jwt_required()
+def revoke_calendar_feed():
+    """Revoke every iCalendar subscription URL issued to the current user."""
+    user = db.session.get(User, current_user.id)
+    if user is None:
+        return jsonify({"error": "User not found"}), 404
+    user.revoke_calendar_feeds()
+    db.session.commit()
+    return jsonify({"message": "Calendar feed URLs revoked"}), 200
+
+
+@bills_bp.route("/calendar.ics", methods=["GET"])
+def get_calendar_feed():
+    """
+    Serve a user's bills as an iCalendar feed.
+
+    Calendar apps cannot send bearer tokens, so the feed is authorized by
+    the signed token in its URL. Tokens expire after CALENDAR_FEED_MAX_AGE
+    and are revoked by a password change, an explicit revoke or
+    deactivating the account.
+    Responses carry an ETag and may be cached briefly by clients.
+    """
+    try:
+        payload = _feed_serializer().loads(
+            request.args.get("token", ""), max_age=current_app.config["CALENDAR_FEED_MAX_AGE"]
+        )
+        user_id, feed_version = payload["uid"], payload["v"]
+    except (BadSignature, KeyError, TypeError):
+        return jsonify({"error": "Invalid feed token"}), 401
+
+    user = db.session.get(User, user_id)
+    if user is None or not user.is_active or feed_version != user.feed_version:
+        return jsonify({"error": "Invalid feed token"}), 401
+
+    today = date.today()
+    occurrences = _occurrences(user_id, today - timedelta(days=30), today + timedelta(days=365))
+
+    response = current_app.response_class(render_ics(occurrences), mimetype="text/calendar")
+    response.headers["Cache-Control"] = "private, max-age=900"
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+def _occurrences(user_id, start, end):
+    """Expand the user's bills that can fall due in the window."""
+    rows = db.session.query(
+        Bill.id, Bill.name, Bill.amount, Bill.due_date,
+        Bill.frequency, Bill.category, Bill.is_paid,
+    ).filter(
+        Bill.user_id == user_id,
+        Bill.due_date <= end,
+        db.or_(Bill.due_date >= start, Bill.frequency != "one-time"),
+    ).all()
+    return expand_bills(rows, start, end)
+
+
+def _feed_serializer():
+    return URLSafeTimedSerializer(current_app.config["SECRET_KEY"], salt="calendar-feed")
+
+
+def _bill_page(query, params):
+    """Build a paginated bill list response, loading only the requested fields."""
+    fields = params.fields or Bill.FIELDS
+    if params.fields:
+        query = query.options(load_only(*(getattr(Bill, name) for name in fields)))
+    try:
+        bills, next_cursor = paginate_bills(query, params.limit, params.cursor)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({
+        "bills": [bill.to_dict(fields) for bill in bills],
         "count": len(bills),
+        "next_cursor": next_cursor,
     }), 200
 
 
 @bills_bp.route("/<int:bill_id>", methods=["GET"])
 @jwt_required()
+@versioned
 def get_bill(bill_id):
     """Get a specific bill."""
-    bill = Bill.query.filter_by(id=bill_id, user_id=current_user.id).first()
+    try:
+        params = BillFieldsQuery(**request.args.to_dict())
+    except ValidationError as e:
+        return jsonify({"error": "Validation failed", "details": e.errors(include_context=False)}), 400
+
+    fields = params.fields or Bill.FIELDS
+    query = Bill.query.filter_by(id=bill_id, user_id=current_user.id)
+    if params.fields:
+        query = query.options(load_only(*(getattr(Bill, name) for name in fields)))
+    bill = query.first()
     if not bill:
         return jsonify({"error": "Bill not found"}), 404
-    return jsonify({"bill": bill.to_dict()}), 200
+    return jsonify({"bill": bill.to_dict(fields)}), 200
 
 
 @bills_bp.route("", methods=["POST"])
@@ -38,7 +278,7 @@ def create_bill():
     try:
         data = BillCreate(**request.get_json())
     except ValidationError as e:
-        return jsonify({"error": "Validation failed", "details": e.errors()}), 400
+        return jsonify({"error": "Validation failed", "details": e.errors(include_context=False)}), 400
 
     bill = Bill(
         user_id=current_user.id,
@@ -51,47 +291,267 @@ def create_bill():
     )
 
     db.session.add(bill)
+    BillSummary.apply(current_user.id, after=bill.summary_state())
+    User.bump_data_version(current_user.id)
     db.session.commit()
 
     return jsonify({"message": "Bill created", "bill": bill.to_dict()}), 201
 
 
+@bills_bp.route("/export", methods=["GET"])
+@jwt_required()
+@limiter.limit("30 per hour")
+def export_bills():
+    """Stream all of the current user's bills as CSV, NDJSON or Arrow."""
+    fmt = request.args.get("format", "csv")
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": f"Format must be one of: {', '.join(EXPORT_FORMATS)}"}), 400
+    if fmt == "arrow" and not arrow_available():
+        return jsonify({"error": "Arrow export requires pyarrow to be installed"}), 400
+
+    chunk_size = current_app.config["EXPORT_CHUNK_SIZE"]
+    rows = iter_bill_rows(current_user.id, chunk_size)
+    body = EXPORTERS[fmt](rows, chunk_size)
+    return Response(
+        stream_with_context(body),
+        mimetype=EXPORT_MIMETYPES[fmt],
+        headers={"Content-Disposition": f"attachment; filename=bills.{fmt}"},
+    )
+
+
+@bills_bp.route("/import", methods=["POST"])
+@jwt_required()
+@limiter.limit("10 per hour")
+def import_bills_file():
+    """
+    Import bills from a CSV or NDJSON upload.
+
+    The file is sent as the raw request body or as a multipart "file"
+    field and is read as a stream. Rows use the same fields as bill
+    creation; invalid rows are reported and skipped.
+    """
+    upload = request.files.get("file")
+    stream = upload.stream if upload else request.stream
+
+    fmt = request.args.get("format")
+    if fmt is None:
+        filename = (upload.filename or "") if upload else ""
+        content_type = upload.mimetype if upload else request.mimetype
+        if filename.endswith(".csv") or content_type == "text/csv":
+            fmt = "csv"
+        elif filename.endswith((".ndjson", ".jsonl")) or content_type in (
+            "application/x-ndjson", "application/jsonl"
+        ):
+            fmt = "ndjson"
+    if fmt not in IMPORT_FORMATS:
+        return jsonify({"error": f"Format must be one of: {', '.join(IMPORT_FORMATS)}"}), 400
+
+    imported, failed, errors = import_bills(
+        current_user.id,
+        iter_rows(stream, fmt),
+        batch_size=current_app.config["IMPORT_BATCH_SIZE"],
+        max_errors=current_app.config["IMPORT_MAX_ERRORS"],
+    )
+
+    return jsonify({
+        "message": f"Imported {imported} bills",
+        "imported": imported,
+        "failed": failed,
+        "errors": errors,
+        "errors_truncated": failed > len(errors),
+    }), 201 if imported else 400
+
+
 @bills_bp.route("/parse", methods=["POST"])
 @jwt_required()
 @limiter.limit("20 per hour")
 def parse_bill():
-    """Parse natural language bill description using AI."""
+    """
+    Parse natural language bill description using AI.
+
+    With ``?async=1`` the parse is queued as a job and 202 is returned.
+    """
     try:
         data = BillNaturalLanguage(**request.get_json())
     except ValidationError as e:
-        return jsonify({"error": "Validation failed", "details": e.errors()}), 400
+        return jsonify({"error": "Validation failed", "details": e.errors(include_context=False)}), 400
+
+    if wants_queued_parse():
+        return queue_parse(current_user.id, data.text)
+
+    parser = get_bill_parser(current_app.config)
+    return parse_response(current_user.id, data.text, parser.parse_bill(data.text))
+
+
+def wants_queued_parse():
+    """Whether the client asked for the parse to run as a background job."""
+    return request.args.get("async", "").lower() in ("1", "true")
 
-    parser = BillParser()
-    result = parser.parse_bill(data.text)
 
+def queue_parse(user_id, text):
+    """Queue a parse job and point the client at its status URL."""
+    job = submit_parse_job(user_id, text)
+    status_url = url_for("bills.get_parse_job", job_id=job.id)
+    return jsonify({
+        "message": "Parse job queued",
+        "job": job.to_dict(),
+        "status_url": status_url,
+    }), 202, {"Location": status_url}
+
+
+def parse_response(user_id, text, result):
+    """Create the bill from a parse result and build the response."""
     if not result["success"]:
-        return jsonify({"error": result["error"]}), 400
+        return jsonify({"error": result["error"]}), 503 if result.get("unavailable") else 400
 
-    bill_data = result["data"]
-    bill = Bill(
-        user_id=current_user.id,
-        name=bill_data["name"],
-        amount=bill_data["amount"],
-        due_date=datetime.strptime(bill_data["due_date"], "%Y-%m-%d").date(),
-        frequency=bill_data.get("frequency", "one-time"),
-        category=bill_data.get("category"),
-    )
+    bill = Bill.from_parsed(user_id, result["data"])
 
     db.session.add(bill)
+    BillSummary.apply(user_id, after=bill.summary_state())
+    User.bump_data_version(user_id)
     db.session.commit()
 
     return jsonify({
         "message": "Bill parsed and created",
         "bill": bill.to_dict(),
-        "parsed_from": data.text,
+        "parsed_from": text,
     }), 201
 
 
+@bills_bp.route("/parse/jobs/<job_id>", methods=["GET"])
+@jwt_required()
+def get_parse_job(job_id):
+    """Get the status of a queued parse job."""
+    job = ParseJob.query.filter_by(id=job_id, user_id=current_user.id).first()
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify({"job": job.to_dict()}), 200
+
+
+@bills_bp.route("/parse/batch", methods=["POST"])
+@jwt_required()
+@limiter.limit("10 per hour")
+def parse_bills_batch():
+    """Parse several natural language bill descriptions and create the bills."""
+    try:
+        data = BillBatchParse(**request.get_json())
+    except ValidationError as e:
+        return jsonify({"error": "Validation failed", "details": e.errors(include_context=False)}), 400
+
+    results, pending = validate_batch_texts(data.texts)
+    parser = get_bill_parser(current_app.config)
+    today = datetime.now()
+    executor = get_parse_executor(current_app.config)
+    parsed = list(executor.map(lambda item: parser.parse_bill(item[1], today), pending))
+
+    return batch_parse_response(current_user.id, data.texts, results, pending, parsed)
+
+
+def validate_batch_texts(texts):
+    """
+    Validate each text of a batch parse on its own.
+
+    Returns the per-index results list, with failures filled in, and the
+    (index, text) pairs still to parse.
+    """
+    results = [None] * len(texts)
+    pending = []
+    for index, text in enumerate(texts):
+        try:
+            pending.append((index, BillNaturalLanguage(text=text).text))
+        except ValidationError as e:
+            results[index] = {
+                "index": index,
+                "success": False,
+                "error": "Validation failed",
+                "details": e.errors(include_context=False),
+            }
+    return results, pending
+
+
+def batch_parse_response(user_id, texts, results, pending, parsed):
+    """Create the bills for successful parses in one commit and build the response."""
+    created = []
+    for (index, text), result in zip(pending, parsed):
+        if not result["success"]:
+            results[index] = {"index": index, "success": False, "error": result["error"]}
+            continue
+        bill = Bill.from_parsed(user_id, result["data"])
+        db.session.add(bill)
+        BillSummary.apply(user_id, after=bill.summary_state())
+        created.append((index, text, bill))
+
+    if created:
+        User.bump_data_version(user_id)
+        db.session.commit()
+
+    for index, text, bill in created:
+        results[index] = {
+            "index": index,
+            "success": True,
+            "bill": bill.to_dict(),
+            "parsed_from": text,
+        }
+
+    return jsonify({
+        "message": f"Created {len(created)} of {len(texts)} bills",
+        "created": len(created),
+        "results": results,
+    }), 201 if created else 400
+
+
+@bills_bp.route("/bulk", methods=["POST"])
+@jwt_required()
+@limiter.limit("30 per hour")
+def bulk_bills():
+    """
+    Pay, delete or update many bills in one statement.
+
+    Body: ``{"ids": [...], "op": "pay" | "delete" | "update", "changes": {...}}``.
+    The operation runs as a single UPDATE or DELETE scoped to the user's
+    bills and returns the affected rows; ids that match none of them are
+    listed as missing.
+    """
+    try:
+        data = BillBulkOperation(**request.get_json())
+    except ValidationError as e:
+        return jsonify({"error": "Validation failed", "details": e.errors(include_context=False)}), 400
+
+    scope = (Bill.user_id == current_user.id, Bill.id.in_(data.ids))
+    response = {"op": data.op}
+    if data.op == "delete":
+        statement = db.delete(Bill).where(*scope).returning(Bill.id)
+        affected = db.session.execute(statement).scalars().all()
+        response["ids"] = sorted(affected)
+    else:
+        if data.op == "pay":
+            values = {"is_paid": True, "paid_date": date.today()}
+        else:
+            values = data.changes.model_dump(exclude_unset=True)
+            if "due_date" in values:
+                values["due_date"] = datetime.strptime(values["due_date"], "%Y-%m-%d").date()
+        statement = db.update(Bill).where(*scope).values(**values).returning(Bill)
+        bills = db.session.execute(
+            statement, execution_options={"synchronize_session": False}
+        ).scalars().all()
+        affected = [bill.id for bill in bills]
+        # Serialized before commit, which would expire and reload each row
+        response["bills"] = [bill.to_dict() for bill in sorted(bills, key=lambda b: b.id)]
+
+    if affected:
+        BillSummary.invalidate(current_user.id)
+        User.bump_data_version(current_user.id)
+    db.session.commit()
+
+    found = set(affected)
+    response.update({
+        "message": f"{len(affected)} bills affected",
+        "count": len(affected),
+        "missing": [bill_id for bill_id in data.ids if bill_id not in found],
+    })
+    return jsonify(response), 200
+
+
 @bills_bp.route("/<int:bill_id>", methods=["PUT"])
 @jwt_required()
 def update_bill(bill_id):
@@ -101,6 +561,7 @@ def update_bill(bill_id):
         return jsonify({"error": "Bill not found"}), 404
 
     data = request.get_json()
+    before = bill.summary_state()
 
     if "name" in data:
         bill.name = data["name"]
@@ -115,6 +576,8 @@ def update_bill(bill_id):
     if "notes" in data:
         bill.notes = data["notes"]
 
+    BillSummary.apply(current_user.id, before, bill.summary_state())
+    User.bump_data_version(current_user.id)
     db.session.commit()
 
     return jsonify({"message": "Bill updated", "bill": bill.to_dict()}), 200
@@ -128,7 +591,9 @@ def delete_bill(bill_id):
     if not bill:
         return jsonify({"error": "Bill not found"}), 404
 
+    BillSummary.apply(current_user.id, before=bill.summary_state())
     db.session.delete(bill)
+    User.bump_data_version(current_user.id)
     db.session.commit()
 
     return jsonify({"message": "Bill deleted"}), 200
@@ -142,8 +607,11 @@ def mark_bill_paid(bill_id):
     if not bill:
         return jsonify({"error": "Bill not found"}), 404
 
+    before = bill.summary_state()
     bill.is_paid = True
     bill.paid_date = datetime.now().date()
+    BillSummary.apply(current_user.id, before, bill.summary_state())
+    User.bump_data_version(current_user.id)
     db.session.commit()
 
     return jsonify({"message": "Bill marked as paid", "bill": bill.to_dict()}), 200
@@ -151,21 +619,8 @@ def mark_bill_paid(bill_id):
 
 @bills_bp.route("/summary", methods=["GET"])
 @jwt_required()
+@versioned
 def get_summary():
     """Get bill summary for dashboard."""
-    bills = Bill.query.filter_by(user_id=current_user.id).all()
-
-    total_bills = len(bills)
-    unpaid_bills = [b for b in bills if not b.is_paid]
-    overdue_bills = [b for b in unpaid_bills if b.is_overdue]
-
-    total_due = sum(float(b.amount) for b in unpaid_bills)
-    total_overdue = sum(float(b.amount) for b in overdue_bills)
-
-    return jsonify({
-        "total_bills": total_bills,
-        "unpaid_count": len(unpaid_bills),
-        "overdue_count": len(overdue_bills),
-        "total_due": round(total_due, 2),
-        "total_overdue": round(total_overdue, 2),
-    }), 200
+    summary = BillSummary.for_user(current_user.id)
+    return jsonify(summary.to_dict()), 200
@@ -0,0 +1,247 @@
+import asyncio
+import io
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from flask import g, jsonify, request
+from flask_jwt_extended import current_user, verify_jwt_in_request
+from pydantic import ValidationError
+from app.routes.bills import (
+    batch_parse_response,
+    parse_response,
+    queue_parse,
+    validate_batch_texts,
+    wants_queued_parse,
+)
+from app.security import BillBatchParse, BillNaturalLanguage
+from app.services import create_async_bill_parser
+
+ParseInput = namedtuple("ParseInput", ["user_id", "texts", "results", "pending"])
+ParseInput.__doc__ = "A validated parse request ready for Claude."
+
+# Request timing from the first phase carries over to the second
+_CARRIED = ("metrics_started", "db_queries", "db_time")
+
+
+class ParseASGIApp:
+    """
+    ASGI app serving the parse routes on an event loop.
+
+    POST /api/bills/parse and /api/bills/parse/batch behave as they do in
+    the Flask app, but the Claude calls go through AsyncBillParser, so a
+    worker waiting on Claude holds a coroutine rather than a thread and
+    one process can carry hundreds of parses at once. Authentication,
+    rate limits, validation and the database writes still run through
+    the Flask app's hooks and helpers, in a small thread pool.
+
+    Run with ``uvicorn app.asgi:app`` and send the two parse paths to it.
+    """
+
+    def __init__(self, flask_app, parser=None, db_threads=None):
+        self.flask_app = flask_app
+        self.parser = parser
+        self._batch_limit = None
+        self.executor = ThreadPoolExecutor(
+            max_workers=db_threads or flask_app.config.get("PARSE_ASGI_DB_THREADS", 8),
+            thread_name_prefix="parse-asgi",
+        )
+        self.routes = {
+            "/api/bills/parse": self.parse_bill,
+            "/api/bills/parse/batch": self.parse_bills_batch,
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        handler = self.routes.get(scope["path"])
+        if handler is None:
+            await _send_json(send, 404, b'{"error": "Not found"}')
+            return
+        if scope["method"] != "POST":
+            await _send_json(send, 405, b'{"error": "Method not allowed"}')
+            return
+
+        body = await _read_body(scope, receive, self.flask_app.config["PARSE_MAX_BODY_BYTES"])
+        if body is None:
+            await _send_json(send, 413, b'{"error": "Request body too large"}')
+            return
+        response = await handler(scope, body)
+        await send({
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in response.headers.items()
+            ],
+        })
+        await send({"type": "http.response.body", "body": response.get_data()})
+
+    async def parse_bill(self, scope, body):
+        prepared, carried = await self._in_request(scope, body, self._prepare_parse, first=True)
+        if not isinstance(prepared, ParseInput):
+            return prepared
+
+        text = prepared.texts[0]
+        result = await self.get_parser().parse_bill(text)
+        response, _ = await self._in_request(
+            scope, body, parse_response, prepared.user_id, text, result, carried=carried
+        )
+        return response
+
+    async def parse_bills_batch(self, scope, body):
+        prepared, carried = await self._in_request(scope, body, self._prepare_batch, first=True)
+        if not isinstance(prepared, ParseInput):
+            return prepared
+
+        parser = self.get_parser()
+        today = datetime.now()
+        # Shared by every batch request so the cap bounds the whole process
+        if self._batch_limit is None:
+            self._batch_limit = asyncio.Semaphore(self.flask_app.config["PARSE_BATCH_CONCURRENCY"])
+        limit = self._batch_limit
+
+        async def parse(text):
+            async with limit:
+                return await parser.parse_bill(text, today)
+
+        parsed = await asyncio.gather(*(parse(text) for _, text in prepared.pending))
+        response, _ = await self._in_request(
+            scope, body, batch_parse_response, prepared.user_id, prepared.texts,
+            prepared.results, prepared.pending, parsed, carried=carried,
+        )
+        return response
+
+    def get_parser(self):
+        # Built on first use so the client binds to the serving loop
+        if self.parser is None:
+            self.parser = create_async_bill_parser(self.flask_app.config)
+        return self.parser
+
+    def _prepare_parse(self):
+        verify_jwt_in_request()
+        try:
+            data = BillNaturalLanguage(**request.get_json())
+        except ValidationError as e:
+            return jsonify({"error": "Validation failed", "details": e.errors(include_context=False)}), 400
+
+        if wants_queued_parse():
+            return queue_parse(current_user.id, data.text)
+        return ParseInput(current_user.id, [data.text], None, None)
+
+    def _prepare_batch(self):
+        verify_jwt_in_request()
+        try:
+            data = BillBatchParse(**request.get_json())
+        except ValidationError as e:
+            return jsonify({"error": "Validation failed", "details": e.errors(include_context=False)}), 400
+
+        results, pending = validate_batch_texts(data.texts)
+        return ParseInput(current_user.id, data.texts, results, pending)
+
+    async def _in_request(self, scope, body, view, *args, first=False, carried=None):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self._call_in_request, scope, body, view, args, first, carried
+        )
+
+    def _call_in_request(self, scope, body, view, args, first, carried):
+        """
+        Run view inside a Flask request context built from the ASGI scope.
+
+        The first phase of a request runs the before_request hooks (rate
+        limits, metrics, database routing). A ParseInput is handed back
+        as is; anything else becomes a finished Flask response.
+        """
+        app = self.flask_app
+        with app.request_context(_wsgi_environ(scope, body)):
+            g.__dict__.update(carried or {})
+            try:
+                rv = app.preprocess_request() if first else None
+                if rv is None:
+                    rv = view(*args)
+            except Exception as e:
+                try:
+                    rv = app.handle_user_exception(e)
+                except Exception as unhandled:
+                    rv = app.handle_exception(unhandled)
+
+            if isinstance(rv, ParseInput):
+                return rv, {key: g.get(key) for key in _CARRIED if key in g}
+            return app.process_response(app.make_response(rv)), None
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                close = getattr(getattr(self.parser, "client", None), "close", None)
+                if close is not None:
+                    await close()
+                self.executor.shutdown(wait=True)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+async def _read_body(scope, receive, limit):
+    """Read the request body, or return None once it passes limit bytes."""
+    for name, value in scope.get("headers", []):
+        if name == b"content-length" and value.isdigit() and int(value) > limit:
+            return None
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > limit:
+            return None
+        chunks.append(chunk)
+        if not message.get("more_body"):
+            return b"".join(chunks)
+
+
+async def _send_json(send, status, body):
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json")],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+def _wsgi_environ(scope, body):
+    """Build a WSGI environ for an ASGI HTTP scope and its body."""
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": "",
+        "PATH_INFO": scope["path"],
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": client[0],
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    for name, value in scope.get("headers", []):
+        name = name.decode("latin-1").upper().replace("-", "_")
+        value = value.decode("latin-1")
+        if name == "CONTENT_LENGTH":
+            continue
+        key = name if name == "CONTENT_TYPE" else f"HTTP_{name}"
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
@@ -0,0 +1,7 @@
+from app import create_app
+from app.services import run_reminder_scheduler
+
+app = create_app()
+
+if __name__ == "__main__":
+    run_reminder_scheduler(app)
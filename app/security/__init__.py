@@ -1,19 +1,42 @@
 from app.security.auth import jwt, generate_tokens
+from app.security.hashing import PasswordHasher, get_password_hasher, init_password_hasher
+from app.security.identity import UserSnapshot, init_identity_cache
 from app.security.rate_limiter import limiter, rate_limit_exceeded_handler
 from app.security.validation import (
     UserRegistration,
     UserLogin,
     BillCreate,
+    BillChanges,
+    BillBulkOperation,
+    BillFieldsQuery,
+    BillListQuery,
+    BillPageQuery,
+    BillUpcomingQuery,
+    BillCalendarQuery,
     BillNaturalLanguage,
+    BillBatchParse,
 )
 
 __all__ = [
     "jwt",
     "generate_tokens",
+    "PasswordHasher",
+    "get_password_hasher",
+    "init_password_hasher",
+    "UserSnapshot",
+    "init_identity_cache",
     "limiter",
     "rate_limit_exceeded_handler",
     "UserRegistration",
     "UserLogin",
     "BillCreate",
+    "BillChanges",
+    "BillBulkOperation",
+    "BillFieldsQuery",
+    "BillListQuery",
+    "BillPageQuery",
+    "BillUpcomingQuery",
+    "BillCalendarQuery",
     "BillNaturalLanguage",
+    "BillBatchParse",
 ]
@@ -8,6 +8,7 @@ from flask_jwt_extended import (
     verify_jwt_in_request,
 )
 from app.models import User
+from app.security.identity import get_identity_cache
 
 jwt = JWTManager()
 
@@ -22,12 +23,21 @@ def user_identity_lookup(user):
 
 @jwt.user_lookup_loader
 def user_lookup_callback(_jwt_header, jwt_data):
-    """Load user from JWT identity."""
-    identity = jwt_data["sub"]
-    print(f"DEBUG: Looking up user with identity: {identity}")
-    user = User.query.filter_by(id=int(identity)).first()
-    print(f"DEBUG: Found user: {user}")
-    return user
+    """
+    Resolve the JWT identity to a cached user snapshot.
+
+    Disabled or deleted users resolve to None, which rejects the token.
+    """
+    snapshot = get_identity_cache().get(int(jwt_data["sub"]))
+    if snapshot is None or not snapshot.is_active:
+        return None
+    return snapshot
+
+
+@jwt.user_lookup_error_loader
+def user_lookup_error_callback(_jwt_header, jwt_data):
+    """Handle tokens for users that no longer exist or are disabled."""
+    return jsonify({"error": "User not found or disabled", "code": "user_not_found"}), 401
 
 
 @jwt.expired_token_loader
@@ -0,0 +1,114 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+import bcrypt
+from flask import current_app
+
+
+def _hashpw(password, rounds):
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+
+
+def _checkpw(password, hashed):
+    return bcrypt.checkpw(password, hashed)
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a bounded process pool so login bursts cannot take
+    every request thread's CPU.
+
+    With pool_size 0 hashing runs inline on the calling thread.
+    """
+
+    def __init__(self, rounds=12, pool_size=2):
+        self.rounds = rounds
+        self.pool_size = pool_size
+        self._pool = None
+        self._pool_pid = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stats = {
+            "hash": {"count": 0, "seconds_total": 0.0, "seconds_max": 0.0},
+            "verify": {"count": 0, "seconds_total": 0.0, "seconds_max": 0.0},
+        }
+
+    def hash(self, password):
+        """Hash a password at the configured cost."""
+        hashed = self._run("hash", _hashpw, password.encode("utf-8"), self.rounds)
+        return hashed.decode("utf-8")
+
+    def verify(self, password, hashed):
+        """Check a password against a stored hash."""
+        return self._run(
+            "verify", _checkpw, password.encode("utf-8"), hashed.encode("utf-8")
+        )
+
+    def needs_rehash(self, hashed):
+        """Check whether a stored hash uses a different cost than configured."""
+        try:
+            return int(hashed.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+    def stats(self):
+        """Return queue depth and latency totals for this process."""
+        with self._lock:
+            return {
+                "pool_size": self.pool_size,
+                "queue_depth": max(self._pending - self.pool_size, 0),
+                "in_flight": self._pending,
+                **{op: dict(values) for op, values in self._stats.items()},
+            }
+
+    def shutdown(self):
+        """Stop this process's worker pool, if one was started."""
+        with self._lock:
+            owned = self._pool_pid == os.getpid()
+            pool, self._pool, self._pool_pid = self._pool, None, None
+        if pool is not None and owned:
+            pool.shutdown(wait=True)
+
+    def _run(self, op, fn, *args):
+        started = time.perf_counter()
+        with self._lock:
+            self._pending += 1
+        try:
+            if self.pool_size <= 0:
+                return fn(*args)
+            return self._get_pool().submit(fn, *args).result()
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._pending -= 1
+                stats = self._stats[op]
+                stats["count"] += 1
+                stats["seconds_total"] += elapsed
+                stats["seconds_max"] = max(stats["seconds_max"], elapsed)
+
+    def _get_pool(self):
+        # A pool inherited across fork has no live workers, so each
+        # process builds its own on first use
+        if self._pool_pid != os.getpid():
+            with self._lock:
+                if self._pool_pid != os.getpid():
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.pool_size,
+                        mp_context=multiprocessing.get_context("forkserver"),
+                    )
+                    self._pool_pid = os.getpid()
+        return self._pool
+
+
+def init_password_hasher(app):
+    """Attach a password hasher configured from the app to the app."""
+    app.extensions["password_hasher"] = PasswordHasher(
+        rounds=app.config.get("BCRYPT_LOG_ROUNDS", 12),
+        pool_size=app.config.get("BCRYPT_POOL_SIZE", 2),
+    )
+
+
+def get_password_hasher():
+    return current_app.extensions["password_hasher"]
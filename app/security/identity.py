@@ -0,0 +1,111 @@
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from datetime import timedelta
+from flask import current_app
+from sqlalchemy import event
+from app.models import db, User
+
+UserSnapshot = namedtuple("UserSnapshot", ["id", "email", "is_active", "version"])
+UserSnapshot.__doc__ = "Lightweight stand-in for User on authenticated requests."
+
+_SNAPSHOT_COLUMNS = (User.id, User.email, User.is_active, User.updated_at)
+
+# Commits can land slightly after the updated_at they stamp, so each sync
+# looks back this far past the newest version it has already seen
+_SYNC_OVERLAP = timedelta(seconds=5)
+
+
+class IdentityCache:
+    """
+    Per-worker LRU cache of user snapshots for JWT user lookup.
+
+    Entries expire after ttl seconds. Every sync_interval seconds one
+    query picks up users whose updated_at version moved, so changes made
+    by other workers are seen within that bound. Updates made by this
+    worker evict the entry immediately.
+    """
+
+    def __init__(self, ttl=300, max_entries=10000, sync_interval=5):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.sync_interval = sync_interval
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_sync = time.monotonic()
+        self._high_water = None
+
+    def get(self, user_id):
+        """Return the cached snapshot for a user, loading it on a miss."""
+        if time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[1] > time.monotonic():
+                self._entries.move_to_end(user_id)
+                return entry[0]
+
+        row = db.session.query(*_SNAPSHOT_COLUMNS).filter(User.id == user_id).first()
+        if row is None:
+            return None
+        snapshot = UserSnapshot(*row)
+        self.put(snapshot)
+        return snapshot
+
+    def put(self, snapshot):
+        with self._lock:
+            self._entries[snapshot.id] = (snapshot, time.monotonic() + self.ttl)
+            self._entries.move_to_end(snapshot.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if snapshot.version and (
+                self._high_water is None or snapshot.version > self._high_water
+            ):
+                self._high_water = snapshot.version
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def sync(self):
+        """Evict cached users whose version changed since the last sync."""
+        self._last_sync = time.monotonic()
+        with self._lock:
+            if not self._entries or self._high_water is None:
+                return
+            since = self._high_water - _SYNC_OVERLAP
+
+        changed = db.session.query(*_SNAPSHOT_COLUMNS).filter(User.updated_at > since).all()
+        with self._lock:
+            for row in changed:
+                entry = self._entries.get(row.id)
+                if entry is not None and entry[0].version != row.updated_at:
+                    del self._entries[row.id]
+                if row.updated_at > self._high_water:
+                    self._high_water = row.updated_at
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def init_identity_cache(app):
+    """Attach a fresh identity cache to the app."""
+    app.extensions["identity_cache"] = IdentityCache(
+        ttl=app.config.get("IDENTITY_CACHE_TTL", 300),
+        max_entries=app.config.get("IDENTITY_CACHE_MAX_ENTRIES", 10000),
+        sync_interval=app.config.get("IDENTITY_SYNC_INTERVAL", 5),
+    )
+
+
+def get_identity_cache():
+    return current_app.extensions["identity_cache"]
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _evict_changed_user(mapper, connection, user):
+    cache = current_app.extensions.get("identity_cache")
+    if cache is not None:
+        cache.invalidate(user.id)
@@ -0,0 +1,161 @@
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+from limits.storage import Storage, storage_from_string
+
+
+class SQLiteStorage(Storage):
+    """
+    Rate limit counters in a SQLite file shared by every worker on a host.
+
+    URI form: ``sqlite:////absolute/path/to/ratelimit.db``.
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(self, uri, wrap_exceptions=False, **options):
+        self.path = urllib.parse.urlparse(uri).path
+        self._local = threading.local()
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    @property
+    def base_exceptions(self):
+        return sqlite3.Error
+
+    def _connect(self):
+        # sqlite3 connections must not cross threads or forks
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits ("
+                "key TEXT PRIMARY KEY, value INTEGER NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def incr(self, key, expiry, amount=1):
+        now = time.time()
+        row = self._connect().execute(
+            "INSERT INTO rate_limits (key, value, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET "
+            "value = CASE WHEN expires_at <= ? THEN excluded.value ELSE value + excluded.value END, "
+            "expires_at = CASE WHEN expires_at <= ? THEN excluded.expires_at ELSE expires_at END "
+            "RETURNING value",
+            (key, amount, now + expiry, now, now),
+        ).fetchone()
+        return row[0]
+
+    def get(self, key):
+        row = self._connect().execute(
+            "SELECT value FROM rate_limits WHERE key = ? AND expires_at > ?",
+            (key, time.time()),
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get_expiry(self, key):
+        row = self._connect().execute(
+            "SELECT expires_at FROM rate_limits WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row and row[0] > time.time() else time.time()
+
+    def check(self):
+        try:
+            self._connect().execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self):
+        cursor = self._connect().execute("DELETE FROM rate_limits")
+        return cursor.rowcount
+
+    def clear(self, key):
+        self._connect().execute("DELETE FROM rate_limits WHERE key = ?", (key,))
+
+
+class BatchedStorage(Storage):
+    """
+    Local token counting in front of a shared rate limit storage.
+
+    Hits are counted in process and pushed to the shared storage once
+    sync_batch hits build up or sync_interval seconds pass, so most
+    limit checks cost no storage round trip. Across all workers a limit
+    can be overshot by at most (workers - 1) * sync_batch hits per
+    window.
+
+    URI form: ``batched+<shared storage uri>``, for example
+    ``batched+sqlite:////tmp/ratelimit.db`` or ``batched+redis://host:6379``.
+    """
+
+    STORAGE_SCHEME = ["batched+sqlite", "batched+redis", "batched+memory"]
+
+    def __init__(self, uri, wrap_exceptions=False, sync_batch=10, sync_interval=1.0,
+                 **options):
+        self.sync_batch = int(sync_batch)
+        self.sync_interval = float(sync_interval)
+        self.shared = storage_from_string(uri.split("+", 1)[1], **options)
+        self._counters = {}
+        self._lock = threading.Lock()
+        super().__init__(uri, wrap_exceptions=wrap_exceptions)
+
+    @property
+    def base_exceptions(self):
+        return self.shared.base_exceptions
+
+    def incr(self, key, expiry, amount=1):
+        now = time.time()
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is None or counter["expires_at"] <= now:
+                counter = {"synced": 0, "pending": 0, "expires_at": 0.0, "synced_at": 0.0}
+                self._counters[key] = counter
+            counter["pending"] += amount
+            due = (
+                counter["pending"] >= self.sync_batch
+                or now - counter["synced_at"] >= self.sync_interval
+            )
+            if not due:
+                return counter["synced"] + counter["pending"]
+            pending = counter["pending"]
+            counter["pending"] = 0
+
+        synced = self.shared.incr(key, expiry, amount=pending)
+        expires_at = self.shared.get_expiry(key)
+        with self._lock:
+            counter["synced"] = synced
+            counter["synced_at"] = now
+            counter["expires_at"] = expires_at
+            return synced + counter["pending"]
+
+    def get(self, key):
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is not None and counter["expires_at"] > time.time():
+                return counter["synced"] + counter["pending"]
+        return self.shared.get(key)
+
+    def get_expiry(self, key):
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is not None and counter["expires_at"] > time.time():
+                return counter["expires_at"]
+        return self.shared.get_expiry(key)
+
+    def check(self):
+        return self.shared.check()
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+        return self.shared.reset()
+
+    def clear(self, key):
+        with self._lock:
+            self._counters.pop(key, None)
+        self.shared.clear(key)
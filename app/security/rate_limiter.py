@@ -1,19 +1,37 @@
 from flask import jsonify
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+from flask_jwt_extended.exceptions import JWTExtendedException
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from jwt.exceptions import PyJWTError
+# Registers the sqlite:// and batched+ storage schemes with limits
+from app.security import rate_limit_storage  # noqa: F401
 
+
+def rate_limit_key():
+    """Key limits by JWT identity when the request carries a valid token."""
+    try:
+        verify_jwt_in_request(optional=True)
+        identity = get_jwt_identity()
+    except (JWTExtendedException, PyJWTError):
+        identity = None
+    if identity:
+        return f"user:{identity}"
+    return get_remote_address()
+
+
+# Storage comes from RATELIMIT_STORAGE_URI so each environment can choose
 limiter = Limiter(
-    key_func=get_remote_address,
+    key_func=rate_limit_key,
     default_limits=["100 per hour"],
-    storage_uri="memory://",
 )
 
 
 @limiter.request_filter
 def ip_whitelist():
-    """Skip rate limiting for health checks."""
+    """Skip rate limiting for health checks and metrics scrapes."""
     from flask import request
-    return request.endpoint == "health"
+    return request.endpoint in ("health", "metrics")
 
 
 def rate_limit_exceeded_handler(e):
@@ -1,7 +1,10 @@
 import re
-from datetime import datetime, date
-from pydantic import BaseModel, EmailStr, field_validator
-from typing import Optional
+from datetime import datetime, date, timedelta
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
+from typing import List, Literal, Optional
+from app.models import Bill
+
+FREQUENCIES = ["one-time", "weekly", "monthly", "quarterly", "yearly"]
 
 
 class UserRegistration(BaseModel):
@@ -85,12 +88,138 @@ class BillCreate(BaseModel):
     @field_validator("frequency")
     @classmethod
     def validate_frequency(cls, v):
-        allowed = ["one-time", "weekly", "monthly", "quarterly", "yearly"]
-        if v not in allowed:
-            raise ValueError(f"Frequency must be one of: {', '.join(allowed)}")
+        if v not in FREQUENCIES:
+            raise ValueError(f"Frequency must be one of: {', '.join(FREQUENCIES)}")
+        return v
+
+
+class BillFieldsQuery(BaseModel):
+    """Validate a comma separated ``fields`` selection of bill fields."""
+
+    fields: Optional[List[str]] = None
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def split_fields(cls, v):
+        if isinstance(v, str):
+            return [name.strip() for name in v.split(",") if name.strip()]
+        return v
+
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, v):
+        if v is None:
+            return v
+        unknown = [name for name in v if name not in Bill.FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        # id and due_date are always needed for pagination cursors
+        wanted = set(v) | {"id", "due_date"}
+        return [name for name in Bill.FIELDS if name in wanted]
+
+
+class BillChanges(BillCreate):
+    """Validate a partial bill update; only fields that are sent change."""
+
+    name: str = None
+    amount: float = None
+    due_date: str = None
+    frequency: str = None
+
+    @model_validator(mode="after")
+    def validate_not_empty(self):
+        if not self.model_fields_set:
+            raise ValueError("Provide at least one field to change")
+        return self
+
+
+class BillBulkOperation(BaseModel):
+    """Validate a bulk pay, delete or update request."""
+
+    ids: List[int]
+    op: Literal["pay", "delete", "update"]
+    changes: Optional[BillChanges] = None
+
+    @field_validator("ids")
+    @classmethod
+    def validate_ids(cls, v):
+        v = list(dict.fromkeys(v))
+        if len(v) < 1:
+            raise ValueError("Provide at least one bill id")
+        if len(v) > 500:
+            raise ValueError("Too many bills (max 500 per request)")
+        return v
+
+    @model_validator(mode="after")
+    def validate_changes(self):
+        if self.op == "update" and self.changes is None:
+            raise ValueError("Update requires changes")
+        if self.op != "update" and self.changes is not None:
+            raise ValueError("Changes are only allowed with update")
+        return self
+
+
+class BillPageQuery(BillFieldsQuery):
+    """Validate pagination query parameters."""
+
+    limit: int = 50
+    cursor: Optional[str] = None
+
+    @field_validator("limit")
+    @classmethod
+    def validate_limit(cls, v):
+        if v < 1 or v > 200:
+            raise ValueError("Limit must be between 1 and 200")
+        return v
+
+
+class BillListQuery(BillPageQuery):
+    """Validate bill listing query parameters."""
+
+    is_paid: Optional[bool] = None
+    category: Optional[str] = None
+    frequency: Optional[str] = None
+    due_from: Optional[date] = None
+    due_to: Optional[date] = None
+
+    @field_validator("frequency")
+    @classmethod
+    def validate_frequency(cls, v):
+        if v is not None and v not in FREQUENCIES:
+            raise ValueError(f"Frequency must be one of: {', '.join(FREQUENCIES)}")
         return v
 
 
+class BillUpcomingQuery(BillPageQuery):
+    """Validate upcoming bills query parameters."""
+
+    days: int = 7
+
+    @field_validator("days")
+    @classmethod
+    def validate_days(cls, v):
+        if v < 0 or v > 365:
+            raise ValueError("Days must be between 0 and 365")
+        return v
+
+
+class BillCalendarQuery(BaseModel):
+    """Validate calendar window query parameters."""
+
+    start: Optional[date] = Field(default=None, alias="from")
+    end: Optional[date] = Field(default=None, alias="to")
+
+    @model_validator(mode="after")
+    def validate_window(self):
+        self.start = self.start or date.today()
+        self.end = self.end or self.start + timedelta(days=30)
+        if self.end < self.start:
+            raise ValueError("End date must not be before start date")
+        if (self.end - self.start).days > 366:
+            raise ValueError("Calendar window is limited to 366 days")
+        return self
+
+
 class BillNaturalLanguage(BaseModel):
     """Validate natural language bill input."""
 
@@ -105,3 +234,18 @@ class BillNaturalLanguage(BaseModel):
         if len(v) > 500:
             raise ValueError("Input is too long (max 500 characters)")
         return v
+
+
+class BillBatchParse(BaseModel):
+    """Validate a batch of natural language bill descriptions."""
+
+    texts: List[str]
+
+    @field_validator("texts")
+    @classmethod
+    def validate_texts(cls, v):
+        if len(v) < 1:
+            raise ValueError("Provide at least one bill description")
+        if len(v) > 50:
+            raise ValueError("Too many bills (max 50 per batch)")
+        return v
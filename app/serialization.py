@@ -0,0 +1,43 @@
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson.
+
+    Output matches the default provider: keys are sorted, and dates and
+    any type orjson does not handle natively go through Flask's default
+    encoder. Responses are encoded straight to bytes.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return self._dumpb(obj, kwargs.get("indent")).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        import orjson
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            self._dumpb(obj, indent) + b"\n", mimetype=self.mimetype
+        )
+
+    def _dumpb(self, obj, indent=False):
+        import orjson
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+
+def orjson_available():
+    """Check whether the optional orjson dependency is installed."""
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        return False
+    return True
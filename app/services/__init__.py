@@ -1,3 +1,63 @@
-from app.services.ai_parser import BillParser
+from app.services.ai_parser import (
+    AsyncBillParser,
+    BillParser,
+    ParseCache,
+    create_async_bill_parser,
+    get_claude_breaker,
+    get_parse_executor,
+    get_bill_parser,
+    get_parse_cache,
+)
+from app.services.exporter import (
+    EXPORT_FORMATS,
+    EXPORT_MIMETYPES,
+    EXPORTERS,
+    arrow_available,
+    iter_bill_rows,
+)
+from app.services.fast_parser import FastBillParser
+from app.services.importer import IMPORT_FORMATS, import_bills, iter_rows
+from app.services.occurrences import expand_bills, occurrence_dates, render_ics
+from app.services.pagination import paginate_bills
+from app.services.reminders import (
+    LogNotifier,
+    ReminderScheduler,
+    SMTPNotifier,
+    WebhookNotifier,
+    create_reminder_scheduler,
+    run_reminder_scheduler,
+)
+from app.services.parse_jobs import init_parse_jobs, run_pending_jobs, submit_parse_job
 
-__all__ = ["BillParser"]
+__all__ = [
+    "AsyncBillParser",
+    "BillParser",
+    "create_async_bill_parser",
+    "get_claude_breaker",
+    "get_parse_executor",
+    "EXPORT_FORMATS",
+    "EXPORT_MIMETYPES",
+    "EXPORTERS",
+    "arrow_available",
+    "iter_bill_rows",
+    "FastBillParser",
+    "IMPORT_FORMATS",
+    "import_bills",
+    "iter_rows",
+    "ParseCache",
+    "get_bill_parser",
+    "get_parse_cache",
+    "expand_bills",
+    "occurrence_dates",
+    "render_ics",
+    "paginate_bills",
+    "init_parse_jobs",
+    "run_pending_jobs",
+    "submit_parse_job",
+    "LogNotifier",
+    "ReminderScheduler",
+    "SMTPNotifier",
+    "WebhookNotifier",
+    "create_reminder_scheduler",
+    "run_reminder_scheduler",
+]
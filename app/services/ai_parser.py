@@ -1,86 +1,821 @@
 import os
+import sys
 import json
+import time
+import random
+import asyncio
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from anthropic import Anthropic
+from app.metrics import CLAUDE_BREAKER_STATE, CLAUDE_RETRIES, PARSE_REQUESTS, record_claude_call
+from app.services.fast_parser import FastBillParser
 
+logger = logging.getLogger(__name__)
 
-class BillParser:
-    """Parse natural language bill descriptions using Claude AI."""
 
-    def __init__(self):
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable is required")
-        self.client = Anthropic(api_key=api_key)
+def finalize_bill_data(bill_data, today):
+    """
+    Check and complete parsed bill fields.
 
-    def parse_bill(self, text):
-        """
-        Parse natural language text into structured bill data.
-        """
-        today = datetime.now()
-        today_str = today.strftime("%Y-%m-%d")
-        current_year = today.year
+    Shared by every parse path so they agree on defaults. Raises
+    ValueError when required fields are missing or invalid.
+    """
+    required_fields = ["name", "amount"]
+    for field in required_fields:
+        if field not in bill_data:
+            raise ValueError(f"Missing required field: {field}")
+
+    bill_data["amount"] = float(bill_data["amount"])
+    if bill_data["amount"] <= 0:
+        raise ValueError("Amount must be greater than 0")
+
+    # Handle missing or null due_date
+    if not bill_data.get("due_date"):
+        next_month = today.replace(day=1) + timedelta(days=32)
+        bill_data["due_date"] = next_month.replace(day=1).strftime("%Y-%m-%d")
+
+    # Validate date format
+    datetime.strptime(bill_data["due_date"], "%Y-%m-%d")
+
+    if not bill_data.get("frequency"):
+        bill_data["frequency"] = "one-time"
+    if not bill_data.get("category"):
+        bill_data["category"] = "other"
 
-        prompt = f"""Parse this bill description into structured data. Today's date is {today_str}.
+    return bill_data
 
-Bill description: "{text}"
+
+# Everything that does not change between calls, sent as the system block.
+# It is not marked for prompt caching: Sonnet only caches prefixes of at
+# least 1024 tokens and these instructions are far shorter. Add
+# cache_control if the block ever grows past that.
+PARSE_INSTRUCTIONS = """Parse the bill description in the user's message into structured data. The message also gives today's date.
 
 Extract the following fields:
 - name: The bill name (e.g., "Electric bill", "Netflix subscription")
 - amount: The dollar amount as a number (e.g., 150.00)
-- due_date: The due date in YYYY-MM-DD format. If only month/day given, assume year {current_year} or {current_year + 1} if the date has passed. If no date is mentioned and it's a recurring bill, use the 1st of next month.
+- due_date: The due date in YYYY-MM-DD format. If only month/day given, assume the current year, or next year if the date has passed. If no date is mentioned and it's a recurring bill, use the 1st of next month.
 - frequency: One of "one-time", "weekly", "monthly", "quarterly", "yearly". Default to "monthly" for subscriptions, "one-time" otherwise.
 - category: One of "utilities", "subscription", "insurance", "rent", "loan", "medical", "other"
 
 IMPORTANT: Always provide a due_date, never null. If unclear, default to the 1st of next month.
 
 Respond ONLY with valid JSON, no other text. Example:
-{{"name": "Electric bill", "amount": 150.00, "due_date": "2026-01-15", "frequency": "one-time", "category": "utilities"}}"""
+{"name": "Electric bill", "amount": 150.00, "due_date": "2026-01-15", "frequency": "one-time", "category": "utilities"}"""
 
-        try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=200,
-                messages=[{"role": "user", "content": prompt}],
+
+class StreamedReply:
+    """
+    Collects a streamed Claude reply and spots the end of its JSON object.
+
+    feed() tracks brace depth outside of strings, so the caller can close
+    the stream as soon as the top-level object is complete instead of
+    waiting for the rest of the response.
+    """
+
+    def __init__(self, started=None):
+        self.started = started or time.perf_counter()
+        self.first_token_seconds = None
+        self.usage = None
+        self._parts = []
+        self._length = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._start = None
+        self._end = None
+
+    def feed(self, chunk):
+        """Add streamed text; return True once a complete object has arrived."""
+        if self.first_token_seconds is None:
+            self.first_token_seconds = time.perf_counter() - self.started
+        offset = self._length
+        self._parts.append(chunk)
+        self._length += len(chunk)
+        if self._end is not None:
+            return True
+
+        for i, char in enumerate(chunk):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"' and self._depth:
+                self._in_string = True
+            elif char == "{":
+                if not self._depth and self._start is None:
+                    self._start = offset + i
+                self._depth += 1
+            elif char == "}" and self._depth:
+                self._depth -= 1
+                if not self._depth:
+                    self._end = offset + i + 1
+                    return True
+        return False
+
+    @property
+    def text(self):
+        """The first complete object, or all text so far if none has closed."""
+        text = "".join(self._parts)
+        return text if self._end is None else text[self._start:self._end]
+
+
+def is_retryable(error):
+    """Whether a failed Claude call may succeed if simply tried again."""
+    status = getattr(error, "status_code", None)
+    if status is not None:
+        # Timeouts, conflicts, rate limits and overload (529) are transient
+        return status in (408, 409, 429) or status >= 500
+    anthropic = sys.modules.get("anthropic")
+    if anthropic is not None and isinstance(error, anthropic.APIConnectionError):
+        return True
+    return isinstance(error, (TimeoutError, ConnectionError))
+
+
+class CircuitBreaker:
+    """
+    Fails Claude calls fast while the upstream error rate is high.
+
+    Outcomes from the last ``window`` seconds are kept. Once at least
+    ``min_calls`` are in the window and the share of failures reaches
+    ``failure_rate``, the breaker opens and calls are refused for
+    ``cooldown`` seconds. A single probe call is then let through
+    (half-open): success closes the breaker, failure opens it again.
+
+    Only retryable errors count as failures; any other answer shows the
+    API is up. Callers pair every allowed call with release() in a
+    finally block, so a half-open probe that ends without a record (for
+    example when it is cancelled) frees the permit for the next call.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_rate=0.5, min_calls=10, window=60, cooldown=30,
+                 clock=time.monotonic):
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window = window
+        self.cooldown = cooldown
+        self.clock = clock
+        self.times_opened = 0
+        self._state = self.CLOSED
+        self._opened_at = None
+        self._probing = False
+        self._outcomes = deque()
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Return True if a call may go ahead now."""
+        with self._lock:
+            if self._state == self.OPEN:
+                if self.clock() - self._opened_at < self.cooldown:
+                    return False
+                self._set_state(self.HALF_OPEN)
+            if self._state == self.HALF_OPEN:
+                if self._probing:
+                    return False
+                self._probing = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._outcomes.clear()
+                self._set_state(self.CLOSED)
+            else:
+                self._record(True)
+
+    def record_failure(self):
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._open()
+                return
+            self._record(False)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            if (
+                self._state == self.CLOSED
+                and len(self._outcomes) >= self.min_calls
+                and failures / len(self._outcomes) >= self.failure_rate
+            ):
+                self._open()
+
+    def release(self):
+        """Free the half-open probe permit if its call ended without a record."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._probing = False
+
+    def stats(self):
+        """Return the breaker state and the outcomes in its window."""
+        with self._lock:
+            self._prune(self.clock())
+            stats = {
+                "state": self._state,
+                "calls": len(self._outcomes),
+                "failures": sum(1 for _, ok in self._outcomes if not ok),
+                "times_opened": self.times_opened,
+            }
+            if self._state == self.OPEN:
+                remaining = self.cooldown - (self.clock() - self._opened_at)
+                stats["retry_in_seconds"] = round(max(remaining, 0), 1)
+            return stats
+
+    def _open(self):
+        self._opened_at = self.clock()
+        self.times_opened += 1
+        self._set_state(self.OPEN)
+
+    def _set_state(self, state):
+        self._state = state
+        self._probing = False
+        CLAUDE_BREAKER_STATE.set({self.CLOSED: 0, self.HALF_OPEN: 1, self.OPEN: 2}[state])
+
+    def _record(self, ok):
+        now = self.clock()
+        self._outcomes.append((now, ok))
+        self._prune(now)
+
+    def _prune(self, now):
+        while self._outcomes and self._outcomes[0][0] <= now - self.window:
+            self._outcomes.popleft()
+
+
+class MemoryCacheBackend:
+    """Thread-safe in-process LRU cache with per-entry expiry."""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCacheBackend:
+    """LRU cache with expiry in a SQLite file shared by all workers on a host."""
+
+    def __init__(self, path, max_entries=10000):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._writes = 0
+
+    def _connect(self):
+        # sqlite3 connections must not cross threads or forks
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS parse_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
             )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key):
+        conn = self._connect()
+        now = time.time()
+        row = conn.execute(
+            "SELECT value FROM parse_cache WHERE key = ? AND expires_at > ?",
+            (key, now),
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute(
+            "UPDATE parse_cache SET accessed_at = ? WHERE key = ?", (now, key)
+        )
+        return json.loads(row[0])
+
+    def set(self, key, value, ttl):
+        conn = self._connect()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO parse_cache VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value), now + ttl, now),
+        )
+        self._writes += 1
+        if self._writes % 100 == 0:
+            self._prune(conn, now)
+
+    def _prune(self, conn, now):
+        conn.execute("DELETE FROM parse_cache WHERE expires_at <= ?", (now,))
+        conn.execute(
+            "DELETE FROM parse_cache WHERE key IN ("
+            "SELECT key FROM parse_cache ORDER BY accessed_at DESC "
+            "LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def clear(self):
+        self._connect().execute("DELETE FROM parse_cache")
+
+
+class ParseCache:
+    """Cache of successful parse results keyed on normalized text and date."""
+
+    def __init__(self, backend, ttl=3600):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(text, today_str):
+        """Relative dates in the text resolve against today, so both are keyed."""
+        normalized = " ".join(text.casefold().split())
+        return hashlib.sha256(f"{today_str}\n{normalized}".encode("utf-8")).hexdigest()
+
+    def get(self, text, today_str):
+        value = self.backend.get(self.make_key(text, today_str))
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, text, today_str, value):
+        self.backend.set(self.make_key(text, today_str), value, self.ttl)
+
+    def stats(self):
+        """Return hit/miss counters for this process."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+_parse_cache = None
+_parse_cache_lock = threading.Lock()
+
+
+def get_parse_cache(config):
+    """Return the process-wide parse cache, creating it from config on first use."""
+    global _parse_cache
+    if config.get("PARSE_CACHE_BACKEND", "memory") == "none":
+        return None
+    if _parse_cache is None:
+        with _parse_cache_lock:
+            if _parse_cache is None:
+                _parse_cache = create_parse_cache(config)
+    return _parse_cache
+
+
+def create_parse_cache(config):
+    """Build a parse cache for the configured backend."""
+    backend_name = config.get("PARSE_CACHE_BACKEND", "memory")
+    max_entries = config.get("PARSE_CACHE_MAX_ENTRIES", 1024)
+    if backend_name == "memory":
+        backend = MemoryCacheBackend(max_entries)
+    elif backend_name == "sqlite":
+        backend = SQLiteCacheBackend(config["PARSE_CACHE_PATH"], max_entries)
+    else:
+        raise ValueError(f"Unknown parse cache backend: {backend_name}")
+    return ParseCache(backend, ttl=config.get("PARSE_CACHE_TTL", 3600))
+
+
+def create_anthropic_client(config):
+    """Build an Anthropic client whose connection pool is sized from config."""
+    # The SDK takes seconds to import, so only processes that call Claude pay for it
+    from anthropic import Anthropic, DefaultHttpxClient, DEFAULT_CONNECTION_LIMITS
+
+    api_key = config.get("ANTHROPIC_API_KEY") or os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY environment variable is required")
 
-            result_text = response.content[0].text.strip()
-            bill_data = json.loads(result_text)
+    # Build Limits from the httpx the installed SDK was built against
+    limits = type(DEFAULT_CONNECTION_LIMITS)(
+        max_connections=config.get("ANTHROPIC_MAX_CONNECTIONS", 20),
+        max_keepalive_connections=config.get("ANTHROPIC_MAX_KEEPALIVE", 10),
+        keepalive_expiry=config.get("ANTHROPIC_KEEPALIVE_EXPIRY", 30.0),
+    )
+    # BillParser retries within its own latency budget, so the SDK must not
+    return Anthropic(
+        api_key=api_key,
+        http_client=DefaultHttpxClient(limits=limits),
+        timeout=config.get("ANTHROPIC_TIMEOUT", 15.0),
+        max_retries=0,
+    )
 
-            required_fields = ["name", "amount"]
-            for field in required_fields:
-                if field not in bill_data:
-                    raise ValueError(f"Missing required field: {field}")
 
-            bill_data["amount"] = float(bill_data["amount"])
-            if bill_data["amount"] <= 0:
-                raise ValueError("Amount must be greater than 0")
+def create_async_anthropic_client(config):
+    """Build an AsyncAnthropic client with the same pool limits as the sync one."""
+    from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient, DEFAULT_CONNECTION_LIMITS
 
-            # Handle missing or null due_date
-            if not bill_data.get("due_date"):
-                next_month = today.replace(day=1) + timedelta(days=32)
-                bill_data["due_date"] = next_month.replace(day=1).strftime("%Y-%m-%d")
-            
-            # Validate date format
-            datetime.strptime(bill_data["due_date"], "%Y-%m-%d")
+    api_key = config.get("ANTHROPIC_API_KEY") or os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY environment variable is required")
 
-            if "frequency" not in bill_data:
-                bill_data["frequency"] = "one-time"
-            if "category" not in bill_data:
-                bill_data["category"] = "other"
+    limits = type(DEFAULT_CONNECTION_LIMITS)(
+        max_connections=config.get("ANTHROPIC_MAX_CONNECTIONS", 20),
+        max_keepalive_connections=config.get("ANTHROPIC_MAX_KEEPALIVE", 10),
+        keepalive_expiry=config.get("ANTHROPIC_KEEPALIVE_EXPIRY", 30.0),
+    )
+    return AsyncAnthropic(
+        api_key=api_key,
+        http_client=DefaultAsyncHttpxClient(limits=limits),
+        timeout=config.get("ANTHROPIC_TIMEOUT", 15.0),
+        max_retries=0,
+    )
 
-            return {"success": True, "data": bill_data}
+
+def create_async_bill_parser(config):
+    """
+    Build an AsyncBillParser configured like the shared BillParser.
+
+    Async clients are bound to the event loop they first run on, so each
+    loop should build its own parser rather than share one per process.
+    """
+    return AsyncBillParser(
+        client=create_async_anthropic_client(config),
+        cache=get_parse_cache(config),
+        fast_parser=FastBillParser(),
+        fast_path_threshold=config.get("PARSE_FAST_PATH_THRESHOLD", 0.8),
+        **_resilience_options(config),
+    )
+
+
+def _resilience_options(config):
+    return {
+        "timeout": config.get("ANTHROPIC_TIMEOUT", 15.0),
+        "max_retries": config.get("ANTHROPIC_MAX_RETRIES", 2),
+        "retry_base_delay": config.get("ANTHROPIC_RETRY_BASE_DELAY", 0.25),
+        "retry_max_delay": config.get("ANTHROPIC_RETRY_MAX_DELAY", 2.0),
+        "breaker": get_claude_breaker(config),
+    }
+
+
+_claude_breaker = None
+_claude_breaker_lock = threading.Lock()
+
+
+def get_claude_breaker(config):
+    """Return the process-wide circuit breaker shared by every parser."""
+    global _claude_breaker
+    if _claude_breaker is None:
+        with _claude_breaker_lock:
+            if _claude_breaker is None:
+                _claude_breaker = CircuitBreaker(
+                    failure_rate=config.get("CLAUDE_BREAKER_FAILURE_RATE", 0.5),
+                    min_calls=config.get("CLAUDE_BREAKER_MIN_CALLS", 10),
+                    window=config.get("CLAUDE_BREAKER_WINDOW", 60),
+                    cooldown=config.get("CLAUDE_BREAKER_COOLDOWN", 30),
+                )
+    return _claude_breaker
+
+
+_bill_parser = None
+_bill_parser_lock = threading.Lock()
+
+
+def get_bill_parser(config):
+    """
+    Return this worker's shared BillParser, creating it on first use.
+
+    The parser and its HTTP connection pool are reused across requests.
+    A forked child starts without one so it never shares sockets with
+    its parent.
+    """
+    global _bill_parser
+    if _bill_parser is None:
+        with _bill_parser_lock:
+            if _bill_parser is None:
+                _bill_parser = BillParser(
+                    client=create_anthropic_client(config),
+                    cache=get_parse_cache(config),
+                    fast_parser=FastBillParser(),
+                    fast_path_threshold=config.get("PARSE_FAST_PATH_THRESHOLD", 0.8),
+                    **_resilience_options(config),
+                )
+    return _bill_parser
+
+
+_parse_executor = None
+_parse_executor_lock = threading.Lock()
+
+
+def get_parse_executor(config):
+    """
+    Return this worker's shared pool for batch parse calls.
+
+    Its PARSE_BATCH_CONCURRENCY threads bound the batch Claude calls in
+    flight across every request in the process, not per request.
+    """
+    global _parse_executor
+    if _parse_executor is None:
+        with _parse_executor_lock:
+            if _parse_executor is None:
+                _parse_executor = ThreadPoolExecutor(
+                    max_workers=config.get("PARSE_BATCH_CONCURRENCY", 8),
+                    thread_name_prefix="parse-batch",
+                )
+    return _parse_executor
+
+
+def _reset_after_fork():
+    global _bill_parser, _bill_parser_lock, _claude_breaker, _claude_breaker_lock
+    global _parse_executor, _parse_executor_lock
+    _bill_parser = None
+    _bill_parser_lock = threading.Lock()
+    _claude_breaker = None
+    _claude_breaker_lock = threading.Lock()
+    # The parent's pool threads do not exist in the child
+    _parse_executor = None
+    _parse_executor_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class BillParser:
+    """
+    Parse natural language bill descriptions using Claude AI.
+
+    Each Claude call gets a latency budget of ``timeout`` seconds. Within
+    that budget, retryable errors are tried again up to ``max_retries``
+    times, after a random wait of up to retry_base_delay * 2**attempt
+    (capped at retry_max_delay). While the circuit breaker is open, or
+    once retries run out, the rule-based parse is used if it found a
+    bill, however low its confidence; otherwise the result is marked
+    unavailable so callers can answer 503.
+    """
+
+    def __init__(self, client=None, cache=None, fast_parser=None, fast_path_threshold=0.8,
+                 timeout=15.0, max_retries=2, retry_base_delay=0.25, retry_max_delay=2.0,
+                 breaker=None):
+        if client is None:
+            api_key = os.environ.get("ANTHROPIC_API_KEY")
+            if not api_key:
+                raise ValueError("ANTHROPIC_API_KEY environment variable is required")
+            from anthropic import Anthropic
+            client = Anthropic(api_key=api_key, timeout=timeout, max_retries=0)
+        self.client = client
+        self.cache = cache
+        self.fast_parser = fast_parser
+        self.fast_path_threshold = fast_path_threshold
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.breaker = breaker or CircuitBreaker()
+
+    def parse_bill(self, text, today=None):
+        """
+        Parse natural language text into structured bill data.
+
+        Relative dates resolve against ``today`` (defaults to now).
+        """
+        today = today or datetime.now()
+        result = self._parse_locally(text, today)
+        if result is not None:
+            return result
+        if not self.breaker.allow():
+            return self._claude_unavailable(text, today)
+        try:
+            return self._call_claude(text, today)
+        finally:
+            self.breaker.release()
+
+    def _call_claude(self, text, today):
+        PARSE_REQUESTS.inc(source="claude")
+        started = time.perf_counter()
+        deadline = started + self.timeout
+        attempt = 0
+        while True:
+            reply = StreamedReply(started)
+            try:
+                request = self._claude_request(text, today)
+                request["timeout"] = deadline - time.perf_counter()
+                with self.client.messages.stream(**request) as stream:
+                    for chunk in stream.text_stream:
+                        # Leaving the block closes the response, so stop at the object's end
+                        if reply.feed(chunk):
+                            break
+                        _check_deadline(deadline)
+                    reply.usage = stream.current_message_snapshot.usage
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, deadline)
+                if delay is None:
+                    return self._claude_failed(e, reply, text, today)
+                time.sleep(delay)
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            return self._claude_result(reply, text, today)
+
+    def _parse_locally(self, text, today):
+        """Answer from the rule-based parser or the cache, or return None."""
+        if self.fast_parser is not None:
+            bill_data, confidence = self.fast_parser.parse(text, today)
+            if bill_data is not None and confidence >= self.fast_path_threshold:
+                try:
+                    bill_data = finalize_bill_data(bill_data, today)
+                    PARSE_REQUESTS.inc(source="rules")
+                    return {"success": True, "data": bill_data, "source": "rules"}
+                except ValueError:
+                    pass
+
+        if self.cache is not None:
+            cached = self.cache.get(text, today.strftime("%Y-%m-%d"))
+            if cached is not None:
+                PARSE_REQUESTS.inc(source="cache")
+                return {"success": True, "data": dict(cached), "source": "cache"}
+        return None
+
+    def _claude_request(self, text, today):
+        """Return the messages.stream arguments for one parse."""
+        prompt = (
+            f"Today's date is {today.strftime('%Y-%m-%d')}.\n\n"
+            f'Bill description: "{text}"'
+        )
+
+        return {
+            "model": "claude-sonnet-4-20250514",
+            "max_tokens": 200,
+            "system": [
+                {"type": "text", "text": PARSE_INSTRUCTIONS},
+            ],
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    def _retry_delay(self, error, attempt, deadline):
+        """
+        Record a failed attempt and return how long to wait before retrying.
+
+        Returns None when the error is not retryable, retries are used up,
+        the wait would run past the deadline or the breaker has opened.
+        """
+        if not is_retryable(error):
+            # The API answered, so this says nothing about its health
+            self.breaker.record_success()
+            return None
+        self.breaker.record_failure()
+        if attempt >= self.max_retries:
+            return None
+        delay = random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** attempt))
+        if time.perf_counter() + delay >= deadline or not self.breaker.allow():
+            return None
+        CLAUDE_RETRIES.inc()
+        return delay
+
+    def _claude_result(self, reply, text, today):
+        """Turn a streamed Claude reply into a parse result and record the call."""
+        def record(outcome):
+            record_claude_call(
+                time.perf_counter() - reply.started, outcome, reply.usage,
+                first_token_seconds=reply.first_token_seconds,
+            )
+
+        try:
+            bill_data = json.loads(reply.text.strip())
+
+            bill_data = finalize_bill_data(bill_data, today)
+
+            if self.cache is not None:
+                self.cache.set(text, today.strftime("%Y-%m-%d"), dict(bill_data))
+
+            record("success")
+            return {"success": True, "data": bill_data, "source": "claude"}
 
         except json.JSONDecodeError:
+            record("invalid_json")
             return {
                 "success": False,
                 "error": "Could not parse bill details. Please try again with more detail.",
             }
         except ValueError as e:
+            record("invalid_bill")
             return {"success": False, "error": str(e)}
         except Exception as e:
-            print(f"DEBUG: AI Parser error: {type(e).__name__}: {e}")
-            return {
-                "success": False,
-                "error": "An error occurred while parsing. Please try again.",
-            }
+            return self._claude_failed(e, reply, text, today)
+
+    def _claude_failed(self, error, reply, text, today):
+        logger.warning("Claude parse failed: %s: %s", type(error).__name__, error)
+        record_claude_call(
+            time.perf_counter() - reply.started, type(error).__name__, reply.usage,
+            first_token_seconds=reply.first_token_seconds,
+        )
+        if is_retryable(error):
+            return self._claude_unavailable(text, today)
+        return {
+            "success": False,
+            "error": "An error occurred while parsing. Please try again.",
+        }
+
+    def _claude_unavailable(self, text, today):
+        """Fall back to the rule-based parse while Claude is failing."""
+        if self.fast_parser is not None:
+            bill_data, _ = self.fast_parser.parse(text, today)
+            if bill_data is not None:
+                try:
+                    bill_data = finalize_bill_data(bill_data, today)
+                    PARSE_REQUESTS.inc(source="fallback")
+                    return {"success": True, "data": bill_data, "source": "fallback"}
+                except ValueError:
+                    pass
+        PARSE_REQUESTS.inc(source="unavailable")
+        return {
+            "success": False,
+            "unavailable": True,
+            "error": "Bill parsing is temporarily unavailable. Please try again shortly.",
+        }
+
+
+class AsyncBillParser(BillParser):
+    """
+    BillParser whose Claude calls are awaited on an asyncio event loop.
+
+    While a call is in flight the caller holds a coroutine rather than a
+    thread, so one loop can carry hundreds of concurrent parses. The
+    rule-based and cache paths, budget, retries and breaker are the same
+    as BillParser's.
+    """
+
+    def __init__(self, client=None, cache=None, fast_parser=None, fast_path_threshold=0.8,
+                 **options):
+        if client is None:
+            api_key = os.environ.get("ANTHROPIC_API_KEY")
+            if not api_key:
+                raise ValueError("ANTHROPIC_API_KEY environment variable is required")
+            from anthropic import AsyncAnthropic
+            client = AsyncAnthropic(
+                api_key=api_key, timeout=options.get("timeout", 15.0), max_retries=0
+            )
+        super().__init__(client, cache, fast_parser, fast_path_threshold, **options)
+
+    async def parse_bill(self, text, today=None):
+        """Async counterpart of BillParser.parse_bill."""
+        today = today or datetime.now()
+        result = self._parse_locally(text, today)
+        if result is not None:
+            return result
+        if not self.breaker.allow():
+            return self._claude_unavailable(text, today)
+        try:
+            return await self._call_claude(text, today)
+        finally:
+            self.breaker.release()
+
+    async def _call_claude(self, text, today):
+        PARSE_REQUESTS.inc(source="claude")
+        started = time.perf_counter()
+        deadline = started + self.timeout
+        attempt = 0
+        while True:
+            reply = StreamedReply(started)
+            try:
+                request = self._claude_request(text, today)
+                request["timeout"] = deadline - time.perf_counter()
+                async with self.client.messages.stream(**request) as stream:
+                    async for chunk in stream.text_stream:
+                        if reply.feed(chunk):
+                            break
+                        _check_deadline(deadline)
+                    reply.usage = stream.current_message_snapshot.usage
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, deadline)
+                if delay is None:
+                    return self._claude_failed(e, reply, text, today)
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            return self._claude_result(reply, text, today)
+
+
+def _check_deadline(deadline):
+    # The SDK timeout bounds each read, not the whole streamed reply
+    if time.perf_counter() > deadline:
+        raise TimeoutError("Claude call ran past its latency budget")
@@ -0,0 +1,148 @@
+import csv
+import io
+import json
+from sqlalchemy import select
+from app.models import db, Bill
+
+EXPORT_FORMATS = ("csv", "ndjson", "arrow")
+
+EXPORT_MIMETYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+EXPORT_COLUMNS = [
+    "id", "name", "amount", "due_date", "frequency", "category", "notes",
+    "is_paid", "paid_date", "created_at", "updated_at",
+]
+
+
+def iter_bill_rows(user_id, chunk_size=1000):
+    """
+    Yield a user's bills as plain rows in due date order.
+
+    Rows are fetched chunk_size at a time from a server-side cursor, so
+    memory stays flat however many bills the user has.
+    """
+    columns = [getattr(Bill, name) for name in EXPORT_COLUMNS]
+    result = db.session.execute(
+        select(*columns)
+        .where(Bill.user_id == user_id)
+        .order_by(Bill.due_date, Bill.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    for partition in result.partitions():
+        yield from partition
+
+
+def export_csv(rows, chunk_size=1000):
+    """Encode rows as CSV, yielding roughly chunk_size rows per piece."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(_isoformat(value) for value in row)
+        if count % chunk_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def export_ndjson(rows, chunk_size=1000):
+    """Encode rows as newline-delimited JSON objects."""
+    lines = []
+    for row in rows:
+        record = dict(zip(EXPORT_COLUMNS, (_isoformat(value) for value in row)))
+        record["amount"] = float(record["amount"])
+        lines.append(json.dumps(record))
+        if len(lines) >= chunk_size:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def export_arrow(rows, chunk_size=1000):
+    """Encode rows as an Arrow IPC stream, one record batch per chunk."""
+    import pyarrow as pa
+
+    schema = pa.schema([
+        ("id", pa.int64()),
+        ("name", pa.string()),
+        ("amount", pa.decimal128(10, 2)),
+        ("due_date", pa.date32()),
+        ("frequency", pa.string()),
+        ("category", pa.string()),
+        ("notes", pa.string()),
+        ("is_paid", pa.bool_()),
+        ("paid_date", pa.date32()),
+        ("created_at", pa.timestamp("us")),
+        ("updated_at", pa.timestamp("us")),
+    ])
+
+    def to_batch(chunk):
+        records = [dict(zip(EXPORT_COLUMNS, row)) for row in chunk]
+        return pa.RecordBatch.from_pylist(records, schema=schema)
+
+    sink = _ChunkSink()
+    writer = pa.ipc.new_stream(sink, schema)
+    yield sink.drain()
+
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            writer.write_batch(to_batch(chunk))
+            chunk = []
+            yield sink.drain()
+    if chunk:
+        writer.write_batch(to_batch(chunk))
+    writer.close()
+    yield sink.drain()
+
+
+def arrow_available():
+    """Check whether the optional pyarrow dependency is installed."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+EXPORTERS = {
+    "csv": export_csv,
+    "ndjson": export_ndjson,
+    "arrow": export_arrow,
+}
+
+
+class _ChunkSink:
+    """File-like object that collects Arrow IPC output between yields."""
+
+    closed = False
+
+    def __init__(self):
+        self._parts = []
+
+    def write(self, data):
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self._parts)
+        self._parts = []
+        return data
+
+
+def _isoformat(value):
+    return value.isoformat() if hasattr(value, "isoformat") else value
@@ -0,0 +1,229 @@
+import re
+from datetime import date, datetime, timedelta
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+FREQUENCY_PATTERNS = [
+    ("weekly", r"\b(?:weekly|(?:every|each|per|a)\s+week)\b"),
+    ("monthly", r"\b(?:monthly|(?:every|each|per|a)\s+month)\b|/\s*mo\b"),
+    ("quarterly", r"\b(?:quarterly|(?:every|each|per)\s+quarter)\b"),
+    ("yearly", r"\b(?:yearly|annually|annual|(?:every|each|per|a)\s+year)\b|/\s*yr\b"),
+    ("one-time", r"\b(?:one[\s-]time|once)\b"),
+]
+
+CATEGORY_KEYWORDS = {
+    "utilities": ["electric", "electricity", "water", "gas", "power", "internet",
+                  "phone", "utility", "utilities", "trash", "sewer", "cable"],
+    "subscription": ["netflix", "spotify", "hulu", "disney", "youtube", "prime",
+                     "subscription", "hbo", "icloud", "gym", "membership"],
+    "insurance": ["insurance", "premium"],
+    "rent": ["rent", "lease"],
+    "loan": ["loan", "mortgage", "student", "credit card", "car payment"],
+    "medical": ["doctor", "medical", "dental", "dentist", "hospital",
+                "pharmacy", "clinic", "therapy"],
+}
+
+# Phrasing the rules cannot represent; these always go to Claude
+AMBIGUOUS = re.compile(
+    r"\b(?:every\s+other|bi-?weekly|twice|split|half|except|unless|plus|"
+    r"and\s+\w+\s+\$|last\s+(?:day|business)|next\s+(?:week|friday|monday))\b",
+    re.IGNORECASE,
+)
+
+AMOUNT = re.compile(
+    r"\$\s?(\d{1,3}(?:,\d{3})+|\d+)(?:\.(\d{1,2}))?"
+    r"|\b(\d+)(?:\.(\d{1,2}))?\s*(?:dollars|usd|bucks)\b",
+    re.IGNORECASE,
+)
+# Full and abbreviated month names only, so words like "Decker" never match
+MONTH_NAME = (
+    r"(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|"
+    r"aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+)
+ISO_DATE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+MONTH_DAY = re.compile(
+    r"\b" + MONTH_NAME + r"\.?\s+"
+    r"(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?\b",
+    re.IGNORECASE,
+)
+DAY_MONTH = re.compile(
+    r"\b(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?"
+    + MONTH_NAME + r"\b(?:,?\s+(\d{4}))?",
+    re.IGNORECASE,
+)
+SLASH_DATE = re.compile(r"\b(\d{1,2})/(\d{1,2})(?:/(\d{2}|\d{4}))?\b")
+DAY_OF_MONTH = re.compile(
+    r"\bthe\s+(\d{1,2})(?:st|nd|rd|th)\b",
+    re.IGNORECASE,
+)
+RELATIVE_DAY = re.compile(r"\b(today|tomorrow)\b", re.IGNORECASE)
+FILLER = re.compile(
+    r"(?:pay|paying|my|the|a|an|for|is|of|due|on|by|at|in|every|each|"
+    r"per|month)",
+    re.IGNORECASE,
+)
+# Date-like words the rules could not turn into a due date
+DATE_WORD = re.compile(
+    r"\b(?:" + MONTH_NAME + r"|mon(?:day)?|tue(?:s(?:day)?)?|wed(?:nesday)?|"
+    r"thu(?:rs(?:day)?)?|fri(?:day)?|sat(?:urday)?|sun(?:day)?|today|tomorrow|"
+    r"tonight|week|weekend|month|year|date)\b",
+    re.IGNORECASE,
+)
+
+
+class FastBillParser:
+    """
+    Rule-based extractor for simple bill descriptions.
+
+    Handles the common "<name> $<amount> [due <date>] [<frequency>]" shape
+    without a network call. Returns the bill fields together with a
+    confidence score so callers can fall back to Claude when unsure.
+    """
+
+    def parse(self, text, today):
+        """Return (bill_data, confidence); bill_data is None when unparseable."""
+        today_date = today.date() if isinstance(today, datetime) else today
+        confidence = 1.0
+        remaining = text
+
+        if AMBIGUOUS.search(text):
+            return None, 0.0
+
+        amounts = list(AMOUNT.finditer(remaining))
+        if len(amounts) != 1:
+            return None, 0.0
+        match = amounts[0]
+        whole = (match.group(1) or match.group(3)).replace(",", "")
+        cents = match.group(2) or match.group(4) or "0"
+        amount = float(f"{whole}.{cents}")
+        remaining = _cut(remaining, match)
+
+        frequency = None
+        for name, pattern in FREQUENCY_PATTERNS:
+            found = re.search(pattern, remaining, re.IGNORECASE)
+            if found:
+                if frequency is not None:
+                    return None, 0.0
+                frequency = name
+                remaining = _cut(remaining, found)
+
+        due_date, remaining = _extract_date(remaining, today_date)
+        if due_date is False:
+            return None, 0.0
+
+        category = _category(text)
+        if frequency is None:
+            frequency = "monthly" if category == "subscription" else "one-time"
+        if due_date is None and frequency == "one-time":
+            # Claude would guess from context; the rules only have a default
+            confidence -= 0.3
+
+        name = _clean_name(remaining)
+        if not name:
+            return None, 0.0
+        if re.search(r"\d", name):
+            confidence -= 0.4
+        if len(name.split()) > 4:
+            confidence -= 0.3
+        if len(name) <= 2:
+            confidence -= 0.4
+        if DATE_WORD.search(name):
+            # Likely a date or schedule the rules did not understand
+            confidence -= 0.4
+
+        return {
+            "name": name,
+            "amount": amount,
+            "due_date": due_date.isoformat() if due_date else None,
+            "frequency": frequency,
+            "category": category,
+        }, round(max(confidence, 0.0), 2)
+
+
+def _cut(text, match):
+    """Remove a regex match from the text."""
+    return text[:match.start()] + " " + text[match.end():]
+
+
+def _extract_date(text, today):
+    """
+    Find a due date in the text.
+
+    Returns (date or None, remaining text), or (False, text) when the text
+    holds more than one date or an impossible one.
+    """
+    found = []
+    for pattern in (ISO_DATE, MONTH_DAY, DAY_MONTH, SLASH_DATE, DAY_OF_MONTH, RELATIVE_DAY):
+        for match in pattern.finditer(text):
+            found.append((pattern, match))
+    if not found:
+        return None, text
+    if len(found) > 1:
+        return False, text
+
+    pattern, match = found[0]
+    try:
+        if pattern is ISO_DATE:
+            due = date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        elif pattern is MONTH_DAY:
+            month = MONTHS[match.group(1).lower()[:3]]
+            due = _month_day(month, int(match.group(2)), match.group(3), today)
+        elif pattern is DAY_MONTH:
+            month = MONTHS[match.group(2).lower()[:3]]
+            due = _month_day(month, int(match.group(1)), match.group(3), today)
+        elif pattern is SLASH_DATE:
+            year = match.group(3)
+            if year and len(year) == 2:
+                year = "20" + year
+            due = _month_day(int(match.group(1)), int(match.group(2)), year, today)
+        elif pattern is DAY_OF_MONTH:
+            day = int(match.group(1))
+            due = _month_day(today.month, day, None, today, roll="month")
+        elif match.group(1).lower() == "today":
+            due = today
+        else:
+            due = today + timedelta(days=1)
+    except ValueError:
+        return False, text
+
+    return due, _cut(text, match)
+
+
+def _month_day(month, day, year, today, roll="year"):
+    """Resolve a month/day, rolling forward when it has already passed."""
+    if year:
+        return date(int(year), month, day)
+    candidate = date(today.year, month, day)
+    if candidate >= today:
+        return candidate
+    if roll == "month":
+        next_month = today.replace(day=1) + timedelta(days=32)
+        return date(next_month.year, next_month.month, day)
+    return date(today.year + 1, month, day)
+
+
+def _category(text):
+    lowered = text.lower()
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        if any(re.search(rf"\b{re.escape(k)}\b", lowered) for k in keywords):
+            return category
+    return "other"
+
+
+def _clean_name(text):
+    """
+    Strip punctuation, and filler words from either end, from what is
+    left of the text. Tokens joined by "&" or "-", like "AT&T", stay whole.
+    """
+    words = re.sub(r"[^\w\s&-]", " ", text).split()
+    while words and (FILLER.fullmatch(words[0]) or not words[0].strip("-&")):
+        words.pop(0)
+    while words and (FILLER.fullmatch(words[-1]) or not words[-1].strip("-&")):
+        words.pop()
+    name = " ".join(words)
+    if not name:
+        return ""
+    return name[0].upper() + name[1:]
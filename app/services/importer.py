@@ -0,0 +1,109 @@
+import csv
+import io
+import json
+from datetime import datetime
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import insert
+from app.models import db, Bill, BillSummary, User
+from app.security.validation import BillCreate
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+# Building the validator once keeps per-row cost to validation alone
+_bill_adapter = TypeAdapter(BillCreate)
+
+
+def iter_rows(stream, fmt):
+    """
+    Yield (row_number, row) pairs from a CSV or NDJSON byte stream.
+
+    Rows are decoded one line at a time, so memory does not grow with
+    file size. Rows that cannot be decoded are yielded as exceptions.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    if fmt == "csv":
+        for number, row in enumerate(csv.DictReader(text), start=1):
+            # Empty cells fall back to the model defaults
+            yield number, {k: v for k, v in row.items() if k and v not in ("", None)}
+    else:
+        number = 0
+        for line in text:
+            if not line.strip():
+                continue
+            number += 1
+            try:
+                row = json.loads(line)
+                if not isinstance(row, dict):
+                    raise ValueError("Row must be a JSON object")
+                yield number, row
+            except ValueError as e:
+                yield number, e
+
+
+def import_bills(user_id, rows, batch_size=500, max_errors=100):
+    """
+    Validate and insert bills in chunks, one transaction per chunk.
+
+    Invalid rows are reported and skipped without aborting the load.
+    Returns (imported, failed, errors) where errors holds at most
+    max_errors entries.
+    """
+    imported = 0
+    failed = 0
+    errors = []
+    batch = []
+
+    def record_error(number, error):
+        nonlocal failed
+        failed += 1
+        if len(errors) < max_errors:
+            errors.append({"row": number, **error})
+
+    def flush():
+        nonlocal imported
+        if not batch:
+            return
+        db.session.execute(insert(Bill), batch)
+        BillSummary.invalidate(user_id)
+        User.bump_data_version(user_id)
+        db.session.commit()
+        imported += len(batch)
+        batch.clear()
+
+    rows = iter(rows)
+    while True:
+        try:
+            number, row = next(rows)
+        except StopIteration:
+            break
+        except (UnicodeDecodeError, csv.Error) as e:
+            # The rest of the file cannot be read; keep what was valid so far
+            record_error(None, {"error": f"Could not read file: {e}"})
+            break
+
+        if isinstance(row, Exception):
+            record_error(number, {"error": f"Invalid row: {row}"})
+            continue
+        try:
+            data = _bill_adapter.validate_python(row)
+        except ValidationError as e:
+            record_error(number, {
+                "error": "Validation failed",
+                "details": e.errors(include_context=False, include_url=False),
+            })
+            continue
+
+        batch.append({
+            "user_id": user_id,
+            "name": data.name,
+            "amount": data.amount,
+            "due_date": datetime.strptime(data.due_date, "%Y-%m-%d").date(),
+            "frequency": data.frequency,
+            "category": data.category,
+            "notes": data.notes,
+        })
+        if len(batch) >= batch_size:
+            flush()
+
+    flush()
+    return imported, failed, errors
@@ -0,0 +1,121 @@
+from calendar import monthrange
+from datetime import datetime, timedelta
+
+DAY_STEPS = {"weekly": 7}
+MONTH_STEPS = {"monthly": 1, "quarterly": 3, "yearly": 12}
+
+
+def occurrence_dates(due_date, frequency, start, end):
+    """
+    Return every date a bill falls due within [start, end].
+
+    Recurrences are computed by index from the original due date rather
+    than by stepping through history, so cost depends only on the number
+    of occurrences inside the window. Monthly-style series keep the
+    original day and clamp it to short months (Jan 31 -> Feb 28 -> Mar 31).
+    """
+    if due_date > end:
+        return []
+
+    if frequency in DAY_STEPS:
+        step = DAY_STEPS[frequency]
+        first = max(0, -(-(start - due_date).days // step))
+        last = (end - due_date).days // step
+        return [due_date + timedelta(days=step * k) for k in range(first, last + 1)]
+
+    if frequency in MONTH_STEPS:
+        step = MONTH_STEPS[frequency]
+        anchor = due_date.year * 12 + due_date.month - 1
+        first = max(0, (start.year * 12 + start.month - 1 - anchor) // step)
+        last = (end.year * 12 + end.month - 1 - anchor) // step
+        dates = []
+        for k in range(first, last + 1):
+            year, month = divmod(anchor + k * step, 12)
+            day = min(due_date.day, monthrange(year, month + 1)[1])
+            occurrence = due_date.replace(year=year, month=month + 1, day=day)
+            if start <= occurrence <= end:
+                dates.append(occurrence)
+        return dates
+
+    return [due_date] if start <= due_date else []
+
+
+def expand_bills(bills, start, end):
+    """
+    Expand bill rows into dated occurrences within [start, end].
+
+    Rows need id, name, amount, due_date, frequency, category and is_paid.
+    Only the original due date of a paid bill counts as paid.
+    """
+    occurrences = []
+    for bill in bills:
+        amount = float(bill.amount)
+        for when in occurrence_dates(bill.due_date, bill.frequency, start, end):
+            occurrences.append({
+                "date": when,
+                "bill_id": bill.id,
+                "name": bill.name,
+                "amount": amount,
+                "frequency": bill.frequency,
+                "category": bill.category,
+                "is_paid": bool(bill.is_paid) and when == bill.due_date,
+            })
+    occurrences.sort(key=lambda o: (o["date"], o["bill_id"]))
+    return occurrences
+
+
+def render_ics(occurrences, calendar_name="Bills"):
+    """Render occurrences as an iCalendar document of all-day events."""
+    # Stamped per day so unchanged feeds keep the same ETag between polls
+    stamp = datetime.utcnow().strftime("%Y%m%dT000000Z")
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//ai-bill-reminder//bills//EN",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{_escape(calendar_name)}",
+    ]
+    for occurrence in occurrences:
+        when = occurrence["date"]
+        lines.extend([
+            "BEGIN:VEVENT",
+            f"UID:bill-{occurrence['bill_id']}-{when:%Y%m%d}@ai-bill-reminder",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART;VALUE=DATE:{when:%Y%m%d}",
+            f"DTEND;VALUE=DATE:{when + timedelta(days=1):%Y%m%d}",
+            _fold(f"SUMMARY:{_escape(_summary(occurrence))}"),
+            f"CATEGORIES:{_escape(occurrence['category'] or 'other')}",
+            "END:VEVENT",
+        ])
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
+
+
+def _summary(occurrence):
+    summary = f"{occurrence['name']} (${occurrence['amount']:.2f})"
+    return summary + " - paid" if occurrence["is_paid"] else summary
+
+
+def _escape(text):
+    return (
+        text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line):
+    """Fold content lines longer than 75 octets as RFC 5545 requires."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    # Continuation lines start with a space, leaving 74 octets of content
+    while len(encoded) > (74 if parts else 75):
+        cut = 74 if parts else 75
+        # Back off so a multi-byte character is never split
+        while cut > 0 and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+    parts.append(encoded.decode("utf-8"))
+    return "\r\n ".join(parts)
@@ -0,0 +1,40 @@
+import base64
+import json
+from datetime import date
+from sqlalchemy import and_, or_
+from app.models import Bill
+
+
+def encode_cursor(bill):
+    """Encode the keyset position of a bill as an opaque cursor."""
+    raw = json.dumps([bill.due_date.isoformat(), bill.id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    """Decode a cursor into a (due_date, id) tuple."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        due_date, bill_id = json.loads(base64.urlsafe_b64decode(padded))
+        return date.fromisoformat(due_date), int(bill_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+def paginate_bills(query, limit, cursor=None):
+    """
+    Apply keyset pagination on (due_date, id) to a bill query.
+
+    Returns the page of bills and the cursor for the next page, if any.
+    """
+    if cursor:
+        due_date, bill_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            Bill.due_date > due_date,
+            and_(Bill.due_date == due_date, Bill.id > bill_id),
+        ))
+
+    rows = query.order_by(Bill.due_date, Bill.id).limit(limit + 1).all()
+    page = rows[:limit]
+    next_cursor = encode_cursor(page[-1]) if len(rows) > limit else None
+    return page, next_cursor
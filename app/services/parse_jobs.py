@@ -0,0 +1,172 @@
+import os
+import threading
+from datetime import datetime, timedelta
+from app.models import db, Bill, BillSummary, ParseJob, User
+from app.services.ai_parser import get_bill_parser
+
+
+def submit_parse_job(user_id, text):
+    """Queue a parse job and wake this process's runner."""
+    job = ParseJob(user_id=user_id, text=text)
+    db.session.add(job)
+    db.session.commit()
+
+    runner = _runner
+    if runner is not None:
+        runner.notify()
+    return job
+
+
+def claim_next_job(app):
+    """
+    Atomically move one pending job to running and return its id.
+
+    The claim is a conditional UPDATE, so several processes polling the
+    same table never run a job twice.
+    """
+    _requeue_stale_jobs(
+        app.config.get("PARSE_JOB_TIMEOUT", 300), app.config.get("PARSE_JOB_MAX_ATTEMPTS", 3)
+    )
+
+    candidates = db.session.query(ParseJob.id).filter(
+        ParseJob.status == ParseJob.PENDING
+    ).order_by(ParseJob.created_at).limit(5).all()
+
+    for (job_id,) in candidates:
+        claimed = db.session.query(ParseJob).filter(
+            ParseJob.id == job_id, ParseJob.status == ParseJob.PENDING
+        ).update({
+            ParseJob.status: ParseJob.RUNNING,
+            ParseJob.locked_at: datetime.utcnow(),
+            ParseJob.attempts: ParseJob.attempts + 1,
+        }, synchronize_session=False)
+        db.session.commit()
+        if claimed:
+            return job_id
+    return None
+
+
+def run_job(app, job_id):
+    """Parse a claimed job's text and create its bill."""
+    job = db.session.get(ParseJob, job_id)
+    try:
+        result = get_bill_parser(app.config).parse_bill(job.text)
+        if result["success"]:
+            bill = Bill.from_parsed(job.user_id, result["data"])
+            db.session.add(bill)
+            BillSummary.apply(job.user_id, after=bill.summary_state())
+            User.bump_data_version(job.user_id)
+            job.bill = bill
+            job.status = ParseJob.SUCCEEDED
+        else:
+            job.status = ParseJob.FAILED
+            job.error = result["error"]
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        app.logger.exception("Parse job %s failed", job_id)
+        job = db.session.get(ParseJob, job_id)
+        job.status = ParseJob.FAILED
+        job.error = "An error occurred while parsing. Please try again."
+        db.session.commit()
+
+
+def run_pending_jobs(app, limit=None):
+    """Run pending jobs in the calling thread; returns how many ran."""
+    ran = 0
+    while limit is None or ran < limit:
+        job_id = claim_next_job(app)
+        if job_id is None:
+            break
+        run_job(app, job_id)
+        ran += 1
+    return ran
+
+
+def _requeue_stale_jobs(timeout, max_attempts):
+    """
+    Return jobs whose worker died mid-parse to the queue.
+
+    Jobs that have already been claimed max_attempts times are failed
+    instead, so a job that kills or hangs its worker is not retried forever.
+    """
+    cutoff = datetime.utcnow() - timedelta(seconds=timeout)
+    stale = db.session.query(ParseJob).filter(
+        ParseJob.status == ParseJob.RUNNING, ParseJob.locked_at < cutoff
+    )
+    failed = stale.filter(ParseJob.attempts >= max_attempts).update({
+        ParseJob.status: ParseJob.FAILED,
+        ParseJob.error: "Parsing did not finish. Please try again.",
+    }, synchronize_session=False)
+    requeued = stale.filter(ParseJob.attempts < max_attempts).update(
+        {ParseJob.status: ParseJob.PENDING}, synchronize_session=False
+    )
+    if failed or requeued:
+        db.session.commit()
+
+
+class ParseJobRunner:
+    """Pool of daemon threads that claim and run parse jobs for one process."""
+
+    def __init__(self, app, workers, poll_interval):
+        self.app = app
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._threads = []
+
+    def start(self):
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._loop, name=f"parse-job-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        self._stopping.set()
+        self._wake.set()
+
+    def notify(self):
+        self._wake.set()
+
+    def _loop(self):
+        while not self._stopping.is_set():
+            try:
+                with self.app.app_context():
+                    job_id = claim_next_job(self.app)
+                    if job_id is not None:
+                        run_job(self.app, job_id)
+                        continue
+            except Exception:
+                self.app.logger.exception("Parse job runner error")
+            # Jobs queued by other processes are picked up on the next poll
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+
+_runner = None
+_runner_pid = None
+_runner_lock = threading.Lock()
+
+
+def init_parse_jobs(app):
+    """Start this process's job runner on the first request it serves."""
+    if app.config.get("PARSE_JOB_WORKERS", 0) <= 0:
+        return
+
+    @app.before_request
+    def ensure_parse_job_runner():
+        global _runner, _runner_pid
+        if _runner_pid == os.getpid():
+            return
+        with _runner_lock:
+            if _runner_pid != os.getpid():
+                _runner = ParseJobRunner(
+                    app,
+                    app.config["PARSE_JOB_WORKERS"],
+                    app.config.get("PARSE_JOB_POLL_INTERVAL", 5.0),
+                )
+                _runner.start()
+                _runner_pid = os.getpid()
@@ -0,0 +1,307 @@
+import heapq
+import json
+import logging
+import signal
+import smtplib
+import threading
+import urllib.request
+from collections import namedtuple
+from datetime import datetime, time, timedelta
+from email.message import EmailMessage
+from sqlalchemy import tuple_
+from sqlalchemy.exc import IntegrityError
+from app.models import db, Bill, ReminderSent, User
+
+Reminder = namedtuple("Reminder", ["bill_id", "kind", "due_date", "name", "amount", "email"])
+Reminder.__doc__ = "A reminder ready to hand to a notifier."
+
+logger = logging.getLogger(__name__)
+
+# Bill writes can commit slightly after the updated_at they stamp, so each
+# refresh looks back this far past the previous one
+_CHANGE_OVERLAP = timedelta(seconds=5)
+
+
+class LogNotifier:
+    """Write reminders to the app log."""
+
+    channel = "log"
+
+    def send(self, reminder):
+        logger.info(
+            "REMINDER: [%s] %s: %s $%.2f due %s", reminder.kind, reminder.email,
+            reminder.name, reminder.amount, reminder.due_date.isoformat(),
+        )
+
+
+class SMTPNotifier:
+    """Email reminders through an SMTP relay, by default a local one."""
+
+    channel = "smtp"
+
+    def __init__(self, host="localhost", port=1025, sender="reminders@localhost", timeout=10):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.timeout = timeout
+
+    def send(self, reminder):
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = reminder.email
+        message["Subject"] = _subject(reminder)
+        message.set_content(
+            f"{reminder.name}: ${reminder.amount:.2f} due {reminder.due_date.isoformat()}."
+        )
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            smtp.send_message(message)
+
+
+class WebhookNotifier:
+    """POST reminders as JSON to a webhook URL."""
+
+    channel = "webhook"
+
+    def __init__(self, url, timeout=10):
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, reminder):
+        body = json.dumps({
+            "bill_id": reminder.bill_id,
+            "kind": reminder.kind,
+            "due_date": reminder.due_date.isoformat(),
+            "name": reminder.name,
+            "amount": reminder.amount,
+            "email": reminder.email,
+            "subject": _subject(reminder),
+        }).encode("utf-8")
+        request = urllib.request.Request(
+            self.url, data=body, headers={"Content-Type": "application/json"}
+        )
+        # urlopen raises on non-2xx responses
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+def create_notifier(config):
+    """Build the notifier selected by REMINDER_NOTIFIER."""
+    kind = config.get("REMINDER_NOTIFIER", "log")
+    if kind == "smtp":
+        return SMTPNotifier(
+            host=config.get("REMINDER_SMTP_HOST", "localhost"),
+            port=config.get("REMINDER_SMTP_PORT", 1025),
+            sender=config.get("REMINDER_SMTP_SENDER", "reminders@localhost"),
+        )
+    if kind == "webhook":
+        return WebhookNotifier(config["REMINDER_WEBHOOK_URL"])
+    return LogNotifier()
+
+
+class ReminderScheduler:
+    """
+    Sends upcoming, due and overdue reminders for unpaid bills.
+
+    Pending reminder times live in a min-heap that only holds bills due
+    within the lookahead window. The window is filled in due date order
+    with keyset queries, and bills written since the last refresh are
+    picked up through updated_at, so no refresh rescans the table. The
+    loop sleeps until the next reminder or refresh is due.
+
+    Each reminder is recorded in reminders_sent before it is handed to
+    the notifier, and the unique key on that table makes delivery at most
+    once even with several schedulers running.
+    """
+
+    def __init__(self, app, notifier, lead_days=3, overdue_days=1, send_hour=9,
+                 lookahead_days=7, batch_size=1000, refresh_interval=60,
+                 max_error_backoff=900, clock=datetime.now):
+        self.app = app
+        self.notifier = notifier
+        self.lead_days = lead_days
+        self.overdue_days = overdue_days
+        self.send_at = time(hour=send_hour)
+        self.lookahead_days = lookahead_days
+        self.batch_size = batch_size
+        self.refresh_interval = refresh_interval
+        self.max_error_backoff = max_error_backoff
+        self.clock = clock
+        self._heap = []
+        self._queued = set()
+        self._cursor = None
+        self._changed_since = None
+        self._next_refresh = None
+        self._stopping = threading.Event()
+
+    def run(self):
+        """
+        Dispatch reminders until stop() is called.
+
+        After a failed tick, such as during a database outage, the loop
+        waits refresh_interval seconds, doubling on each further failure
+        up to max_error_backoff.
+        """
+        backoff = self.refresh_interval
+        while not self._stopping.is_set():
+            try:
+                with self.app.app_context():
+                    self.tick()
+            except Exception:
+                self.app.logger.exception("Reminder scheduler tick failed")
+                self._stopping.wait(backoff)
+                backoff = min(backoff * 2, self.max_error_backoff)
+                continue
+            backoff = self.refresh_interval
+            self._stopping.wait(self.seconds_until_next())
+
+    def stop(self):
+        self._stopping.set()
+
+    def tick(self):
+        """Refresh the heap if due and send every reminder whose time has come."""
+        now = self.clock()
+        if self._next_refresh is None or now >= self._next_refresh:
+            self.refresh(now)
+
+        sent = 0
+        while self._heap and self._heap[0][0] <= now:
+            _, bill_id, kind, due_date = self._heap[0]
+            # Leave the entry queued until dispatch finishes, so a database
+            # error keeps it for the next tick instead of losing it
+            if self._dispatch(bill_id, kind, due_date):
+                sent += 1
+            heapq.heappop(self._heap)
+            self._queued.discard((bill_id, kind, due_date))
+        return sent
+
+    def seconds_until_next(self):
+        """Seconds until the next reminder or refresh, whichever is sooner."""
+        if self._next_refresh is None:
+            return 0
+        wake = self._next_refresh
+        if self._heap:
+            wake = min(wake, self._heap[0][0])
+        return max((wake - self.clock()).total_seconds(), 0)
+
+    def refresh(self, now):
+        """Load newly due and recently changed bills into the heap."""
+        today = now.date()
+        earliest = today - timedelta(days=self.overdue_days)
+        horizon = today + timedelta(days=self.lead_days + self.lookahead_days)
+        changed_since = datetime.utcnow()
+
+        if self._cursor is not None:
+            # Bills behind the cursor only come in through this query
+            rows = self._unpaid_bills().filter(
+                Bill.updated_at > self._changed_since - _CHANGE_OVERLAP,
+                Bill.due_date >= earliest,
+                Bill.due_date <= self._cursor[0],
+            ).all()
+            for bill_id, due_date in rows:
+                self._schedule(bill_id, due_date, now)
+
+        while True:
+            if self._cursor is None:
+                after = Bill.due_date >= earliest
+            else:
+                after = tuple_(Bill.due_date, Bill.id) > self._cursor
+            rows = self._unpaid_bills().filter(
+                after, Bill.due_date <= horizon
+            ).order_by(Bill.due_date, Bill.id).limit(self.batch_size).all()
+            for bill_id, due_date in rows:
+                self._schedule(bill_id, due_date, now)
+            if rows:
+                self._cursor = (rows[-1].due_date, rows[-1].id)
+            if len(rows) < self.batch_size:
+                break
+
+        self._changed_since = changed_since
+        self._next_refresh = now + timedelta(seconds=self.refresh_interval)
+
+    def pending(self):
+        """Number of reminders waiting in the heap."""
+        return len(self._heap)
+
+    def _unpaid_bills(self):
+        return db.session.query(Bill.id, Bill.due_date).filter(Bill.is_paid.is_(False))
+
+    def _schedule(self, bill_id, due_date, now):
+        times = [
+            (datetime.combine(due_date + timedelta(days=offset), self.send_at), kind)
+            for kind, offset in (
+                (ReminderSent.UPCOMING, -self.lead_days),
+                (ReminderSent.DUE, 0),
+                (ReminderSent.OVERDUE, self.overdue_days),
+            )
+        ]
+        # Of the reminders already past, only the latest is still worth sending
+        past = [entry for entry in times if entry[0] <= now]
+        times = past[-1:] + [entry for entry in times if entry[0] > now]
+
+        for fire_at, kind in times:
+            key = (bill_id, kind, due_date)
+            if key not in self._queued:
+                self._queued.add(key)
+                heapq.heappush(self._heap, (fire_at, bill_id, kind, due_date))
+
+    def _dispatch(self, bill_id, kind, due_date):
+        row = db.session.query(
+            Bill.name, Bill.amount, Bill.due_date, Bill.is_paid, User.email
+        ).join(User, User.id == Bill.user_id).filter(
+            Bill.id == bill_id, User.is_active.is_(True)
+        ).first()
+        # Paid, deleted or rescheduled since it was queued
+        if row is None or row.is_paid or row.due_date != due_date:
+            return False
+
+        record = ReminderSent(
+            bill_id=bill_id, kind=kind, due_date=due_date, channel=self.notifier.channel
+        )
+        db.session.add(record)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            return False
+
+        try:
+            self.notifier.send(Reminder(
+                bill_id, kind, due_date, row.name, float(row.amount), row.email
+            ))
+        except Exception as e:
+            record.error = f"{type(e).__name__}: {e}"
+            db.session.commit()
+            return False
+        return True
+
+
+def create_reminder_scheduler(app, notifier=None):
+    """Build a scheduler configured from the app."""
+    config = app.config
+    return ReminderScheduler(
+        app,
+        notifier or create_notifier(config),
+        lead_days=config.get("REMINDER_LEAD_DAYS", 3),
+        overdue_days=config.get("REMINDER_OVERDUE_DAYS", 1),
+        send_hour=config.get("REMINDER_SEND_HOUR", 9),
+        lookahead_days=config.get("REMINDER_LOOKAHEAD_DAYS", 7),
+        batch_size=config.get("REMINDER_BATCH_SIZE", 1000),
+        refresh_interval=config.get("REMINDER_REFRESH_INTERVAL", 60),
+        max_error_backoff=config.get("REMINDER_MAX_ERROR_BACKOFF", 900),
+    )
+
+
+def run_reminder_scheduler(app):
+    """Run the scheduler in the foreground until SIGINT or SIGTERM."""
+    scheduler = create_reminder_scheduler(app)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: scheduler.stop())
+    scheduler.run()
+
+
+def _subject(reminder):
+    if reminder.kind == ReminderSent.OVERDUE:
+        return f"Overdue: {reminder.name}"
+    if reminder.kind == ReminderSent.DUE:
+        return f"Due today: {reminder.name}"
+    return f"Coming up: {reminder.name}"
@@ -0,0 +1,78 @@
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from types import SimpleNamespace
+
+CATEGORIES = ["utilities", "subscription", "insurance", "rent", "loan", "medical", "other"]
+
+
+class FakeMessageStream:
+    """Message stream that replays a reply a few characters at a time."""
+
+    def __init__(self, text, usage, chunk_size=16):
+        self._text = text
+        self._chunk_size = chunk_size
+        self.current_message_snapshot = SimpleNamespace(usage=usage)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    @property
+    def text_stream(self):
+        for start in range(0, len(self._text), self._chunk_size):
+            yield self._text[start:start + self._chunk_size]
+
+
+class FakeAnthropic:
+    """
+    Deterministic stand-in for the Anthropic client.
+
+    The bill returned for a prompt depends only on the prompt text, and
+    each streamed call sleeps for ``latency`` seconds plus up to
+    ``jitter`` seconds drawn from a seeded generator, so runs are
+    repeatable.
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.calls = 0
+        self.messages = self
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def stream(self, model=None, max_tokens=None, messages=None, **kwargs):
+        prompt = messages[-1]["content"]
+        if not isinstance(prompt, str):
+            prompt = "".join(block.get("text", "") for block in prompt)
+        with self._lock:
+            self.calls += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+        time.sleep(delay)
+
+        text = json.dumps(self.bill_for(prompt))
+        usage = SimpleNamespace(
+            input_tokens=len(prompt) // 4, output_tokens=len(text) // 4
+        )
+        return FakeMessageStream(text, usage)
+
+    @staticmethod
+    def bill_for(prompt):
+        """Return the bill this client answers for a prompt."""
+        match = re.search(r'Bill description: "(.*)"', prompt)
+        description = match.group(1) if match else prompt
+        digest = int(hashlib.sha256(description.encode("utf-8")).hexdigest(), 16)
+        words = re.findall(r"[A-Za-z]+", description) or ["Bill"]
+        return {
+            "name": " ".join(words[:3]).title(),
+            "amount": round(5 + digest % 50000 / 100, 2),
+            "due_date": f"2030-{digest % 12 + 1:02d}-{digest % 28 + 1:02d}",
+            "frequency": "monthly",
+            "category": CATEGORIES[digest % len(CATEGORIES)],
+        }
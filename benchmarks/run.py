@@ -0,0 +1,244 @@
+"""
+Endpoint benchmarks.
+
+Runs each endpoint scenario in process against create_app("testing"),
+seeded with a configurable number of bills, with Claude replaced by
+FakeAnthropic. Reports throughput and p50/p95/p99 latency per scenario
+as JSON, and compares against a stored baseline:
+
+    python -m benchmarks.run --bills 1000 --iterations 200 \\
+        --output results.json --baseline benchmarks/baseline.json
+
+Exits with status 1 when any scenario's median (--metric) is more than
+--threshold slower than the baseline and by at least --min-delta-ms, so
+sub-millisecond noise does not fail the run. Pass --save-baseline to
+refresh the baseline from the current run.
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from sqlalchemy import insert
+from app import create_app
+from app.models import db, Bill
+from app.security import limiter
+from app.services import BillParser, FastBillParser, ai_parser
+from benchmarks.fake_anthropic import CATEGORIES, FakeAnthropic
+
+EMAIL = "bench@example.com"
+PASSWORD = "BenchPass123"
+
+
+def seed_bills(user_id, count, rng):
+    """Insert count bills spread over two years around today."""
+    today = date.today()
+    rows = [
+        {
+            "user_id": user_id,
+            "name": f"Bill {i}",
+            "amount": round(rng.uniform(5, 500), 2),
+            "due_date": today + timedelta(days=rng.randint(-365, 365)),
+            "frequency": rng.choice(["one-time", "monthly", "yearly"]),
+            "category": rng.choice(CATEGORIES),
+            "notes": "Seeded for benchmarks",
+            "is_paid": rng.random() < 0.3,
+        }
+        for i in range(count)
+    ]
+    for start in range(0, len(rows), 1000):
+        db.session.execute(insert(Bill), rows[start:start + 1000])
+    db.session.commit()
+    return [bill_id for (bill_id,) in db.session.query(Bill.id).filter_by(user_id=user_id)]
+
+
+def scenarios(headers, bill_ids, rng):
+    """Return (name, method, path, kwargs factory) for each scenario."""
+    counter = iter(range(10 ** 9))
+
+    def bill_body():
+        n = next(counter)
+        return {"json": {
+            "name": f"Bench {n}", "amount": 20.00,
+            "due_date": (date.today() + timedelta(days=n % 60)).isoformat(),
+        }}
+
+    def parse_body():
+        # Unique text so every call reaches the (fake) Claude client
+        return {"json": {"text": f"Water utility bill number {next(counter)}, about forty dollars"}}
+
+    auth = {"headers": headers}
+    return [
+        ("auth.login", "POST", lambda: "/api/auth/login",
+         lambda: {"json": {"email": EMAIL, "password": PASSWORD}}),
+        ("auth.me", "GET", lambda: "/api/auth/me", lambda: auth),
+        ("bills.list", "GET", lambda: "/api/bills?limit=50", lambda: auth),
+        ("bills.list_sparse", "GET",
+         lambda: "/api/bills?limit=50&fields=name,amount,is_paid", lambda: auth),
+        ("bills.upcoming", "GET", lambda: "/api/bills/upcoming?days=30", lambda: auth),
+        ("bills.get", "GET", lambda: f"/api/bills/{rng.choice(bill_ids)}", lambda: auth),
+        ("bills.create", "POST", lambda: "/api/bills", lambda: {**auth, **bill_body()}),
+        ("bills.update", "PUT", lambda: f"/api/bills/{rng.choice(bill_ids)}",
+         lambda: {**auth, "json": {"amount": round(rng.uniform(5, 500), 2)}}),
+        ("bills.pay", "POST", lambda: f"/api/bills/{rng.choice(bill_ids)}/pay", lambda: auth),
+        ("bills.summary", "GET", lambda: "/api/bills/summary", lambda: auth),
+        ("parse.claude", "POST", lambda: "/api/bills/parse", lambda: {**auth, **parse_body()}),
+        ("parse.rules", "POST", lambda: "/api/bills/parse",
+         lambda: {**auth, "json": {"text": "Netflix $15.99 due on the 15th monthly"}}),
+    ]
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies, elapsed):
+    values = sorted(latencies)
+    return {
+        "count": len(values),
+        "throughput_rps": round(len(values) / elapsed, 2) if elapsed else None,
+        "mean_ms": round(sum(values) / len(values) * 1000, 3),
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+    }
+
+
+def run_benchmarks(bills=1000, iterations=200, warmup=10, latency=0.05, jitter=0.0,
+                   seed=0, only=None):
+    """Run every scenario and return the results document."""
+    rng = random.Random(seed)
+    app = create_app("testing")
+    limiter.enabled = False
+    fake = FakeAnthropic(latency=latency, jitter=jitter, seed=seed)
+    previous_parser = ai_parser._bill_parser
+    ai_parser._bill_parser = BillParser(client=fake, fast_parser=FastBillParser())
+
+    results = {}
+    try:
+        with app.app_context():
+            db.create_all()
+            client = app.test_client()
+            registered = client.post("/api/auth/register", json={
+                "email": EMAIL, "password": PASSWORD, "name": "Bench"
+            }).get_json()
+            headers = {"Authorization": f"Bearer {registered['access_token']}"}
+            bill_ids = seed_bills(registered["user"]["id"], bills, rng)
+
+            for name, method, path, kwargs in scenarios(headers, bill_ids, rng):
+                if only and not any(name.startswith(prefix) for prefix in only):
+                    continue
+                for _ in range(warmup):
+                    client.open(path(), method=method, **kwargs())
+
+                latencies = []
+                started = time.perf_counter()
+                for _ in range(iterations):
+                    request_path, request_kwargs = path(), kwargs()
+                    t0 = time.perf_counter()
+                    response = client.open(request_path, method=method, **request_kwargs)
+                    latencies.append(time.perf_counter() - t0)
+                    if response.status_code >= 400:
+                        raise RuntimeError(
+                            f"{name}: {method} {request_path} returned {response.status_code}"
+                        )
+                results[name] = summarize(latencies, time.perf_counter() - started)
+            db.session.remove()
+            db.drop_all()
+    finally:
+        ai_parser._bill_parser = previous_parser
+        limiter.enabled = True
+
+    return {
+        "meta": {
+            "bills": bills,
+            "iterations": iterations,
+            "claude_latency_s": latency,
+            "python": platform.python_version(),
+            "created_at": datetime.utcnow().isoformat(),
+        },
+        "results": results,
+    }
+
+
+def compare_results(current, baseline, threshold=0.25, metric="p50_ms", min_delta_ms=1.0):
+    """
+    Compare a run against a baseline document.
+
+    Returns one entry per scenario present in both whose metric grew by
+    more than threshold (0.25 = 25% slower) and by at least min_delta_ms.
+    """
+    regressions = []
+    for name, base in baseline["results"].items():
+        result = current["results"].get(name)
+        if result is None or not base.get(metric):
+            continue
+        change = result[metric] / base[metric] - 1
+        if change > threshold and result[metric] - base[metric] >= min_delta_ms:
+            regressions.append({
+                "scenario": name,
+                "metric": metric,
+                "baseline": base[metric],
+                "current": result[metric],
+                "change": round(change, 3),
+            })
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the bill API endpoints.")
+    parser.add_argument("--bills", type=int, default=1000, help="bills seeded for the user")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05,
+                        help="seconds added to each fake Claude call")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", nargs="*", help="scenario name prefixes to run")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--metric", default="p50_ms")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write this run to --baseline instead of comparing")
+    args = parser.parse_args(argv)
+
+    current = run_benchmarks(
+        bills=args.bills, iterations=args.iterations, warmup=args.warmup,
+        latency=args.latency, jitter=args.jitter, seed=args.seed, only=args.only,
+    )
+    print(json.dumps(current, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if not args.baseline:
+        return 0
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(current, f, indent=2)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare_results(
+        current, baseline, args.threshold, args.metric, args.min_delta_ms
+    )
+    for regression in regressions:
+        print(
+            f"REGRESSION: {regression['scenario']} {regression['metric']} "
+            f"{regression['baseline']} -> {regression['current']} "
+            f"(+{regression['change']:.0%})",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Cold start benchmark.
+
+Starts a fresh interpreter that imports app.main (the gunicorn entry
+point) several times and reports how long each phase took:
+
+    python -m benchmarks.startup --runs 10 --output startup.json \\
+        [--baseline startup-baseline.json]
+
+"process" is the wall time from spawning the interpreter until the app
+is built, which is what autoscaling waits for. "import" and
+"create_app" come from the app's own startup timings. Results use the
+same format and regression check as benchmarks.run.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from benchmarks.run import compare_results, summarize
+
+PROBE = (
+    "import json; from app.main import app; "
+    "print(json.dumps(app.extensions['startup']))"
+)
+
+
+def measure_startup(runs=10, config_name="production"):
+    """Spawn runs cold interpreters and summarize each startup phase."""
+    env = {**os.environ, "FLASK_ENV": config_name}
+    env.setdefault("SECRET_KEY", "startup-benchmark")
+    env.setdefault("DATABASE_URL", "sqlite://")
+    phases = {"process": [], "import": [], "create_app": []}
+    for _ in range(runs):
+        started = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE], env=env, check=True,
+            capture_output=True, text=True,
+        ).stdout
+        phases["process"].append(time.perf_counter() - started)
+        timings = json.loads(output.strip().splitlines()[-1])
+        phases["import"].append(timings["import_seconds"])
+        phases["create_app"].append(timings["create_app_seconds"])
+
+    return {
+        "meta": {"runs": runs, "config": config_name, "python": sys.version.split()[0]},
+        "results": {
+            f"startup.{phase}": summarize(values, sum(values))
+            for phase, values in phases.items()
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure app cold start time.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--config", default="production")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--min-delta-ms", type=float, default=50.0)
+    args = parser.parse_args(argv)
+
+    current = measure_startup(args.runs, args.config)
+    print(json.dumps(current, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare_results(
+        current, baseline, args.threshold, "p50_ms", args.min_delta_ms
+    )
+    for regression in regressions:
+        print(
+            f"REGRESSION: {regression['scenario']} {regression['baseline']} -> "
+            f"{regression['current']} ms (+{regression['change']:.0%})",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+import os
+
+wsgi_app = "app.main:app"
+bind = f"0.0.0.0:{os.environ.get('PORT', 5001)}"
+workers = int(os.environ.get("GUNICORN_WORKERS", 2))
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+
+# Build the app once in the master so workers fork from a warmed parent
+preload_app = os.environ.get("GUNICORN_PRELOAD", "true").lower() == "true"
+
+
+def on_starting(server):
+    if preload_app:
+        # The Claude SDK is imported lazily; importing it here means forked
+        # workers share it instead of each paying seconds on first parse
+        import anthropic  # noqa: F401
+
+
+def post_fork(server, worker):
+    if preload_app:
+        # Pooled connections opened in the master must not be shared
+        from app.main import app
+        from app.models import db
+        with app.app_context():
+            # Every bind, including the read replica
+            for engine in db.engines.values():
+                engine.dispose(close=False)
@@ -0,0 +1,33 @@
+"""bill due date indexes
+
+Revision ID: 063a0c540ee5
+Revises: cddf562c4155
+Create Date: 2026-10-16 23:01:12.318540
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '063a0c540ee5'
+down_revision = 'cddf562c4155'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_bills_user_paid_due', 'bills', ['user_id', 'is_paid', 'due_date'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_bills_user_unpaid_due', 'bills', ['user_id', 'due_date'],
+        unique=False,
+        postgresql_where=sa.text('NOT is_paid'),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_bills_user_unpaid_due', table_name='bills')
+    op.drop_index('ix_bills_user_paid_due', table_name='bills')
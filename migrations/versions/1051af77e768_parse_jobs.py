@@ -0,0 +1,46 @@
+"""parse jobs
+
+Revision ID: 1051af77e768
+Revises: 063a0c540ee5
+Create Date: 2026-10-16 23:05:52.539750
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1051af77e768'
+down_revision = '063a0c540ee5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'parse_jobs',
+        sa.Column('id', sa.String(length=32), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('locked_at', sa.DateTime(), nullable=True),
+        sa.Column('bill_id', sa.Integer(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['bill_id'], ['bills.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_parse_jobs_status_created', 'parse_jobs', ['status', 'created_at'],
+        unique=False,
+    )
+    op.create_index(op.f('ix_parse_jobs_user_id'), 'parse_jobs', ['user_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_parse_jobs_user_id'), table_name='parse_jobs')
+    op.drop_index('ix_parse_jobs_status_created', table_name='parse_jobs')
+    op.drop_table('parse_jobs')
@@ -0,0 +1,24 @@
+"""users updated_at index
+
+Revision ID: 42118677aabd
+Revises: 1051af77e768
+Create Date: 2026-10-16 23:09:54.724782
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '42118677aabd'
+down_revision = '1051af77e768'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f('ix_users_updated_at'), 'users', ['updated_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_users_updated_at'), table_name='users')
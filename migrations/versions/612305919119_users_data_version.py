@@ -0,0 +1,28 @@
+"""users data version
+
+Revision ID: 612305919119
+Revises: a4e04fab55a2
+Create Date: 2026-10-16 23:18:11.361740
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '612305919119'
+down_revision = 'a4e04fab55a2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'users',
+        sa.Column('data_version', sa.Integer(), server_default='0', nullable=False),
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('data_version')
@@ -0,0 +1,44 @@
+"""reminders sent
+
+Revision ID: a4e04fab55a2
+Revises: 42118677aabd
+Create Date: 2026-10-16 23:16:51.370210
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4e04fab55a2'
+down_revision = '42118677aabd'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'reminders_sent',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('bill_id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=20), nullable=False),
+        sa.Column('due_date', sa.Date(), nullable=False),
+        sa.Column('channel', sa.String(length=20), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('sent_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['bill_id'], ['bills.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('bill_id', 'kind', 'due_date', name='uq_reminders_sent_bill_kind_due'),
+    )
+    op.create_index(
+        'ix_bills_unpaid_due', 'bills', ['due_date', 'id'],
+        unique=False,
+        postgresql_where=sa.text('NOT is_paid'),
+    )
+    op.create_index(op.f('ix_bills_updated_at'), 'bills', ['updated_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_bills_updated_at'), table_name='bills')
+    op.drop_index('ix_bills_unpaid_due', table_name='bills')
+    op.drop_table('reminders_sent')
@@ -0,0 +1,28 @@
+"""bill summaries data version
+
+Revision ID: b7d2e19c4f60
+Revises: 612305919119
+Create Date: 2026-10-17 09:42:27.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d2e19c4f60'
+down_revision = '612305919119'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'bill_summaries',
+        sa.Column('data_version', sa.Integer(), server_default='0', nullable=False),
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('bill_summaries') as batch_op:
+        batch_op.drop_column('data_version')
@@ -0,0 +1,28 @@
+"""users feed version
+
+Revision ID: c3a8f05d6e21
+Revises: b7d2e19c4f60
+Create Date: 2026-10-17 10:05:51.207336
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3a8f05d6e21'
+down_revision = 'b7d2e19c4f60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'users',
+        sa.Column('feed_version', sa.Integer(), server_default='0', nullable=False),
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('feed_version')
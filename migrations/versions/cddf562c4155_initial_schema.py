@@ -0,0 +1,69 @@
+"""initial schema
+
+Revision ID: cddf562c4155
+Revises: 
+Create Date: 2026-10-16 22:59:34.498620
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'cddf562c4155'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('email', sa.String(length=120), nullable=False),
+        sa.Column('password_hash', sa.String(length=128), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+
+    op.create_table(
+        'bills',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('amount', sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column('due_date', sa.Date(), nullable=False),
+        sa.Column('frequency', sa.String(length=20), nullable=True),
+        sa.Column('category', sa.String(length=50), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('is_paid', sa.Boolean(), nullable=True),
+        sa.Column('paid_date', sa.Date(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+    op.create_table(
+        'bill_summaries',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('as_of', sa.Date(), nullable=False),
+        sa.Column('total_bills', sa.Integer(), nullable=False),
+        sa.Column('unpaid_count', sa.Integer(), nullable=False),
+        sa.Column('overdue_count', sa.Integer(), nullable=False),
+        sa.Column('total_due', sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column('total_overdue', sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+
+
+def downgrade():
+    op.drop_table('bill_summaries')
+    op.drop_table('bills')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
@@ -1,6 +1,127 @@
+import asyncio
+import json
+import time
+import threading
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import SimpleNamespace
 from app import create_app
 from app.models import db, User, Bill
+from app.services import BillParser, FastBillParser, ParseCache, get_bill_parser
+from app.services import run_pending_jobs
+from app.services.parse_jobs import claim_next_job
+from app.services import ai_parser
+from app.services.ai_parser import MemoryCacheBackend, SQLiteCacheBackend
+
+
+class FakeStream:
+    """Stand-in for the SDK's message stream over a canned reply."""
+
+    def __init__(self, text, usage, chunk_size=8):
+        self.chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+        self.consumed = 0
+        self.closed = False
+        self.current_message_snapshot = SimpleNamespace(usage=usage)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.closed = True
+
+    @property
+    def text_stream(self):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+
+class FakeClaude:
+    """Stand-in for the Anthropic client that streams a canned bill."""
+
+    def __init__(self, bill=None):
+        self.bill = bill or {
+            "name": "Netflix",
+            "amount": 15.99,
+            "due_date": "2026-02-01",
+            "frequency": "monthly",
+            "category": "subscription",
+        }
+        self.calls = 0
+        self.delay = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.usage = None
+        self.trailer = ""
+        self.last_request = None
+        self.last_stream = None
+        self.errors = []
+        self.messages = self
+        self._lock = threading.Lock()
+
+    def _start(self, kwargs):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.last_request = kwargs
+
+    def _finish(self):
+        with self._lock:
+            self.in_flight -= 1
+        if self.errors:
+            raise self.errors.pop(0)
+
+    def _new_stream(self, stream_class):
+        self.last_stream = stream_class(json.dumps(self.bill) + self.trailer, self.usage)
+        return self.last_stream
+
+    def stream(self, **kwargs):
+        self._start(kwargs)
+        try:
+            time.sleep(self.delay)
+        finally:
+            self._finish()
+        return self._new_stream(FakeStream)
+
+
+class FakeAsyncStream(FakeStream):
+    """Async stand-in for the SDK's message stream."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+
+    @property
+    async def text_stream(self):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+
+class FakeAsyncClaude(FakeClaude):
+    """Stand-in for the AsyncAnthropic client."""
+
+    def stream(self, **kwargs):
+        fake = self
+
+        class Manager:
+            async def __aenter__(self):
+                fake._start(kwargs)
+                try:
+                    await asyncio.sleep(fake.delay)
+                finally:
+                    fake._finish()
+                self.stream = fake._new_stream(FakeAsyncStream)
+                return self.stream
+
+            async def __aexit__(self, *exc):
+                self.stream.closed = True
+
+        return Manager()
 
 
 @pytest.fixture
@@ -13,12 +134,26 @@ def app():
         db.drop_all()
 
 
+@pytest.fixture(autouse=True)
+def reset_claude_breaker(monkeypatch):
+    """Give every test a fresh process-wide Claude circuit breaker."""
+    monkeypatch.setattr(ai_parser, "_claude_breaker", None)
+
+
 @pytest.fixture
 def client(app):
     """Create test client."""
     return app.test_client()
 
 
+@pytest.fixture
+def fake_claude(monkeypatch):
+    """Route parse requests through a fake Claude client."""
+    fake = FakeClaude()
+    monkeypatch.setattr(ai_parser, "_bill_parser", BillParser(client=fake))
+    return fake
+
+
 @pytest.fixture
 def auth_headers(client):
     """Register user and return auth headers."""
@@ -161,3 +296,1519 @@ class TestBills:
     def test_unauthorized_access(self, client):
         response = client.get("/api/bills")
         assert response.status_code == 401
+
+
+class TestBillListing:
+    """Bill listing pagination and filter tests."""
+
+    def _create(self, client, headers, name, due_date, **extra):
+        return client.post("/api/bills", headers=headers, json={
+            "name": name,
+            "amount": 10.00,
+            "due_date": due_date,
+            **extra,
+        })
+
+    def test_paginates_with_cursor(self, client, auth_headers):
+        for day in range(1, 6):
+            self._create(client, auth_headers, f"Bill {day}", f"2026-01-0{day}")
+
+        first = client.get("/api/bills?limit=2", headers=auth_headers).get_json()
+        assert [b["name"] for b in first["bills"]] == ["Bill 1", "Bill 2"]
+        assert first["next_cursor"]
+
+        seen = [b["name"] for b in first["bills"]]
+        cursor = first["next_cursor"]
+        while cursor:
+            page = client.get(
+                f"/api/bills?limit=2&cursor={cursor}", headers=auth_headers
+            ).get_json()
+            seen.extend(b["name"] for b in page["bills"])
+            cursor = page["next_cursor"]
+        assert seen == [f"Bill {day}" for day in range(1, 6)]
+
+    def test_same_due_date_ordered_by_id(self, client, auth_headers):
+        for name in ["A", "B", "C"]:
+            self._create(client, auth_headers, name, "2026-02-01")
+
+        first = client.get("/api/bills?limit=2", headers=auth_headers).get_json()
+        second = client.get(
+            f"/api/bills?limit=2&cursor={first['next_cursor']}", headers=auth_headers
+        ).get_json()
+        assert [b["name"] for b in first["bills"] + second["bills"]] == ["A", "B", "C"]
+        assert second["next_cursor"] is None
+
+    def test_filters(self, client, auth_headers):
+        self._create(client, auth_headers, "Rent", "2026-01-01", category="rent")
+        self._create(client, auth_headers, "Gym", "2026-03-01",
+                     category="subscription", frequency="monthly")
+
+        response = client.get("/api/bills?category=rent", headers=auth_headers)
+        assert [b["name"] for b in response.get_json()["bills"]] == ["Rent"]
+
+        response = client.get("/api/bills?frequency=monthly", headers=auth_headers)
+        assert [b["name"] for b in response.get_json()["bills"]] == ["Gym"]
+
+        response = client.get("/api/bills?due_from=2026-02-01", headers=auth_headers)
+        assert [b["name"] for b in response.get_json()["bills"]] == ["Gym"]
+
+        response = client.get("/api/bills?is_paid=true", headers=auth_headers)
+        assert response.get_json()["bills"] == []
+
+    def test_invalid_cursor(self, client, auth_headers):
+        response = client.get("/api/bills?cursor=not-a-cursor", headers=auth_headers)
+        assert response.status_code == 400
+
+    def test_limit_bounds(self, client, auth_headers):
+        response = client.get("/api/bills?limit=1000", headers=auth_headers)
+        assert response.status_code == 400
+
+
+class TestSummary:
+    """Dashboard summary tests."""
+
+    def test_summary_totals(self, client, auth_headers):
+        client.post("/api/bills", headers=auth_headers, json={
+            "name": "Old", "amount": 40.00, "due_date": "2000-01-01"
+        })
+        client.post("/api/bills", headers=auth_headers, json={
+            "name": "Future", "amount": 60.00, "due_date": "2999-01-01"
+        })
+
+        data = client.get("/api/bills/summary", headers=auth_headers).get_json()
+        assert data == {
+            "total_bills": 2,
+            "unpaid_count": 2,
+            "overdue_count": 1,
+            "total_due": 100.00,
+            "total_overdue": 40.00,
+        }
+
+    def test_rollup_tracks_writes(self, client, auth_headers):
+        old = client.post("/api/bills", headers=auth_headers, json={
+            "name": "Old", "amount": 40.00, "due_date": "2000-01-01"
+        }).get_json()["bill"]["id"]
+        client.get("/api/bills/summary", headers=auth_headers)
+
+        future = client.post("/api/bills", headers=auth_headers, json={
+            "name": "Future", "amount": 60.00, "due_date": "2999-01-01"
+        }).get_json()["bill"]["id"]
+        client.post(f"/api/bills/{old}/pay", headers=auth_headers)
+        client.put(f"/api/bills/{future}", headers=auth_headers, json={"amount": 80.00})
+
+        data = client.get("/api/bills/summary", headers=auth_headers).get_json()
+        assert data["total_bills"] == 2
+        assert data["unpaid_count"] == 1
+        assert data["overdue_count"] == 0
+        assert data["total_due"] == 80.00
+
+        client.delete(f"/api/bills/{future}", headers=auth_headers)
+        data = client.get("/api/bills/summary", headers=auth_headers).get_json()
+        assert data["total_bills"] == 1
+        assert data["total_due"] == 0
+
+    def test_write_during_recompute_is_not_lost(self, client, auth_headers, monkeypatch):
+        from datetime import date
+        from app.models import BillSummary
+        compute = BillSummary.compute
+        raced = []
+
+        def compute_then_write(user_id, today):
+            summary = compute(user_id, today)
+            if not raced:
+                # A bill write commits between the aggregate and the store
+                raced.append(True)
+                bill = Bill(user_id=user_id, name="Raced", amount=25,
+                            due_date=date(2999, 1, 1), frequency="one-time")
+                db.session.add(bill)
+                BillSummary.apply(user_id, after=bill.summary_state())
+                User.bump_data_version(user_id)
+                db.session.commit()
+            return summary
+
+        monkeypatch.setattr(BillSummary, "compute", compute_then_write)
+        client.get("/api/bills/summary", headers=auth_headers)
+
+        data = client.get("/api/bills/summary", headers=auth_headers).get_json()
+        assert data["total_bills"] == 1
+        assert data["total_due"] == 25.00
+
+
+class TestDueBills:
+    """Upcoming and overdue bill endpoint tests."""
+
+    def _create(self, client, headers, name, days_from_today):
+        from datetime import date, timedelta
+        due = (date.today() + timedelta(days=days_from_today)).isoformat()
+        return client.post("/api/bills", headers=headers, json={
+            "name": name, "amount": 20.00, "due_date": due
+        }).get_json()["bill"]["id"]
+
+    def test_upcoming(self, client, auth_headers):
+        self._create(client, auth_headers, "Soon", 3)
+        self._create(client, auth_headers, "Later", 30)
+        paid = self._create(client, auth_headers, "Paid", 1)
+        client.post(f"/api/bills/{paid}/pay", headers=auth_headers)
+
+        response = client.get("/api/bills/upcoming?days=7", headers=auth_headers)
+        assert response.status_code == 200
+        assert [b["name"] for b in response.get_json()["bills"]] == ["Soon"]
+
+        response = client.get("/api/bills/upcoming?days=60", headers=auth_headers)
+        assert [b["name"] for b in response.get_json()["bills"]] == ["Soon", "Later"]
+
+    def test_overdue(self, client, auth_headers):
+        self._create(client, auth_headers, "Late", -5)
+        self._create(client, auth_headers, "Today", 0)
+
+        response = client.get("/api/bills/overdue", headers=auth_headers)
+        assert response.status_code == 200
+        assert [b["name"] for b in response.get_json()["bills"]] == ["Late"]
+
+
+class TestStreamedParse:
+    """Streaming and system prompt tests for Claude parse calls."""
+
+    def test_static_instructions_sent_as_system_block(self):
+        fake = FakeClaude()
+        BillParser(client=fake).parse_bill("Netflix plan", datetime(2026, 1, 10))
+
+        (block,) = fake.last_request["system"]
+        # Too short for the model's prompt cache, so no marker is sent
+        assert "cache_control" not in block
+        assert "2026-01-10" not in block["text"]
+        assert "2026-01-10" in fake.last_request["messages"][0]["content"]
+
+    def test_stream_closed_once_json_completes(self):
+        from app.metrics import CLAUDE_FIRST_TOKEN
+        fake = FakeClaude(bill={"name": 'Say "hi" {x}', "amount": 9.5})
+        fake.trailer = " I hope this helps! " * 20
+        before = CLAUDE_FIRST_TOKEN.count()
+
+        result = BillParser(client=fake).parse_bill("Mystery", datetime(2026, 1, 10))
+
+        assert result["success"] is True
+        assert result["data"]["name"] == 'Say "hi" {x}'
+        assert fake.last_stream.closed
+        assert fake.last_stream.consumed < len(fake.last_stream.chunks)
+        assert CLAUDE_FIRST_TOKEN.count() == before + 1
+
+    def test_streamed_reply_tracks_nesting_and_escapes(self):
+        from app.services.ai_parser import StreamedReply
+        reply = StreamedReply()
+        assert not reply.feed('Sure: {"a": "}\\"", ')
+        assert not reply.feed('"b": {"c": 1}')
+        assert reply.feed('} trailing')
+        assert json.loads(reply.text) == {"a": '}"', "b": {"c": 1}}
+
+
+class APIError(Exception):
+    """Error carrying an HTTP status, like the SDK's APIStatusError."""
+
+    def __init__(self, status_code):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+class TestClaudeResilience:
+    """Latency budget, retry and circuit breaker tests for Claude parse calls."""
+
+    def _parser(self, fake, **options):
+        options.setdefault("retry_base_delay", 0.01)
+        return BillParser(client=fake, fast_parser=FastBillParser(), **options)
+
+    def test_transient_errors_retried(self):
+        fake = FakeClaude()
+        fake.errors = [APIError(529), ConnectionError("reset")]
+        result = self._parser(fake).parse_bill("Mystery charge", datetime(2026, 1, 10))
+        assert result["success"] is True
+        assert result["source"] == "claude"
+        assert fake.calls == 3
+
+    def test_client_errors_not_retried(self):
+        fake = FakeClaude()
+        fake.errors = [APIError(400)]
+        parser = self._parser(fake)
+        result = parser.parse_bill("Mystery charge", datetime(2026, 1, 10))
+        assert result["success"] is False
+        assert "unavailable" not in result
+        assert fake.calls == 1
+        assert parser.breaker.stats()["failures"] == 0
+
+    def test_budget_bounds_slow_calls(self):
+        fake = FakeClaude()
+        fake.delay = 0.2
+        started = time.perf_counter()
+        result = self._parser(fake, timeout=0.1).parse_bill("Mystery charge", datetime(2026, 1, 10))
+        assert time.perf_counter() - started < 0.5
+        assert result["unavailable"] is True
+        assert fake.calls == 1
+
+    def test_breaker_opens_and_falls_back_to_rules(self):
+        from app.services.ai_parser import CircuitBreaker
+        now = [0.0]
+        breaker = CircuitBreaker(min_calls=2, cooldown=30, clock=lambda: now[0])
+        fake = FakeClaude()
+        fake.errors = [APIError(503)] * 2
+        parser = self._parser(fake, max_retries=0, breaker=breaker)
+        today = datetime(2026, 1, 10)
+
+        parser.parse_bill("Mystery charge", today)
+        parser.parse_bill("Another mystery", today)
+        assert breaker.stats()["state"] == CircuitBreaker.OPEN
+
+        # Low-confidence rule parse is used instead of calling Claude
+        result = parser.parse_bill("water bill $40", today)
+        assert result["source"] == "fallback"
+        assert result["data"]["amount"] == 40.0
+        assert fake.calls == 2
+
+        now[0] = 31
+        assert parser.parse_bill("Mystery charge", today)["source"] == "claude"
+        assert breaker.stats()["state"] == CircuitBreaker.CLOSED
+
+    def test_cancelled_probe_releases_breaker(self):
+        from app.services import AsyncBillParser
+        from app.services.ai_parser import CircuitBreaker
+        now = [0.0]
+        breaker = CircuitBreaker(min_calls=1, cooldown=30, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 31
+        fake = FakeAsyncClaude()
+        fake.delay = 1
+        parser = AsyncBillParser(client=fake, breaker=breaker)
+
+        async def cancel_probe():
+            probe = asyncio.ensure_future(parser.parse_bill("Mystery charge"))
+            await asyncio.sleep(0.05)
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+
+        asyncio.run(cancel_probe())
+        assert breaker.allow()
+
+    def test_unavailable_parse_returns_503(self, client, auth_headers, fake_claude):
+        fake_claude.errors = [APIError(529)] * 3
+        ai_parser._bill_parser.retry_base_delay = 0.01
+        response = client.post("/api/bills/parse", headers=auth_headers, json={
+            "text": "Something odd happened"
+        })
+        assert response.status_code == 503
+
+    def test_breaker_state_in_health(self, client):
+        breaker = client.get("/health").get_json()["claude_circuit_breaker"]
+        assert breaker["state"] == "closed"
+
+
+class TestParseCache:
+    """Parse result cache tests."""
+
+    def _parser(self, backend=None):
+        parser = BillParser(cache=ParseCache(backend or MemoryCacheBackend()))
+        parser.client = FakeClaude()
+        return parser
+
+    def test_repeat_text_skips_api(self):
+        parser = self._parser()
+        today = datetime(2026, 1, 10)
+
+        first = parser.parse_bill("Netflix $15.99 monthly", today)
+        second = parser.parse_bill("  netflix   $15.99 MONTHLY ", today)
+
+        assert first["data"] == second["data"]
+        assert second["source"] == "cache"
+        assert parser.client.calls == 1
+        assert parser.cache.stats() == {"hits": 1, "misses": 1}
+
+    def test_keyed_on_reference_date(self):
+        parser = self._parser()
+        parser.parse_bill("Netflix $15.99 monthly", datetime(2026, 1, 10))
+        parser.parse_bill("Netflix $15.99 monthly", datetime(2026, 1, 11))
+        assert parser.client.calls == 2
+
+    def test_failures_not_cached(self):
+        parser = self._parser()
+        parser.client.bill = {"name": "Free", "amount": 0}
+        parser.parse_bill("Free thing", datetime(2026, 1, 10))
+        parser.parse_bill("Free thing", datetime(2026, 1, 10))
+        assert parser.client.calls == 2
+
+    def test_memory_backend_lru_and_ttl(self):
+        backend = MemoryCacheBackend(max_entries=2)
+        backend.set("a", 1, ttl=60)
+        backend.set("b", 2, ttl=60)
+        backend.get("a")
+        backend.set("c", 3, ttl=60)
+        assert backend.get("b") is None
+        assert backend.get("a") == 1
+
+        backend.set("d", 4, ttl=0)
+        assert backend.get("d") is None
+
+    def test_sqlite_backend_shared(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        writer = self._parser(SQLiteCacheBackend(path))
+        reader = self._parser(SQLiteCacheBackend(path))
+        today = datetime(2026, 1, 10)
+
+        writer.parse_bill("Netflix $15.99 monthly", today)
+        result = reader.parse_bill("Netflix $15.99 monthly", today)
+
+        assert result["data"]["name"] == "Netflix"
+        assert reader.client.calls == 0
+
+
+class TestParserClient:
+    """Shared parser and client lifecycle tests."""
+
+    def test_parser_shared_across_requests(self, app, monkeypatch):
+        monkeypatch.setattr(ai_parser, "_bill_parser", None)
+        app.config["ANTHROPIC_MAX_CONNECTIONS"] = 5
+
+        parser = get_bill_parser(app.config)
+        assert get_bill_parser(app.config) is parser
+
+        ai_parser._reset_after_fork()
+        assert get_bill_parser(app.config) is not parser
+
+    def test_parse_route_uses_shared_parser(self, client, auth_headers, fake_claude):
+        for _ in range(2):
+            response = client.post("/api/bills/parse", headers=auth_headers, json={
+                "text": "Netflix $15.99 monthly"
+            })
+            assert response.status_code == 201
+            assert response.get_json()["bill"]["name"] == "Netflix"
+        assert fake_claude.calls == 2
+
+
+class TestFastParser:
+    """Rule-based parse fast path tests."""
+
+    today = datetime(2026, 1, 10)
+
+    def test_simple_descriptions(self):
+        parser = FastBillParser()
+
+        data, confidence = parser.parse("Pay electric bill $150 due January 15th", self.today)
+        assert confidence >= 0.8
+        assert data == {
+            "name": "Electric bill",
+            "amount": 150.0,
+            "due_date": "2026-01-15",
+            "frequency": "one-time",
+            "category": "utilities",
+        }
+
+        data, confidence = parser.parse("Netflix $15.99 monthly", self.today)
+        assert confidence >= 0.8
+        assert data["frequency"] == "monthly"
+        assert data["due_date"] is None
+
+    def test_past_month_day_rolls_to_next_year(self):
+        data, _ = FastBillParser().parse("Phone bill $60 due Jan 5", self.today)
+        assert data["due_date"] == "2027-01-05"
+
+    def test_words_starting_with_month_not_dates(self):
+        parser = FastBillParser()
+        data, confidence = parser.parse("Netflix $15.99 due Decker 3", self.today)
+        assert data["due_date"] is None
+        assert confidence < 0.8
+        data, _ = parser.parse("Gym $30 due 5 Marchers", self.today)
+        assert data is None or data["due_date"] != "2026-03-05"
+
+        data, _ = parser.parse("Water $40 due Sept. 3", self.today)
+        assert data["due_date"] == "2026-09-03"
+        data, _ = parser.parse("Water $40 due 3rd of December", self.today)
+        assert data["due_date"] == "2026-12-03"
+
+    def test_filler_stripped_only_at_name_edges(self):
+        parser = FastBillParser()
+        data, confidence = parser.parse("Pay AT&T $85 on 10/31", self.today)
+        assert data["name"] == "AT&T"
+        assert data["due_date"] == "2026-10-31"
+        assert confidence >= 0.8
+
+        data, _ = parser.parse("Pay my T-Mobile bill $50 on the 3rd", self.today)
+        assert data["name"] == "T-Mobile bill"
+
+    def test_leftover_date_words_and_short_names_fall_back(self):
+        parser = BillParser(client=FakeClaude(), fast_parser=FastBillParser())
+
+        _, confidence = parser.fast_parser.parse("Gym $40 a month starting march", self.today)
+        assert confidence < 0.8
+        _, confidence = parser.fast_parser.parse("Pay T $85 on 10/31", self.today)
+        assert confidence < 0.8
+
+        result = parser.parse_bill("Gym $40 a month starting march", self.today)
+        assert result["source"] == "claude"
+        assert parser.client.calls == 1
+
+    def test_ambiguous_text_rejected(self):
+        parser = FastBillParser()
+        assert parser.parse("Electric $100 and water $50", self.today)[0] is None
+        assert parser.parse("Gym $30 every other week", self.today)[0] is None
+        assert parser.parse("Internet $70 due 13/45", self.today)[0] is None
+
+    def test_high_confidence_skips_claude(self):
+        parser = BillParser(client=FakeClaude(), fast_parser=FastBillParser())
+
+        result = parser.parse_bill("Netflix $15.99 monthly", self.today)
+
+        assert result["source"] == "rules"
+        assert result["data"]["due_date"] == "2026-02-01"
+        assert parser.client.calls == 0
+
+    def test_low_confidence_falls_back_to_claude(self):
+        parser = BillParser(client=FakeClaude(), fast_parser=FastBillParser())
+
+        result = parser.parse_bill("Amazon order 12345 $20", self.today)
+
+        assert result["source"] == "claude"
+        assert parser.client.calls == 1
+
+
+class TestBatchParse:
+    """Batch parse endpoint tests."""
+
+    def test_creates_valid_bills_and_reports_failures(self, client, auth_headers, fake_claude):
+        response = client.post("/api/bills/parse/batch", headers=auth_headers, json={
+            "texts": ["Netflix $15.99 monthly", "hi", "Netflix again $15.99"]
+        })
+
+        assert response.status_code == 201
+        data = response.get_json()
+        assert data["created"] == 2
+        assert [r["success"] for r in data["results"]] == [True, False, True]
+        assert data["results"][1]["error"] == "Validation failed"
+        assert fake_claude.calls == 2
+
+        listing = client.get("/api/bills", headers=auth_headers).get_json()
+        assert listing["count"] == 2
+
+    def test_concurrency_capped(self, app, client, auth_headers, fake_claude, monkeypatch):
+        monkeypatch.setattr(ai_parser, "_parse_executor", None)
+        app.config["PARSE_BATCH_CONCURRENCY"] = 2
+        fake_claude.delay = 0.05
+        texts = [f"Bill number {i} $10" for i in range(6)]
+
+        # The cap holds across concurrent batch requests, not per request
+        def post_batch():
+            return app.test_client().post(
+                "/api/bills/parse/batch", headers=auth_headers, json={"texts": texts}
+            ).get_json()["created"]
+
+        with ThreadPoolExecutor(max_workers=2) as requests:
+            created = list(requests.map(lambda _: post_batch(), range(2)))
+
+        assert created == [6, 6]
+        assert fake_claude.max_in_flight == 2
+        ai_parser._parse_executor.shutdown()
+
+    def test_rejects_oversized_batch(self, client, auth_headers):
+        response = client.post("/api/bills/parse/batch", headers=auth_headers, json={
+            "texts": ["Netflix $15.99 monthly"] * 51
+        })
+        assert response.status_code == 400
+
+
+class TestParseJobs:
+    """Asynchronous parse job tests."""
+
+    def _submit(self, client, headers):
+        return client.post("/api/bills/parse?async=1", headers=headers, json={
+            "text": "Netflix $15.99 monthly"
+        })
+
+    def test_job_lifecycle(self, app, client, auth_headers, fake_claude):
+        response = self._submit(client, auth_headers)
+        assert response.status_code == 202
+        job = response.get_json()["job"]
+        assert job["status"] == "pending"
+        assert response.headers["Location"].endswith(job["id"])
+        assert fake_claude.calls == 0
+
+        assert run_pending_jobs(app) == 1
+
+        response = client.get(f"/api/bills/parse/jobs/{job['id']}", headers=auth_headers)
+        job = response.get_json()["job"]
+        assert job["status"] == "succeeded"
+        assert job["bill"]["name"] == "Netflix"
+
+    def test_failed_parse_recorded(self, app, client, auth_headers, fake_claude):
+        fake_claude.bill = {"name": "Free", "amount": 0}
+        job_id = self._submit(client, auth_headers).get_json()["job"]["id"]
+
+        run_pending_jobs(app)
+
+        job = client.get(f"/api/bills/parse/jobs/{job_id}", headers=auth_headers).get_json()["job"]
+        assert job["status"] == "failed"
+        assert job["error"] == "Amount must be greater than 0"
+
+    def test_job_claimed_once(self, app, client, auth_headers):
+        self._submit(client, auth_headers)
+        assert claim_next_job(app) is not None
+        assert claim_next_job(app) is None
+
+    def test_stalled_job_failed_after_max_attempts(self, app, client, auth_headers):
+        from app.models import ParseJob
+        app.config["PARSE_JOB_TIMEOUT"] = 0
+        app.config["PARSE_JOB_MAX_ATTEMPTS"] = 2
+        job_id = self._submit(client, auth_headers).get_json()["job"]["id"]
+
+        # Each claim stalls; the stale sweep requeues it until attempts run out
+        assert claim_next_job(app) == job_id
+        assert claim_next_job(app) == job_id
+        assert claim_next_job(app) is None
+
+        job = db.session.get(ParseJob, job_id)
+        db.session.refresh(job)
+        assert job.status == ParseJob.FAILED
+        assert job.attempts == 2
+
+    def test_jobs_private_to_owner(self, client, auth_headers):
+        job_id = self._submit(client, auth_headers).get_json()["job"]["id"]
+        other = client.post("/api/auth/register", json={
+            "email": "other@example.com", "password": "Password123"
+        }).get_json()["access_token"]
+
+        response = client.get(
+            f"/api/bills/parse/jobs/{job_id}",
+            headers={"Authorization": f"Bearer {other}"},
+        )
+        assert response.status_code == 404
+
+
+class TestImport:
+    """Bulk import tests."""
+
+    def test_csv_import(self, app, client, auth_headers):
+        app.config["IMPORT_BATCH_SIZE"] = 2
+        body = (
+            "name,amount,due_date,frequency,category\n"
+            "Rent,1200,2026-02-01,monthly,rent\n"
+            "Bad,-5,2026-02-01,,\n"
+            "Water,45.50,2026-02-10,,utilities\n"
+            "Power,80,2026-02-15,,\n"
+        )
+        response = client.post(
+            "/api/bills/import", headers=auth_headers,
+            data=body, content_type="text/csv",
+        )
+
+        assert response.status_code == 201
+        data = response.get_json()
+        assert data["imported"] == 3
+        assert data["failed"] == 1
+        assert data["errors"][0]["row"] == 2
+
+        bills = client.get("/api/bills", headers=auth_headers).get_json()["bills"]
+        assert [b["name"] for b in bills] == ["Rent", "Water", "Power"]
+        assert bills[1]["frequency"] == "one-time"
+
+        summary = client.get("/api/bills/summary", headers=auth_headers).get_json()
+        assert summary["total_bills"] == 3
+
+    def test_ndjson_upload(self, client, auth_headers):
+        import io
+        body = (
+            '{"name": "Gym", "amount": 30, "due_date": "2026-03-01"}\n'
+            "not json\n"
+            "\n"
+            '{"name": "Phone", "amount": 60, "due_date": "2026-03-05"}\n'
+        )
+        response = client.post(
+            "/api/bills/import", headers=auth_headers,
+            data={"file": (io.BytesIO(body.encode()), "bills.ndjson")},
+            content_type="multipart/form-data",
+        )
+
+        data = response.get_json()
+        assert data["imported"] == 2
+        assert data["errors"][0]["row"] == 2
+
+    def test_unknown_format(self, client, auth_headers):
+        response = client.post("/api/bills/import", headers=auth_headers, data="x")
+        assert response.status_code == 400
+
+
+class TestExport:
+    """Streaming export tests."""
+
+    def _seed(self, client, headers):
+        for day in (3, 1, 2):
+            client.post("/api/bills", headers=headers, json={
+                "name": f"Bill {day}", "amount": 10.5, "due_date": f"2026-01-0{day}"
+            })
+
+    def test_csv_export(self, app, client, auth_headers):
+        import csv
+        import io
+        app.config["EXPORT_CHUNK_SIZE"] = 2
+        self._seed(client, auth_headers)
+
+        response = client.get("/api/bills/export?format=csv", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.is_streamed
+        rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+        assert [r["name"] for r in rows] == ["Bill 1", "Bill 2", "Bill 3"]
+        assert rows[0]["amount"] == "10.50"
+        assert rows[0]["due_date"] == "2026-01-01"
+
+    def test_ndjson_export(self, client, auth_headers):
+        self._seed(client, auth_headers)
+
+        response = client.get("/api/bills/export?format=ndjson", headers=auth_headers)
+
+        records = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert [r["name"] for r in records] == ["Bill 1", "Bill 2", "Bill 3"]
+        assert records[0]["amount"] == 10.5
+
+    def test_arrow_export(self, client, auth_headers):
+        pa = pytest.importorskip("pyarrow")
+        self._seed(client, auth_headers)
+
+        response = client.get("/api/bills/export?format=arrow", headers=auth_headers)
+
+        table = pa.ipc.open_stream(response.get_data()).read_all()
+        assert table.column("name").to_pylist() == ["Bill 1", "Bill 2", "Bill 3"]
+
+    def test_exports_only_own_bills(self, client, auth_headers):
+        self._seed(client, auth_headers)
+        other = client.post("/api/auth/register", json={
+            "email": "other@example.com", "password": "Password123"
+        }).get_json()["access_token"]
+
+        response = client.get(
+            "/api/bills/export?format=ndjson",
+            headers={"Authorization": f"Bearer {other}"},
+        )
+        assert response.get_data(as_text=True) == ""
+
+    def test_unknown_format(self, client, auth_headers):
+        response = client.get("/api/bills/export?format=xml", headers=auth_headers)
+        assert response.status_code == 400
+
+
+class TestIdentityCache:
+    """Cached JWT user resolution tests."""
+
+    def _user_queries(self, app, action):
+        from sqlalchemy import event
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            action()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+        # The ETag version check is expected; identity lookups are not
+        return [
+            s for s in statements
+            if "FROM users" in s and not s.startswith("SELECT users.data_version")
+        ]
+
+    def test_cached_lookup_skips_users_query(self, app, client, auth_headers):
+        client.get("/api/bills", headers=auth_headers)
+        queries = self._user_queries(
+            app, lambda: client.get("/api/bills", headers=auth_headers)
+        )
+        assert queries == []
+
+    def test_disabled_user_evicted(self, client, auth_headers):
+        client.get("/api/bills", headers=auth_headers)
+        user = User.query.filter_by(email="test@example.com").first()
+        user.is_active = False
+        db.session.commit()
+
+        response = client.get("/api/bills", headers=auth_headers)
+        assert response.status_code == 401
+        assert response.get_json()["code"] == "user_not_found"
+
+    def test_me_for_deleted_user_is_404(self, client, auth_headers):
+        client.get("/api/auth/me", headers=auth_headers)
+        # Removed behind the cache's back, as by another worker
+        db.session.execute(User.__table__.delete())
+        db.session.commit()
+
+        response = client.get("/api/auth/me", headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_change_from_other_worker_seen_after_sync(self, app, client, auth_headers):
+        from datetime import datetime, timedelta
+        app.extensions["identity_cache"].sync_interval = 0
+        client.get("/api/bills", headers=auth_headers)
+
+        # Bypass the ORM so no local eviction happens, as on another worker
+        db.session.execute(
+            User.__table__.update().values(
+                is_active=False, updated_at=datetime.utcnow() + timedelta(seconds=1)
+            )
+        )
+        db.session.commit()
+
+        response = client.get("/api/bills", headers=auth_headers)
+        assert response.status_code == 401
+
+
+class TestPasswordHashing:
+    """Password hashing service tests."""
+
+    def test_rehash_on_login_when_cost_changes(self, app, client):
+        client.post("/api/auth/register", json={
+            "email": "rehash@example.com", "password": "Password123"
+        })
+        user = User.query.filter_by(email="rehash@example.com").first()
+        assert user.password_hash.startswith("$2b$04$")
+
+        app.extensions["password_hasher"].rounds = 5
+        response = client.post("/api/auth/login", json={
+            "email": "rehash@example.com", "password": "Password123"
+        })
+
+        assert response.status_code == 200
+        db.session.refresh(user)
+        assert user.password_hash.startswith("$2b$05$")
+        assert user.check_password("Password123")
+
+    @pytest.fixture
+    def pooled_hasher(self):
+        from app.security import PasswordHasher
+        hasher = PasswordHasher(rounds=4, pool_size=1)
+        yield hasher
+        hasher.shutdown()
+
+    def test_process_pool_hashing(self, pooled_hasher):
+        hasher = pooled_hasher
+        hashed = hasher.hash("Password123")
+
+        assert hasher.verify("Password123", hashed)
+        assert not hasher.verify("WrongPass1", hashed)
+        stats = hasher.stats()
+        assert stats["hash"]["count"] == 1
+        assert stats["verify"]["count"] == 2
+        assert stats["in_flight"] == 0
+
+    def test_health_reports_hashing_stats(self, client):
+        data = client.get("/health").get_json()
+        assert "queue_depth" in data["password_hashing"]
+
+
+class TestRateLimiting:
+    """Rate limit storage and keying tests."""
+
+    def test_key_uses_jwt_identity(self, app, auth_headers):
+        from app.security.rate_limiter import rate_limit_key
+
+        with app.test_request_context("/api/bills", headers=auth_headers):
+            assert rate_limit_key() == "user:1"
+        with app.test_request_context("/api/bills"):
+            assert rate_limit_key() == "127.0.0.1"
+        bad = {"Authorization": "Bearer not-a-token"}
+        with app.test_request_context("/api/bills", headers=bad):
+            assert rate_limit_key() == "127.0.0.1"
+
+    def test_sqlite_storage_shared_between_workers(self, tmp_path):
+        from limits.storage import storage_from_string
+        uri = f"sqlite:///{tmp_path}/limits.db"
+        first = storage_from_string(uri)
+        second = storage_from_string(uri)
+
+        assert first.incr("k", 60) == 1
+        assert second.incr("k", 60) == 2
+        assert first.get("k") == 2
+
+        assert first.incr("short", 0) == 1
+        assert second.incr("short", 60) == 1
+
+    def test_batched_storage_syncs_in_batches(self, tmp_path):
+        from limits.storage import storage_from_string
+        uri = f"sqlite:///{tmp_path}/limits.db"
+        shared = storage_from_string(uri)
+        batched = storage_from_string(
+            f"batched+{uri}", sync_batch=5, sync_interval=60
+        )
+
+        assert batched.incr("k", 60) == 1
+        for expected in range(2, 6):
+            assert batched.incr("k", 60) == expected
+        assert shared.get("k") == 1
+
+        assert batched.incr("k", 60) == 6
+        assert shared.get("k") == 6
+
+
+class TestCalendar:
+    """Recurring bill calendar and iCalendar feed tests."""
+
+    def test_monthly_clamps_to_month_end(self):
+        from datetime import date
+        from app.services import occurrence_dates
+
+        dates = occurrence_dates(
+            date(2025, 1, 31), "monthly", date(2025, 1, 1), date(2025, 4, 30)
+        )
+        assert dates == [
+            date(2025, 1, 31), date(2025, 2, 28), date(2025, 3, 31), date(2025, 4, 30)
+        ]
+
+    def test_weekly_and_yearly_series(self):
+        from datetime import date
+        from app.services import occurrence_dates
+
+        weekly = occurrence_dates(
+            date(2020, 1, 6), "weekly", date(2025, 3, 1), date(2025, 3, 20)
+        )
+        assert weekly == [date(2025, 3, 3), date(2025, 3, 10), date(2025, 3, 17)]
+
+        yearly = occurrence_dates(
+            date(2020, 2, 29), "yearly", date(2021, 1, 1), date(2024, 12, 31)
+        )
+        assert yearly == [
+            date(2021, 2, 28), date(2022, 2, 28), date(2023, 2, 28), date(2024, 2, 29)
+        ]
+        assert occurrence_dates(
+            date(2025, 6, 1), "one-time", date(2025, 7, 1), date(2025, 8, 1)
+        ) == []
+
+    def test_calendar_endpoint(self, client, auth_headers):
+        client.post("/api/bills", headers=auth_headers, json={
+            "name": "Rent", "amount": 1200.00, "due_date": "2025-01-31",
+            "frequency": "monthly"
+        })
+        client.post("/api/bills", headers=auth_headers, json={
+            "name": "Visit", "amount": 50.00, "due_date": "2025-02-10"
+        })
+
+        response = client.get(
+            "/api/bills/calendar?from=2025-02-01&to=2025-03-31", headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["count"] == 3
+        assert [(o["date"], o["name"]) for o in data["occurrences"]] == [
+            ("2025-02-10", "Visit"), ("2025-02-28", "Rent"), ("2025-03-31", "Rent")
+        ]
+
+        response = client.get(
+            "/api/bills/calendar?from=2025-03-01&to=2025-02-01", headers=auth_headers
+        )
+        assert response.status_code == 400
+
+    def test_ics_feed(self, client, auth_headers):
+        from datetime import date
+        due = date.today().isoformat()
+        client.post("/api/bills", headers=auth_headers, json={
+            "name": "Phone, mobile", "amount": 30.00, "due_date": due,
+            "frequency": "monthly"
+        })
+
+        url = client.get("/api/bills/calendar/feed", headers=auth_headers).get_json()["url"]
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.mimetype == "text/calendar"
+        body = response.get_data(as_text=True)
+        assert body.startswith("BEGIN:VCALENDAR\r\n")
+        assert "SUMMARY:Phone\\, mobile ($30.00)" in body
+        assert body.count("BEGIN:VEVENT") >= 12
+
+        cached = client.get(url, headers={"If-None-Match": response.headers["ETag"]})
+        assert cached.status_code == 304
+
+        assert client.get("/api/bills/calendar.ics?token=forged").status_code == 401
+
+    def test_ics_feed_token_expires_and_revokes(self, app, client, auth_headers):
+        url = client.get("/api/bills/calendar/feed", headers=auth_headers).get_json()["url"]
+        assert client.get(url).status_code == 200
+
+        app.config["CALENDAR_FEED_MAX_AGE"] = -1
+        assert client.get(url).status_code == 401
+        app.config["CALENDAR_FEED_MAX_AGE"] = 3600
+
+        with app.app_context():
+            user = User.query.filter_by(email="test@example.com").first()
+            user.set_password("NewPass456")
+            db.session.commit()
+        assert client.get(url).status_code == 401
+
+        url = client.get("/api/bills/calendar/feed", headers=auth_headers).get_json()["url"]
+        assert client.delete("/api/bills/calendar/feed", headers=auth_headers).status_code == 200
+        assert client.get(url).status_code == 401
+
+        url = client.get("/api/bills/calendar/feed", headers=auth_headers).get_json()["url"]
+        assert client.get(url).status_code == 200
+        with app.app_context():
+            User.query.filter_by(email="test@example.com").first().is_active = False
+            db.session.commit()
+        assert client.get(url).status_code == 401
+
+    def test_ics_feed_survives_rehash_on_login(self, app, client, auth_headers):
+        url = client.get("/api/bills/calendar/feed", headers=auth_headers).get_json()["url"]
+
+        app.extensions["password_hasher"].rounds = 5
+        client.post("/api/auth/login", json={
+            "email": "test@example.com", "password": "TestPass123"
+        })
+        user = User.query.filter_by(email="test@example.com").first()
+        assert user.password_hash.startswith("$2b$05$")
+
+        assert client.get(url).status_code == 200
+
+
+class TestReminders:
+    """Reminder scheduler tests."""
+
+    class Recorder:
+        channel = "log"
+
+        def __init__(self):
+            self.sent = []
+
+        def send(self, reminder):
+            self.sent.append((reminder.name, reminder.kind, reminder.due_date))
+
+    def _scheduler(self, app, now, **options):
+        from app.services import ReminderScheduler
+        clock = SimpleNamespace(now=now)
+        notifier = self.Recorder()
+        scheduler = ReminderScheduler(
+            app, notifier, lead_days=3, overdue_days=1, send_hour=9,
+            lookahead_days=7, batch_size=2, clock=lambda: clock.now, **options
+        )
+        return scheduler, notifier, clock
+
+    def test_log_notifier_writes_to_app_log(self, caplog):
+        import logging
+        from datetime import date
+        from app.services import LogNotifier
+        from app.services.reminders import Reminder
+
+        with caplog.at_level(logging.INFO, logger="app.services.reminders"):
+            LogNotifier().send(Reminder(1, "due", date(2026, 1, 5), "Rent", 1200, "a@example.com"))
+        assert caplog.messages == ["REMINDER: [due] a@example.com: Rent $1200.00 due 2026-01-05"]
+
+    def _bill(self, client, headers, name, due):
+        return client.post("/api/bills", headers=headers, json={
+            "name": name, "amount": 10.00, "due_date": due.isoformat()
+        }).get_json()["bill"]["id"]
+
+    def test_sends_each_reminder_once_when_due(self, app, client, auth_headers):
+        from datetime import date, timedelta
+        today = date.today()
+        self._bill(client, auth_headers, "Soon", today + timedelta(days=3))
+        self._bill(client, auth_headers, "Far", today + timedelta(days=60))
+        paid = self._bill(client, auth_headers, "Paid", today + timedelta(days=3))
+        client.post(f"/api/bills/{paid}/pay", headers=auth_headers)
+
+        now = datetime.combine(today, datetime.min.time()).replace(hour=8)
+        scheduler, notifier, clock = self._scheduler(app, now)
+        assert scheduler.tick() == 0
+        # Only bills inside the window are held in memory
+        assert scheduler.pending() == 3
+
+        clock.now = now.replace(hour=9)
+        assert scheduler.tick() == 1
+        assert notifier.sent == [("Soon", "upcoming", today + timedelta(days=3))]
+
+        # A second scheduler over the same table does not resend
+        other, other_notifier, _ = self._scheduler(app, clock.now)
+        assert other.tick() == 0
+        assert other_notifier.sent == []
+
+    def test_picks_up_bills_written_behind_cursor(self, app, client, auth_headers):
+        from datetime import date, timedelta
+        today = date.today()
+        self._bill(client, auth_headers, "Next week", today + timedelta(days=7))
+        now = datetime.combine(today, datetime.min.time()).replace(hour=10)
+        scheduler, notifier, clock = self._scheduler(app, now, refresh_interval=0)
+        assert scheduler.tick() == 0
+
+        # Due before the keyset cursor, so only the updated_at scan finds it
+        self._bill(client, auth_headers, "Late", today - timedelta(days=1))
+        assert scheduler.tick() == 1
+        assert notifier.sent == [("Late", "overdue", today - timedelta(days=1))]
+
+    def test_failed_dispatch_stays_queued(self, app, client, auth_headers):
+        from datetime import date, timedelta
+        today = date.today()
+        self._bill(client, auth_headers, "Soon", today + timedelta(days=3))
+        now = datetime.combine(today, datetime.min.time()).replace(hour=9)
+        scheduler, notifier, _ = self._scheduler(app, now)
+        dispatch = scheduler._dispatch
+
+        def broken(*args):
+            raise RuntimeError("database went away")
+
+        scheduler._dispatch = broken
+        with pytest.raises(RuntimeError):
+            scheduler.tick()
+
+        scheduler._dispatch = dispatch
+        assert scheduler.tick() == 1
+        assert [name for name, _, _ in notifier.sent] == ["Soon"]
+
+    def test_run_backs_off_after_errors(self, app):
+        scheduler, _, _ = self._scheduler(
+            app, datetime.now(), refresh_interval=10, max_error_backoff=30
+        )
+        waits = []
+
+        def broken():
+            raise RuntimeError("database went away")
+
+        def wait(seconds):
+            waits.append(seconds)
+            if len(waits) == 4:
+                scheduler.stop()
+
+        scheduler.tick = broken
+        scheduler._stopping.wait = wait
+        scheduler.run()
+        assert waits == [10, 20, 30, 30]
+
+
+class TestConditionalReads:
+    """ETag and If-None-Match tests for bill reads."""
+
+    def _bill_queries(self, action):
+        from sqlalchemy import event
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            response = action()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+        return response, [s for s in statements if "FROM bills" in s or "bill_summaries" in s]
+
+    def test_unchanged_reads_return_304_without_loading_bills(self, client, auth_headers):
+        bill_id = client.post("/api/bills", headers=auth_headers, json={
+            "name": "Water", "amount": 30.00, "due_date": "2999-01-01"
+        }).get_json()["bill"]["id"]
+
+        for url in ("/api/bills", f"/api/bills/{bill_id}", "/api/bills/summary"):
+            first = client.get(url, headers=auth_headers)
+            assert first.status_code == 200
+            etag = first.headers["ETag"]
+
+            response, queries = self._bill_queries(lambda: client.get(
+                url, headers={**auth_headers, "If-None-Match": etag}
+            ))
+            assert response.status_code == 304
+            assert queries == []
+
+    def test_writes_change_the_etag(self, client, auth_headers):
+        bill_id = client.post("/api/bills", headers=auth_headers, json={
+            "name": "Water", "amount": 30.00, "due_date": "2999-01-01"
+        }).get_json()["bill"]["id"]
+        etag = client.get("/api/bills", headers=auth_headers).headers["ETag"]
+        other = client.get("/api/bills?limit=5", headers=auth_headers).headers["ETag"]
+        assert other != etag
+
+        user = User.query.filter_by(email="test@example.com").first()
+        updated_at = user.updated_at
+        client.post(f"/api/bills/{bill_id}/pay", headers=auth_headers)
+
+        response = client.get("/api/bills", headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.get_json()["bills"][0]["is_paid"] is True
+
+        db.session.expire_all()
+        user = db.session.get(User, user.id)
+        assert user.data_version == 2
+        assert user.updated_at == updated_at
+
+
+class TestSparseFields:
+    """Sparse fieldset and JSON provider tests."""
+
+    def test_fields_narrow_payload_and_projection(self, client, auth_headers):
+        from sqlalchemy import event
+        bill_id = client.post("/api/bills", headers=auth_headers, json={
+            "name": "Gym", "amount": 25.00, "due_date": "2999-01-01", "notes": "Annual"
+        }).get_json()["bill"]["id"]
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            response = client.get("/api/bills?fields=name,amount,is_paid", headers=auth_headers)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        assert response.get_json()["bills"] == [{
+            "id": bill_id, "name": "Gym", "amount": 25.0,
+            "due_date": "2999-01-01", "is_paid": False,
+        }]
+        bill_queries = [s for s in statements if "FROM bills" in s]
+        assert len(bill_queries) == 1
+        assert "bills.notes" not in bill_queries[0]
+
+        bill = client.get(f"/api/bills/{bill_id}?fields=notes", headers=auth_headers).get_json()
+        assert bill["bill"] == {"id": bill_id, "due_date": "2999-01-01", "notes": "Annual"}
+
+        response = client.get("/api/bills?fields=name,password", headers=auth_headers)
+        assert response.status_code == 400
+
+    def test_orjson_provider_matches_default(self, app):
+        pytest.importorskip("orjson")
+        from decimal import Decimal
+        from flask.json.provider import DefaultJSONProvider
+        from app.serialization import OrjsonProvider
+
+        payload = {"b": [1, 2.5, None], "a": Decimal("9.99"), "when": datetime(2026, 1, 2)}
+        assert OrjsonProvider(app).dumps(payload) == DefaultJSONProvider(app).dumps(
+            payload, separators=(",", ":")
+        )
+
+
+class TestBulkOperations:
+    """Bulk pay, update and delete tests."""
+
+    def _create(self, client, headers, count):
+        return [
+            client.post("/api/bills", headers=headers, json={
+                "name": f"Bill {i}", "amount": 10.00, "due_date": "2000-01-01"
+            }).get_json()["bill"]["id"]
+            for i in range(count)
+        ]
+
+    def _statements(self, action):
+        from sqlalchemy import event
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            response = action()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+        return response, [s for s in statements if "bills" in s.split("WHERE")[0]]
+
+    def test_bulk_pay_is_one_update(self, client, auth_headers):
+        ids = self._create(client, auth_headers, 3)
+        client.get("/api/bills/summary", headers=auth_headers)
+
+        response, statements = self._statements(lambda: client.post(
+            "/api/bills/bulk", headers=auth_headers,
+            json={"ids": ids[:2] + [9999], "op": "pay"},
+        ))
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["count"] == 2
+        assert data["missing"] == [9999]
+        assert all(bill["is_paid"] for bill in data["bills"])
+        assert [s.split()[0] for s in statements if "bill_summaries" not in s] == ["UPDATE"]
+
+        summary = client.get("/api/bills/summary", headers=auth_headers).get_json()
+        assert summary["unpaid_count"] == 1
+
+    def test_bulk_update_and_delete(self, client, auth_headers):
+        ids = self._create(client, auth_headers, 3)
+
+        response = client.post("/api/bills/bulk", headers=auth_headers, json={
+            "ids": ids, "op": "update", "changes": {"category": "utilities", "amount": 12.5}
+        })
+        assert response.status_code == 200
+        assert {(b["category"], b["amount"]) for b in response.get_json()["bills"]} == {
+            ("utilities", 12.5)
+        }
+
+        response = client.post("/api/bills/bulk", headers=auth_headers, json={
+            "ids": ids[1:], "op": "delete"
+        })
+        assert response.get_json()["ids"] == sorted(ids[1:])
+        assert client.get("/api/bills", headers=auth_headers).get_json()["count"] == 1
+
+    def test_bulk_scoped_to_user_and_validated(self, client, auth_headers):
+        ids = self._create(client, auth_headers, 1)
+        token = client.post("/api/auth/register", json={
+            "email": "other@example.com", "password": "TestPass123"
+        }).get_json()["access_token"]
+        other = {"Authorization": f"Bearer {token}"}
+
+        response = client.post("/api/bills/bulk", headers=other, json={"ids": ids, "op": "delete"})
+        assert response.get_json()["missing"] == ids
+
+        response = client.post("/api/bills/bulk", headers=auth_headers, json={
+            "ids": ids, "op": "update"
+        })
+        assert response.status_code == 400
+
+
+class TestBenchmarks:
+    """Benchmark harness tests."""
+
+    def test_suite_runs_and_flags_regressions(self):
+        from benchmarks.run import compare_results, run_benchmarks
+
+        results = run_benchmarks(bills=20, iterations=3, warmup=1, latency=0)
+        assert {"auth.login", "bills.list", "bills.summary", "parse.claude"} <= set(
+            results["results"]
+        )
+        for stats in results["results"].values():
+            assert stats["count"] == 3
+            assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+
+        baseline = {"results": {"bills.list": {"p50_ms": 1.0}}}
+        slower = {"results": {"bills.list": {"p50_ms": 5.0}}}
+        assert compare_results(results, results) == []
+        assert compare_results(slower, baseline)[0]["scenario"] == "bills.list"
+        assert compare_results(slower, baseline, min_delta_ms=10) == []
+
+
+class TestMetrics:
+    """Instrumentation and /metrics tests."""
+
+    def test_request_and_sql_metrics(self, client, auth_headers):
+        from app.metrics import DB_QUERIES_PER_REQUEST, HTTP_REQUESTS
+        requests_before = HTTP_REQUESTS.value(
+            method="GET", endpoint="bills.get_bills", status=200
+        )
+        observed_before = DB_QUERIES_PER_REQUEST.count(endpoint="bills.get_bills")
+
+        client.get("/api/bills", headers=auth_headers)
+
+        assert HTTP_REQUESTS.value(
+            method="GET", endpoint="bills.get_bills", status=200
+        ) == requests_before + 1
+        assert DB_QUERIES_PER_REQUEST.count(endpoint="bills.get_bills") == observed_before + 1
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        body = response.get_data(as_text=True)
+        assert "# TYPE http_request_duration_seconds histogram" in body
+        assert 'http_requests_total{method="GET",endpoint="bills.get_bills",status="200"}' in body
+        assert 'db_queries_per_request_bucket{endpoint="bills.get_bills",le="+Inf"}' in body
+
+    def test_claude_metrics(self, client, auth_headers, fake_claude):
+        from app.metrics import CLAUDE_LATENCY, CLAUDE_REQUESTS, CLAUDE_TOKENS
+        fake_claude.usage = SimpleNamespace(input_tokens=300, output_tokens=40)
+        calls_before = CLAUDE_LATENCY.count()
+        success_before = CLAUDE_REQUESTS.value(outcome="success")
+        tokens_before = CLAUDE_TOKENS.value(direction="input")
+
+        client.post("/api/bills/parse", headers=auth_headers, json={
+            "text": "Netflix subscription renews soon"
+        })
+
+        assert CLAUDE_LATENCY.count() == calls_before + 1
+        assert CLAUDE_REQUESTS.value(outcome="success") == success_before + 1
+        assert CLAUDE_TOKENS.value(direction="input") == tokens_before + 300
+
+    def test_metrics_not_rate_limited(self, client):
+        for _ in range(105):
+            response = client.get("/metrics")
+        assert response.status_code == 200
+
+
+class TestStartup:
+    """Worker startup tests."""
+
+    def test_boot_skips_sdk_import_and_schema_creation(self, tmp_path):
+        import os
+        import subprocess
+        import sys
+        env = {
+            **os.environ,
+            "FLASK_ENV": "production",
+            "SECRET_KEY": "startup-test",
+            "DATABASE_URL": f"sqlite:///{tmp_path}/boot.db",
+        }
+        probe = (
+            "import sys; from app.main import app; from app.models import db; "
+            "from sqlalchemy import inspect\n"
+            "with app.app_context(): tables = inspect(db.engine).get_table_names()\n"
+            "print('anthropic' in sys.modules, tables)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", probe], env=env, check=True, capture_output=True, text=True
+        ).stdout
+        assert output.strip() == "False []"
+
+    def test_health_reports_startup_time(self, client):
+        startup = client.get("/health").get_json()["startup"]
+        assert startup["create_app_seconds"] > 0
+        assert startup["import_seconds"] > 0
+
+
+class TestReplicaRouting:
+    """Read replica routing tests, with two SQLite files as primary and replica."""
+
+    @pytest.fixture
+    def replica_app(self, tmp_path, monkeypatch):
+        from app.config import TestingConfig, config
+
+        class ReplicaConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path}/primary.db"
+            SQLALCHEMY_BINDS = {"replica": {"url": f"sqlite:///{tmp_path}/replica.db"}}
+            REPLICA_STICKY_SECONDS = 0.5
+
+        monkeypatch.setitem(config, "replica-testing", ReplicaConfig)
+        app = create_app("replica-testing")
+        with app.app_context():
+            db.create_all()
+            db.metadata.create_all(db.engines["replica"])
+            yield app
+            db.session.remove()
+            for engine in db.engines.values():
+                db.metadata.drop_all(engine)
+        # init_app registers a metadata per bind key; later apps have no replica
+        db.metadatas.pop("replica", None)
+
+    def _replicate_users(self):
+        users = db.session.execute(db.select(User.__table__)).mappings().all()
+        with db.engines["replica"].begin() as conn:
+            conn.execute(User.__table__.delete())
+            conn.execute(User.__table__.insert(), [dict(u) for u in users])
+
+    def test_reads_follow_writes_then_move_to_replica(self, replica_app):
+        client = replica_app.test_client()
+        token = client.post("/api/auth/register", json={
+            "email": "replica@example.com", "password": "TestPass123", "name": "Replica"
+        }).get_json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        # Straight after the write the user only exists on the primary
+        assert client.get("/api/bills", headers=headers).status_code == 200
+
+        self._replicate_users()
+        with db.engines["replica"].begin() as conn:
+            conn.execute(Bill.__table__.insert(), [{
+                "user_id": 1, "name": "Replica only", "amount": 5,
+                "due_date": datetime(2030, 1, 1).date(), "frequency": "one-time",
+                "is_paid": False,
+            }])
+        time.sleep(0.6)
+        client.delete_cookie("db_primary_until")
+
+        names = [b["name"] for b in client.get("/api/bills", headers=headers).get_json()["bills"]]
+        assert names == ["Replica only"]
+
+        client.post("/api/bills", headers=headers, json={
+            "name": "Fresh", "amount": 10, "due_date": "2030-02-01"
+        })
+        names = [b["name"] for b in client.get("/api/bills", headers=headers).get_json()["bills"]]
+        assert names == ["Fresh"]
+
+    def test_pool_checkout_wait_is_recorded(self, replica_app):
+        from app.metrics import POOL_CHECKOUT_WAIT
+        before = POOL_CHECKOUT_WAIT.count(engine="replica")
+        with db.engines["replica"].connect():
+            pass
+        assert POOL_CHECKOUT_WAIT.count(engine="replica") == before + 1
+        pools = replica_app.test_client().get("/health").get_json()["database_pools"]
+        assert set(pools) == {"primary", "replica"}
+
+    def test_sticky_map_capped_under_write_load(self, replica_app, monkeypatch):
+        from flask import Response
+        from app.models import routing
+        router = routing.ReplicaRouter(sticky_seconds=60, max_entries=3)
+        for identity in ["1", "2", "3", "4", "5"]:
+            monkeypatch.setattr(routing, "_identity", lambda: identity)
+            with replica_app.test_request_context("/api/bills", method="POST"):
+                router.record_write(Response())
+        assert list(router._sticky) == ["3", "4", "5"]
+
+    def test_bad_token_reads_without_stickiness(self, replica_app):
+        from app.models import routing
+        headers = {"Authorization": "Bearer not-a-token"}
+        with replica_app.test_request_context("/api/bills", headers=headers):
+            assert routing._identity() is None
+
+
+class TestAsyncParse:
+    """ASGI parse app tests."""
+
+    @staticmethod
+    async def call(asgi_app, path, headers=None, json_body=None, method="POST"):
+        body = json.dumps(json_body).encode() if json_body is not None else b""
+        scope = {
+            "type": "http", "method": method, "path": path, "query_string": b"",
+            "headers": [(b"content-type", b"application/json")] + [
+                (k.lower().encode(), v.encode()) for k, v in (headers or {}).items()
+            ],
+        }
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+
+        await asgi_app(scope, receive, send)
+        return sent[0]["status"], json.loads(sent[1]["body"])
+
+    @pytest.fixture
+    def fake_async(self):
+        fake = FakeAsyncClaude()
+        fake.delay = 0.2
+        return fake
+
+    @pytest.fixture
+    def asgi_app(self, app, fake_async):
+        from app.routes import ParseASGIApp
+        from app.services import AsyncBillParser
+        return ParseASGIApp(app, parser=AsyncBillParser(client=fake_async), db_threads=1)
+
+    def test_concurrent_parses_share_one_loop(self, asgi_app, fake_async, auth_headers):
+        async def run():
+            return await asyncio.gather(*(
+                self.call(asgi_app, "/api/bills/parse", auth_headers, {"text": f"Netflix plan {i}"})
+                for i in range(10)
+            ))
+
+        started = time.perf_counter()
+        responses = asyncio.run(run())
+        elapsed = time.perf_counter() - started
+
+        assert [status for status, _ in responses] == [201] * 10
+        assert fake_async.max_in_flight == 10
+        assert elapsed < 1.5
+        assert Bill.query.count() == 10
+
+    def test_oversized_body_rejected(self, app, asgi_app, fake_async, auth_headers):
+        app.config["PARSE_MAX_BODY_BYTES"] = 100
+        status, data = asyncio.run(self.call(
+            asgi_app, "/api/bills/parse", auth_headers, {"text": "Netflix plan " * 20}
+        ))
+        assert status == 413
+        assert data == {"error": "Request body too large"}
+        assert fake_async.calls == 0
+
+        status, _ = asyncio.run(self.call(
+            asgi_app, "/api/bills/parse", {**auth_headers, "Content-Length": "5000"},
+            {"text": "Netflix plan"},
+        ))
+        assert status == 413
+
+    def test_batch_parse(self, asgi_app, fake_async, auth_headers):
+        status, data = asyncio.run(self.call(
+            asgi_app, "/api/bills/parse/batch", auth_headers,
+            {"texts": ["Netflix one", "Netflix two", "x"]},
+        ))
+        assert status == 201
+        assert data["created"] == 2
+        assert data["results"][2]["success"] is False
+        assert fake_async.calls == 2
+
+    def test_auth_and_routing_errors(self, asgi_app, fake_async):
+        status, _ = asyncio.run(self.call(asgi_app, "/api/bills/parse", json_body={"text": "Netflix"}))
+        assert status == 401
+        status, _ = asyncio.run(self.call(asgi_app, "/api/bills", method="GET"))
+        assert status == 404
+        assert fake_async.calls == 0